@@ -61,6 +61,17 @@ class Settings(BaseSettings):
     shipwright_default_strategy: str = "buildah-insecure-push"  # Default for dev
     shipwright_default_timeout: str = "15m"
 
+    # Kubernetes client settings
+    # HTTP connections kept per API server. Routers fan independent API calls out to
+    # worker threads, so the pool must cover that concurrency or requests queue for a
+    # connection. (The Python client has no client-side QPS/burst limiter to tune.)
+    kubernetes_connection_pool_maxsize: int = 32
+
+    # MCP client settings
+    # Pooled sessions to tool servers idle for longer than this (seconds) are closed,
+    # so idle connections do not pile up on tool servers and gateways.
+    mcp_session_idle_timeout: int = 120
+
     # Build reconciliation settings
     build_reconciliation_interval: int = 30  # seconds between reconciliation scans
     enable_build_reconciliation: bool = True  # enable/disable the reconciliation loop
@@ -74,6 +74,10 @@ SUPPORTED_WORKLOAD_TYPES = [
 ENABLED_NAMESPACE_LABEL_KEY = settings.enabled_namespace_label_key
 ENABLED_NAMESPACE_LABEL_VALUE = settings.enabled_namespace_label_value
 
+# List requests
+# Resource version that lets the API server answer LIST calls from its watch cache
+KUBE_LIST_CACHED_RESOURCE_VERSION = "0"
+
 # Default ports
 DEFAULT_IN_CLUSTER_PORT = 8000
 DEFAULT_OFF_CLUSTER_PORT = 8080
@@ -129,8 +133,8 @@ TOOLHIVE_SERVICE_SUFFIX = "-proxy"
 MIGRATION_SOURCE_AGENT_CRD = "agent-crd"
 MIGRATION_SOURCE_MCPSERVER_CRD = "mcpserver-crd"
 
-# Default environment variables for agents
-DEFAULT_ENV_VARS = [
+# Default environment variables for agents and tools (immutable; copy before extending)
+DEFAULT_ENV_VARS = (
     {"name": "PORT", "value": "8000"},
     {"name": "HOST", "value": "0.0.0.0"},
     {
@@ -142,4 +146,4 @@ DEFAULT_ENV_VARS = [
         "value": "http://keycloak.keycloak.svc.cluster.local:8080",
     },
     {"name": "UV_CACHE_DIR", "value": "/app/.cache/uv"},
-]
+)
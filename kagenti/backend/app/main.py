@@ -32,6 +32,7 @@ class NoCacheMiddleware(BaseHTTPMiddleware):
 
 from app.core.config import settings
 from app.routers import agents, tools, namespaces, config, auth, chat
+from app.services.mcp_sessions import get_mcp_session_pool
 
 # Configure logging
 logging.basicConfig(
@@ -62,6 +63,10 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Build reconciliation disabled (ENABLE_BUILD_RECONCILIATION=false)")
 
+    # Close pooled MCP sessions to tool servers once they go idle
+    mcp_session_pool = get_mcp_session_pool()
+    mcp_sweeper_task = asyncio.create_task(mcp_session_pool.run_sweeper())
+
     yield
 
     # Stop reconciliation
@@ -72,6 +77,14 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    # Stop the MCP session sweeper and close pooled sessions
+    mcp_sweeper_task.cancel()
+    try:
+        await mcp_sweeper_task
+    except asyncio.CancelledError:
+        pass
+    await mcp_session_pool.close_all()
+
     logger.info("Shutting down Kagenti Backend API")
 
 
@@ -5,13 +5,18 @@
 Agent API endpoints.
 """
 
+import asyncio
 import json
 import logging
+import os
 import re
 import socket
+import ssl
 import ipaddress
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
@@ -70,6 +75,7 @@ from app.models.responses import (
     DeleteResponse,
 )
 from app.services.kubernetes import KubernetesService, get_kubernetes_service
+from app.utils.resources import create_resources_concurrently
 from app.utils.routes import create_route_for_agent_or_tool, route_exists
 from app.models.shipwright import (
     ResourceType,
@@ -474,6 +480,13 @@ def _extract_labels(labels: dict) -> ResourceLabels:
     )
 
 
+def _filter_labels_by_prefix(
+    labels: Dict[str, str], prefixes: Tuple[str, ...] = ("kagenti.io/",)
+) -> Dict[str, str]:
+    """Return the subset of labels whose keys start with any of the given prefixes."""
+    return {k: v for k, v in labels.items() if k.startswith(prefixes)}
+
+
 @router.get(
     "", response_model=AgentListResponse, dependencies=[Depends(require_roles(ROLE_VIEWER))]
 )
@@ -1628,11 +1641,9 @@ async def trigger_shipwright_buildrun(
 
         # Get labels from the Build to propagate to BuildRun
         build_labels = build.get("metadata", {}).get("labels", {})
-        buildrun_labels = {
-            k: v
-            for k, v in build_labels.items()
-            if k.startswith("kagenti.io/") or k.startswith("app.kubernetes.io/")
-        }
+        buildrun_labels = _filter_labels_by_prefix(
+            build_labels, ("kagenti.io/", "app.kubernetes.io/")
+        )
 
         # Create BuildRun manifest
         buildrun_manifest = _build_agent_shipwright_buildrun_manifest(
@@ -1936,6 +1947,7 @@ def _build_deployment_manifest(
     request: "CreateAgentRequest",
     image: str,
     shipwright_build_name: Optional[str] = None,
+    extra_labels: Optional[Dict[str, str]] = None,
 ) -> dict:
     """
     Build a Kubernetes Deployment manifest for an agent.
@@ -1945,12 +1957,16 @@ def _build_deployment_manifest(
         image: The container image URL.
         shipwright_build_name: Optional name of the Shipwright Build that created
             this agent (for annotation tracking).
+        extra_labels: Optional additional labels (e.g. kagenti.io/ labels propagated
+            from the Shipwright Build) applied to the workload and its pods.
 
     Returns:
         Deployment manifest dictionary.
     """
     env_vars = _build_env_vars(request)
     labels = _build_common_labels(request, WORKLOAD_TYPE_DEPLOYMENT)
+    if extra_labels:
+        labels.update(extra_labels)
     selector_labels = _build_selector_labels(request)
 
     # Build annotations
@@ -2030,17 +2046,23 @@ def _build_deployment_manifest(
     return manifest
 
 
-def _build_service_manifest(request: "CreateAgentRequest") -> dict:
+def _build_service_manifest(
+    request: "CreateAgentRequest",
+    extra_labels: Optional[Dict[str, str]] = None,
+) -> dict:
     """
     Build a Kubernetes Service manifest for an agent.
 
     Args:
         request: The agent creation request.
+        extra_labels: Optional additional labels applied to the Service.
 
     Returns:
         Service manifest dictionary.
     """
     labels = _build_common_labels(request, WORKLOAD_TYPE_DEPLOYMENT)
+    if extra_labels:
+        labels.update(extra_labels)
     selector_labels = _build_selector_labels(request)
 
     # Build service ports
@@ -2084,6 +2106,7 @@ def _build_statefulset_manifest(
     request: "CreateAgentRequest",
     image: str,
     shipwright_build_name: Optional[str] = None,
+    extra_labels: Optional[Dict[str, str]] = None,
 ) -> dict:
     """
     Build a Kubernetes StatefulSet manifest for an agent.
@@ -2098,12 +2121,15 @@ def _build_statefulset_manifest(
         request: The agent creation request.
         image: The container image URL.
         shipwright_build_name: Optional name of the Shipwright Build.
+        extra_labels: Optional additional labels applied to the workload and its pods.
 
     Returns:
         StatefulSet manifest dictionary.
     """
     env_vars = _build_env_vars(request)
     labels = _build_common_labels(request, WORKLOAD_TYPE_STATEFULSET)
+    if extra_labels:
+        labels.update(extra_labels)
     selector_labels = _build_selector_labels(request)
 
     # Build annotations
@@ -2187,6 +2213,7 @@ def _build_job_manifest(
     request: "CreateAgentRequest",
     image: str,
     shipwright_build_name: Optional[str] = None,
+    extra_labels: Optional[Dict[str, str]] = None,
 ) -> dict:
     """
     Build a Kubernetes Job manifest for an agent.
@@ -2200,12 +2227,15 @@ def _build_job_manifest(
         request: The agent creation request.
         image: The container image URL.
         shipwright_build_name: Optional name of the Shipwright Build.
+        extra_labels: Optional additional labels applied to the workload and its pods.
 
     Returns:
         Job manifest dictionary.
     """
     env_vars = _build_env_vars(request)
     labels = _build_common_labels(request, WORKLOAD_TYPE_JOB)
+    if extra_labels:
+        labels.update(extra_labels)
 
     # Build annotations
     annotations: Dict[str, str] = {
@@ -2680,9 +2710,15 @@ async def finalize_shipwright_build(
         # Propagate SPIRE identity setting from stored config
         final_spire_enabled = stored_config.get("spireEnabled", False)
 
-        # Step 3: Create workload + Service with the built image
-        # Build a CreateAgentRequest-like object for manifest builders
-        agent_request = CreateAgentRequest(
+        # The stored workload type is the only value not validated upstream (env vars and
+        # service ports are EnvVar/ServicePort models already), so check it explicitly and
+        # build the CreateAgentRequest for the manifest builders without re-validating.
+        if final_workload_type not in SUPPORTED_WORKLOAD_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported workload type in stored config: {final_workload_type}",
+            )
+        agent_request = CreateAgentRequest.model_construct(
             name=name,
             namespace=namespace,
             protocol=final_protocol,
@@ -2698,80 +2734,72 @@ async def finalize_shipwright_build(
             spireEnabled=final_spire_enabled,
         )
 
-        # Create workload based on workloadType
-        if final_workload_type == WORKLOAD_TYPE_DEPLOYMENT:
-            workload_manifest = _build_deployment_manifest(
-                request=agent_request,
-                image=container_image,
-                shipwright_build_name=name,
-            )
-            # Add additional labels from Build
-            workload_manifest["metadata"]["labels"].update(
-                {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
-            )
-            # Also update pod template labels
-            workload_manifest["spec"]["template"]["metadata"]["labels"].update(
-                {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
-            )
-            kube.create_deployment(namespace=namespace, body=workload_manifest)
-            logger.info(
-                f"Created Deployment '{name}' with image '{container_image}' in namespace '{namespace}'"
-            )
-        elif final_workload_type == WORKLOAD_TYPE_STATEFULSET:
-            workload_manifest = _build_statefulset_manifest(
-                request=agent_request,
-                image=container_image,
-                shipwright_build_name=name,
-            )
-            # Add additional labels from Build
-            workload_manifest["metadata"]["labels"].update(
-                {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
-            )
-            # Also update pod template labels
-            workload_manifest["spec"]["template"]["metadata"]["labels"].update(
-                {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
-            )
-            kube.create_statefulset(namespace=namespace, body=workload_manifest)
-            logger.info(
-                f"Created StatefulSet '{name}' with image '{container_image}' in namespace '{namespace}'"
-            )
-        elif final_workload_type == WORKLOAD_TYPE_JOB:
-            workload_manifest = _build_job_manifest(
+        # Additional kagenti.io/ labels from the Build, applied to every created resource
+        kagenti_labels = _filter_labels_by_prefix(build_labels)
+
+        # Step 3: Create workload + Service with the built image. Neither depends on the
+        # other already existing, so they are created concurrently and rolled back
+        # together if either creation fails for a reason other than 409.
+        workload_builders = {
+            WORKLOAD_TYPE_DEPLOYMENT: (
+                "Deployment",
+                _build_deployment_manifest,
+                kube.create_deployment,
+                kube.delete_deployment,
+            ),
+            WORKLOAD_TYPE_STATEFULSET: (
+                "StatefulSet",
+                _build_statefulset_manifest,
+                kube.create_statefulset,
+                kube.delete_statefulset,
+            ),
+            WORKLOAD_TYPE_JOB: ("Job", _build_job_manifest, kube.create_job, kube.delete_job),
+        }
+        creations: List[Tuple[str, Callable[[], Any], Optional[Callable[[], Any]]]] = []
+
+        if final_workload_type in workload_builders:
+            kind, build_manifest, create_workload, delete_workload = workload_builders[
+                final_workload_type
+            ]
+            workload_manifest = build_manifest(
                 request=agent_request,
                 image=container_image,
                 shipwright_build_name=name,
+                extra_labels=kagenti_labels,
             )
-            # Add additional labels from Build
-            workload_manifest["metadata"]["labels"].update(
-                {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
-            )
-            # Also update pod template labels
-            workload_manifest["spec"]["template"]["metadata"]["labels"].update(
-                {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
-            )
-            kube.create_job(namespace=namespace, body=workload_manifest)
-            logger.info(
-                f"Created Job '{name}' with image '{container_image}' in namespace '{namespace}'"
+            creations.append(
+                (
+                    f"{kind} '{name}' with image '{container_image}'",
+                    partial(create_workload, namespace=namespace, body=workload_manifest),
+                    partial(delete_workload, namespace=namespace, name=name),
+                )
             )
 
-        # Create Service (not needed for Jobs)
+        # Service is not needed for Jobs
         if final_workload_type != WORKLOAD_TYPE_JOB:
-            service_manifest = _build_service_manifest(agent_request)
-            # Add additional labels from Build
-            service_manifest["metadata"]["labels"].update(
-                {k: v for k, v in build_labels.items() if k.startswith("kagenti.io/")}
+            service_manifest = _build_service_manifest(agent_request, extra_labels=kagenti_labels)
+            creations.append(
+                (
+                    f"Service '{name}'",
+                    partial(kube.create_service, namespace=namespace, body=service_manifest),
+                    partial(kube.delete_service, namespace=namespace, name=name),
+                )
             )
-            kube.create_service(namespace=namespace, body=service_manifest)
-            logger.info(f"Created Service '{name}' in namespace '{namespace}'")
+
+        await create_resources_concurrently(creations)
+        for description, _, _ in creations:
+            logger.info(f"Created {description} in namespace '{namespace}'")
 
         message = f"Agent '{name}' deployed as {final_workload_type} with image '{output_image}'."
 
-        # Step 4: Create HTTPRoute/Route if requested (not applicable for Jobs)
+        # Step 4: Create HTTPRoute/Route if requested (not applicable for Jobs), once the
+        # workload and Service exist
         if final_create_route and final_workload_type != WORKLOAD_TYPE_JOB:
             service_port = (
                 final_service_ports[0].port if final_service_ports else DEFAULT_OFF_CLUSTER_PORT
             )
-            create_route_for_agent_or_tool(
+            await asyncio.to_thread(
+                create_route_for_agent_or_tool,
                 kube=kube,
                 name=name,
                 namespace=namespace,
@@ -2932,10 +2960,6 @@ async def fetch_env_from_url(request: FetchEnvUrlRequest) -> FetchEnvUrlResponse
     - https://raw.githubusercontent.com/kagenti/agent-examples/main/a2a/git_issue_agent/.env.openai
     - https://example.com/config/.env
     """
-    import os
-    import ssl
-    from pathlib import Path
-
     logger.info(f"Fetching .env file from URL: {request.url}")
 
     # Log SSL/Certificate configuration
@@ -2966,7 +2990,11 @@ async def fetch_env_from_url(request: FetchEnvUrlRequest) -> FetchEnvUrlResponse
 
     # Prevent SSRF attacks - block private IPs
     try:
-        ip = socket.gethostbyname(parsed_url.hostname)
+        # Resolve via the event loop's executor so DNS lookups don't block other requests
+        addr_info = await asyncio.get_running_loop().getaddrinfo(
+            parsed_url.hostname, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+        )
+        ip = addr_info[0][4][0]
         logger.debug(f"Resolved {parsed_url.hostname} to {ip}")
         if is_ip_blocked(ip):
             logger.warning(f"Blocked private IP address: {ip}")
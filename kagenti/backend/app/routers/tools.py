@@ -5,16 +5,18 @@
 Tool API endpoints.
 """
 
+import asyncio
 import logging
 import re
+import sys
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-from contextlib import AsyncExitStack
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from kubernetes.client import ApiException
-from mcp import ClientSession
-from mcp.client.streamable_http import streamablehttp_client
 from pydantic import BaseModel, field_validator
 
 from app.core.auth import ROLE_OPERATOR, ROLE_VIEWER, require_roles
@@ -44,6 +46,7 @@ from app.core.constants import (
     DEFAULT_RESOURCE_LIMITS,
     DEFAULT_RESOURCE_REQUESTS,
     DEFAULT_ENV_VARS,
+    KUBE_LIST_CACHED_RESOURCE_VERSION,
     # Shipwright constants
     SHIPWRIGHT_CRD_GROUP,
     SHIPWRIGHT_CRD_VERSION,
@@ -75,6 +78,7 @@ from app.models.shipwright import (
     ResourceConfigFromBuild,
 )
 from app.services.kubernetes import KubernetesService, get_kubernetes_service
+from app.services.mcp_sessions import MCPSessionPool, get_mcp_session_pool
 from app.services.shipwright import (
     build_shipwright_build_manifest,
     build_shipwright_buildrun_manifest,
@@ -85,6 +89,7 @@ from app.services.shipwright import (
     get_output_image_from_buildrun,
     resolve_clone_secret,
 )
+from app.utils.resources import create_resources_concurrently
 from app.utils.routes import create_route_for_agent_or_tool, route_exists
 
 
@@ -303,6 +308,30 @@ class MCPInvokeResponse(BaseModel):
     result: Any
 
 
+class MCPBatchInvokeRequest(BaseModel):
+    """Request to invoke several MCP tools on one server concurrently."""
+
+    invocations: List[MCPInvokeRequest]
+    max_concurrent: int = 8
+    stop_on_error: bool = False
+
+
+class MCPBatchInvokeResult(BaseModel):
+    """Outcome of one invocation in a batch."""
+
+    index: int
+    tool_name: str
+    success: bool
+    result: Any = None
+    error: Optional[str] = None
+
+
+class MCPBatchInvokeResponse(BaseModel):
+    """Response from a batch MCP tool invocation, in request order."""
+
+    results: List[MCPBatchInvokeResult]
+
+
 # =============================================================================
 # Migration Models (Phase 5: MCPServer CRD to Deployment migration)
 # =============================================================================
@@ -373,6 +402,63 @@ class BatchMigrateToolsResponse(BaseModel):
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/tools", tags=["tools"])
 
+# Precomputed label keys and selectors used for every listed or created tool
+_PROTOCOL_LABEL_PREFIX_LEN = len(PROTOCOL_LABEL_PREFIX)
+_MCP_PROTOCOL_LABEL = f"{PROTOCOL_LABEL_PREFIX}{VALUE_PROTOCOL_MCP}"
+_TOOL_LABEL_SELECTOR = f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_TOOL}"
+_TOOL_CONFIG_ANNOTATION = "kagenti.io/tool-config"
+# Shared read-only fallback for missing nested fields of Kubernetes resources
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Tool lists advertised by MCP servers, keyed by (namespace, name), with the time they expire
+_TOOLS_CACHE_TTL_SECONDS = 60
+_tools_cache: Dict[Tuple[str, str], Tuple[float, MCPToolsResponse]] = {}
+# In-flight tool list calls, so concurrent connects to one tool share a single call
+_tools_inflight: Dict[Tuple[str, str], "asyncio.Task[MCPToolsResponse]"] = {}
+# MCP error codes meaning the session is gone rather than that a request failed:
+# "Session terminated" for a session the server no longer knows (e.g. after a
+# restart) and mcp.types.CONNECTION_CLOSED
+_SESSION_ERROR_CODES = frozenset({32600, -32000})
+
+# Pod and container settings shared by every tool manifest (including migrated ones).
+# Like DEFAULT_RESOURCE_LIMITS, these are referenced rather than rebuilt per manifest
+# and must not be mutated.
+_TOOL_POD_SECURITY_CONTEXT = {
+    "runAsNonRoot": True,
+    "seccompProfile": {"type": "RuntimeDefault"},
+}
+_TOOL_CONTAINER_SECURITY_CONTEXT = {
+    "allowPrivilegeEscalation": False,
+    "capabilities": {"drop": ["ALL"]},
+    "runAsUser": 1000,
+}
+_TOOL_CONTAINER_RESOURCES = {
+    "limits": DEFAULT_RESOURCE_LIMITS,
+    "requests": DEFAULT_RESOURCE_REQUESTS,
+}
+_TOOL_VOLUMES = (
+    {"name": "cache", "emptyDir": {}},
+    {"name": "tmp", "emptyDir": {}},
+)
+_TOOL_VOLUME_MOUNTS = (
+    {"name": "cache", "mountPath": "/app/.cache"},
+    {"name": "tmp", "mountPath": "/tmp"},
+)
+
+# Tools migrated at once by batch_migrate_tools; each migration makes its API calls in turn
+_MIGRATION_CONCURRENCY = 10
+
+# Labels every Deployment migrated from an MCPServer CRD gets, overriding the CRD's own
+_MIGRATED_DEPLOYMENT_LABELS: Mapping[str, str] = MappingProxyType(
+    {
+        KAGENTI_TYPE_LABEL: RESOURCE_TYPE_TOOL,
+        _MCP_PROTOCOL_LABEL: "",
+        KAGENTI_TRANSPORT_LABEL: VALUE_TRANSPORT_STREAMABLE_HTTP,
+        KAGENTI_WORKLOAD_TYPE_LABEL: WORKLOAD_TYPE_DEPLOYMENT,
+        APP_KUBERNETES_IO_MANAGED_BY: KAGENTI_UI_CREATOR_LABEL,
+    }
+)
+
 
 def _build_tool_env_vars(
     env_var_list: Optional[List[EnvVar]] = None,
@@ -389,31 +475,30 @@ def _build_tool_env_vars(
     Returns:
         List of environment variable dictionaries.
     """
-    env_vars = list(DEFAULT_ENV_VARS)
+    env_vars = [*DEFAULT_ENV_VARS]
     if env_var_list:
         for ev in env_var_list:
             if ev.value is not None:
                 # Direct value
                 env_vars.append({"name": ev.name, "value": ev.value})
-            elif ev.valueFrom is not None:
+            elif (vf := ev.valueFrom) is not None:
                 # Reference to Secret or ConfigMap
-                env_entry: Dict[str, Any] = {"name": ev.name, "valueFrom": {}}
-
-                if ev.valueFrom.secretKeyRef:
-                    env_entry["valueFrom"]["secretKeyRef"] = {
-                        "name": ev.valueFrom.secretKeyRef.name,
-                        "key": ev.valueFrom.secretKeyRef.key,
+                vf_dict: Dict[str, Any] = {}
+                if vf.secretKeyRef:
+                    vf_dict["secretKeyRef"] = {
+                        "name": vf.secretKeyRef.name,
+                        "key": vf.secretKeyRef.key,
                     }
-                elif ev.valueFrom.configMapKeyRef:
-                    env_entry["valueFrom"]["configMapKeyRef"] = {
-                        "name": ev.valueFrom.configMapKeyRef.name,
-                        "key": ev.valueFrom.configMapKeyRef.key,
+                elif vf.configMapKeyRef:
+                    vf_dict["configMapKeyRef"] = {
+                        "name": vf.configMapKeyRef.name,
+                        "key": vf.configMapKeyRef.key,
                     }
-
-                env_vars.append(env_entry)
+                env_vars.append({"name": ev.name, "valueFrom": vf_dict})
     return env_vars
 
 
+@lru_cache(maxsize=4096)
 def _get_toolhive_service_name(tool_name: str) -> str:
     """Get the old Toolhive-style service name.
 
@@ -447,6 +532,9 @@ def _format_timestamp(timestamp) -> Optional[str]:
     """
     if timestamp is None:
         return None
+    # datetime is by far the most common case, so check it first
+    if isinstance(timestamp, datetime):
+        return timestamp.isoformat()
     if isinstance(timestamp, str):
         return timestamp
     if hasattr(timestamp, "isoformat"):
@@ -454,6 +542,11 @@ def _format_timestamp(timestamp) -> Optional[str]:
     return str(timestamp)
 
 
+def _replica_count(status: dict, snake_key: str, camel_key: str) -> int:
+    """Read a replica count keyed in snake_case (client objects) or camelCase (raw JSON)."""
+    return status.get(snake_key) or status.get(camel_key) or 0
+
+
 def _get_workload_status(workload: dict) -> str:
     """Get status for a Deployment or StatefulSet workload.
 
@@ -468,25 +561,25 @@ def _get_workload_status(workload: dict) -> str:
 
     # Get replica counts
     desired_replicas = spec.get("replicas", 1)
-    ready_replicas = status.get("ready_replicas") or status.get("readyReplicas", 0)
-    available_replicas = status.get("available_replicas") or status.get("availableReplicas", 0)
-
-    # Check conditions for more detail
-    conditions = status.get("conditions", [])
-    for condition in conditions:
-        cond_type = condition.get("type", "")
-        cond_status = condition.get("status", "")
-        cond_reason = condition.get("reason", "")
-
-        # Check for failure conditions
-        if cond_type == "Available" and cond_status == "False":
-            if "ProgressDeadlineExceeded" in cond_reason:
-                return "Failed"
-
-        # Check for progressing
-        if cond_type == "Progressing" and cond_status == "True":
-            if ready_replicas < desired_replicas:
-                return "Progressing"
+    ready_replicas = _replica_count(status, "ready_replicas", "readyReplicas")
+    available_replicas = _replica_count(status, "available_replicas", "availableReplicas")
+
+    # Index conditions by type for keyed lookups
+    conditions = {c.get("type", ""): c for c in status.get("conditions") or []}
+
+    # Check for failure conditions
+    available = conditions.get("Available")
+    if (
+        available
+        and available.get("status") == "False"
+        and "ProgressDeadlineExceeded" in (available.get("reason") or "")
+    ):
+        return "Failed"
+
+    # Check for progressing
+    progressing = conditions.get("Progressing")
+    if progressing and progressing.get("status") == "True" and ready_replicas < desired_replicas:
+        return "Progressing"
 
     # Check if all replicas are ready
     if ready_replicas >= desired_replicas and available_replicas >= desired_replicas:
@@ -520,12 +613,23 @@ def _get_workload_type_from_resource(resource: dict) -> str:
 
 
 def _extract_labels(labels: dict) -> ResourceLabels:
-    """Extract kagenti labels from Kubernetes labels."""
+    """Extract kagenti labels from Kubernetes labels.
+
+    Results are memoized on the label set, since tools created the same way
+    carry identical labels. The returned instance is shared and must not be mutated.
+    """
+    return _extract_labels_cached(frozenset(labels.items()))
+
+
+@lru_cache(maxsize=1024)
+def _extract_labels_cached(label_items: FrozenSet[Tuple[str, str]]) -> ResourceLabels:
+    """Build ResourceLabels for a hashable label set (see _extract_labels)."""
+    labels = dict(label_items)
     # Extract protocols from protocol.kagenti.io/<name> prefix labels.
     protocols = [
-        k[len(PROTOCOL_LABEL_PREFIX) :]
+        k[_PROTOCOL_LABEL_PREFIX_LEN:]
         for k in labels
-        if k.startswith(PROTOCOL_LABEL_PREFIX) and len(k) > len(PROTOCOL_LABEL_PREFIX)
+        if k.startswith(PROTOCOL_LABEL_PREFIX) and len(k) > _PROTOCOL_LABEL_PREFIX_LEN
     ]
     # Fall back to deprecated kagenti.io/protocol single-value label.
     if not protocols:
@@ -540,6 +644,36 @@ def _extract_labels(labels: dict) -> ResourceLabels:
     )
 
 
+def _key_ref_to_dict(ref: Optional[BaseModel]) -> Optional[Dict[str, str]]:
+    """Convert a SecretKeyRef/ConfigMapKeyRef to its stored dict form."""
+    return {"name": ref.name, "key": ref.key} if ref is not None else None
+
+
+def _env_var_to_dict(ev: EnvVar) -> Dict[str, Any]:
+    """Convert an EnvVar to the dict stored in the Build's tool config annotation.
+
+    Produces the same shape as ``ev.model_dump()`` without walking the Pydantic schema.
+    """
+    vf = ev.valueFrom
+    return {
+        "name": ev.name,
+        "value": ev.value,
+        "valueFrom": (
+            {
+                "secretKeyRef": _key_ref_to_dict(vf.secretKeyRef),
+                "configMapKeyRef": _key_ref_to_dict(vf.configMapKeyRef),
+            }
+            if vf is not None
+            else None
+        ),
+    }
+
+
+def _service_port_to_dict(sp: ServicePort) -> Dict[str, Any]:
+    """Convert a ServicePort to a plain dict, same shape as ``sp.model_dump()``."""
+    return {"name": sp.name, "port": sp.port, "targetPort": sp.targetPort, "protocol": sp.protocol}
+
+
 def _build_tool_shipwright_build_manifest(
     request: CreateToolRequest, clone_secret_name: Optional[str] = None
 ) -> dict:
@@ -580,13 +714,14 @@ def _build_tool_shipwright_build_manifest(
     }
     # Add persistent storage config if present (for StatefulSet)
     if request.persistentStorage:
-        resource_config["persistentStorage"] = request.persistentStorage.model_dump()
+        storage = request.persistentStorage
+        resource_config["persistentStorage"] = {"enabled": storage.enabled, "size": storage.size}
     # Add env vars if present
     if request.envVars:
-        resource_config["envVars"] = [ev.model_dump() for ev in request.envVars]
+        resource_config["envVars"] = [_env_var_to_dict(ev) for ev in request.envVars]
     # Add service ports if present
     if request.servicePorts:
-        resource_config["servicePorts"] = [sp.model_dump() for sp in request.servicePorts]
+        resource_config["servicePorts"] = [_service_port_to_dict(sp) for sp in request.servicePorts]
 
     return build_shipwright_build_manifest(
         name=request.name,
@@ -617,6 +752,85 @@ def _build_tool_shipwright_buildrun_manifest(
     )
 
 
+def _get_tool_config(build: dict) -> Optional[ResourceConfigFromBuild]:
+    """Get the tool config stored on a Build, parsing each Build version only once.
+
+    Args:
+        build: Shipwright Build resource dict
+
+    Returns:
+        The parsed tool config, or None if absent or invalid. The result may be
+        shared with other callers and must not be mutated.
+    """
+    metadata = build.get("metadata") or {}
+    raw = (metadata.get("annotations") or {}).get(_TOOL_CONFIG_ANNOTATION)
+    if not raw:
+        return None
+    return _parse_tool_config(metadata.get("uid", ""), metadata.get("resourceVersion", ""), raw)
+
+
+@lru_cache(maxsize=256)
+def _parse_tool_config(
+    uid: str, resource_version: str, raw: str
+) -> Optional[ResourceConfigFromBuild]:
+    """Parse a Build's tool config annotation, memoized per Build uid and resourceVersion.
+
+    The raw annotation is part of the key too, so a cached entry always matches the
+    text it was parsed from even for Builds without a uid/resourceVersion.
+    """
+    build = {"metadata": {"annotations": {_TOOL_CONFIG_ANNOTATION: raw}}}
+    return extract_resource_config_from_build(build, ResourceType.TOOL)
+
+
+def _build_tool_summary(
+    resource: dict, namespace: str, status: str, workload_type: str
+) -> ToolSummary:
+    """Build a ToolSummary from a listed Deployment, StatefulSet or MCPServer.
+
+    Metadata fields are read once into locals. The summary is built with
+    model_construct since the data comes from our own Kubernetes listings.
+
+    Args:
+        resource: Kubernetes resource dict
+        namespace: Namespace used when the resource metadata has none
+        status: Precomputed readiness status
+        workload_type: Workload type reported for the tool
+
+    Returns:
+        ToolSummary for the resource
+    """
+    metadata = resource.get("metadata") or {}
+    annotations = metadata.get("annotations") or {}
+    created_at = metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
+    return ToolSummary.model_construct(
+        name=metadata.get("name", ""),
+        namespace=metadata.get("namespace") or namespace,
+        description=annotations.get(KAGENTI_DESCRIPTION_ANNOTATION, ""),
+        status=status,
+        labels=_extract_labels(metadata.get("labels") or {}),
+        createdAt=_format_timestamp(created_at),
+        workloadType=workload_type,
+    )
+
+
+async def _list_tool_resources(description: str, list_fn: Callable[[], List[dict]]) -> List[dict]:
+    """Run a blocking list call in a worker thread, tolerating API errors.
+
+    Args:
+        description: Human-readable resource description used in log messages
+        list_fn: Zero-argument callable performing the list request
+
+    Returns:
+        The listed resources, or an empty list if the request failed
+    """
+    try:
+        return await asyncio.to_thread(list_fn)
+    except ApiException as e:
+        if e.status != 404:
+            logger.warning(f"Error listing {description}: {e}")
+        return []
+
+
 @router.get("", response_model=ToolListResponse, dependencies=[Depends(require_roles(ROLE_VIEWER))])
 async def list_tools(
     namespace: str = Query(default="default", description="Kubernetes namespace"),
@@ -632,100 +846,69 @@ async def list_tools(
     that haven't been migrated yet.
     """
     try:
-        label_selector = f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_TOOL}"
-        tools = []
-        existing_names = set()  # Track names to avoid duplicates with legacy CRDs
-
-        # Query Deployments with tool label
-        try:
-            deployments = kube.list_deployments(namespace, label_selector)
-            for deploy in deployments:
-                metadata = deploy.get("metadata", {})
-                annotations = metadata.get("annotations", {})
-                name = metadata.get("name", "")
-                existing_names.add(name)
-
-                tools.append(
-                    ToolSummary(
-                        name=name,
-                        namespace=metadata.get("namespace", namespace),
-                        description=annotations.get(KAGENTI_DESCRIPTION_ANNOTATION, ""),
-                        status=_get_workload_status(deploy),
-                        labels=_extract_labels(metadata.get("labels", {})),
-                        createdAt=_format_timestamp(
-                            metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
-                        ),
-                        workloadType=WORKLOAD_TYPE_DEPLOYMENT,
-                    )
+        # Query Deployments, StatefulSets and (optionally) legacy MCPServer CRDs concurrently
+        # Lists are served from the API server watch cache
+        list_options = {"resource_version": KUBE_LIST_CACHED_RESOURCE_VERSION}
+        list_calls = [
+            _list_tool_resources(
+                "Deployments",
+                partial(kube.list_deployments, namespace, _TOOL_LABEL_SELECTOR, **list_options),
+            ),
+            _list_tool_resources(
+                "StatefulSets",
+                partial(kube.list_statefulsets, namespace, _TOOL_LABEL_SELECTOR, **list_options),
+            ),
+        ]
+        if settings.enable_legacy_mcpserver_crd:
+            list_calls.append(
+                _list_tool_resources(
+                    "MCPServer CRDs",
+                    partial(
+                        kube.list_custom_resources,
+                        group=TOOLHIVE_CRD_GROUP,
+                        version=TOOLHIVE_CRD_VERSION,
+                        namespace=namespace,
+                        plural=TOOLHIVE_MCP_PLURAL,
+                        label_selector=_TOOL_LABEL_SELECTOR,
+                        **list_options,
+                    ),
                 )
-        except ApiException as e:
-            if e.status != 404:
-                logger.warning(f"Error listing Deployments: {e}")
+            )
+        deployments, statefulsets, *legacy = await asyncio.gather(*list_calls)
+        mcpserver_crds = legacy[0] if legacy else []
 
-        # Query StatefulSets with tool label
-        try:
-            statefulsets = kube.list_statefulsets(namespace, label_selector)
-            for sts in statefulsets:
-                metadata = sts.get("metadata", {})
-                annotations = metadata.get("annotations", {})
-                name = metadata.get("name", "")
-                existing_names.add(name)
-
-                tools.append(
-                    ToolSummary(
-                        name=name,
-                        namespace=metadata.get("namespace", namespace),
-                        description=annotations.get(KAGENTI_DESCRIPTION_ANNOTATION, ""),
-                        status=_get_workload_status(sts),
-                        labels=_extract_labels(metadata.get("labels", {})),
-                        createdAt=_format_timestamp(
-                            metadata.get("creation_timestamp") or metadata.get("creationTimestamp")
-                        ),
-                        workloadType=WORKLOAD_TYPE_STATEFULSET,
-                    )
-                )
-        except ApiException as e:
-            if e.status != 404:
-                logger.warning(f"Error listing StatefulSets: {e}")
+        tools = [
+            _build_tool_summary(
+                deploy, namespace, _get_workload_status(deploy), WORKLOAD_TYPE_DEPLOYMENT
+            )
+            for deploy in deployments
+        ]
+        tools.extend(
+            _build_tool_summary(
+                sts, namespace, _get_workload_status(sts), WORKLOAD_TYPE_STATEFULSET
+            )
+            for sts in statefulsets
+        )
 
-        # If legacy MCPServer CRD support is enabled, include unmigrated CRDs
-        if settings.enable_legacy_mcpserver_crd:
-            try:
-                mcpserver_crds = kube.list_custom_resources(
-                    group=TOOLHIVE_CRD_GROUP,
-                    version=TOOLHIVE_CRD_VERSION,
-                    namespace=namespace,
-                    plural=TOOLHIVE_MCP_PLURAL,
-                    label_selector=label_selector,
+        # Track names to avoid duplicates with legacy CRDs
+        existing_names = {t.name for t in tools}
+
+        # Include legacy MCPServer CRDs that haven't been migrated yet
+        for mcpserver in mcpserver_crds:
+            # Skip if already migrated (has Deployment or StatefulSet)
+            if mcpserver.get("metadata", {}).get("name", "") in existing_names:
+                continue
+
+            tools.append(
+                _build_tool_summary(
+                    mcpserver,
+                    namespace,
+                    _is_mcpserver_ready(mcpserver),
+                    "mcpserver",  # Legacy workload type
                 )
-                for mcpserver in mcpserver_crds:
-                    metadata = mcpserver.get("metadata", {})
-                    name = metadata.get("name", "")
-
-                    # Skip if already migrated (has Deployment or StatefulSet)
-                    if name in existing_names:
-                        continue
-
-                    annotations = metadata.get("annotations", {})
-                    tools.append(
-                        ToolSummary(
-                            name=name,
-                            namespace=metadata.get("namespace", namespace),
-                            description=annotations.get(KAGENTI_DESCRIPTION_ANNOTATION, ""),
-                            status=_is_mcpserver_ready(mcpserver),
-                            labels=_extract_labels(metadata.get("labels", {})),
-                            createdAt=_format_timestamp(
-                                metadata.get("creation_timestamp")
-                                or metadata.get("creationTimestamp")
-                            ),
-                            workloadType="mcpserver",  # Legacy workload type
-                        )
-                    )
-            except ApiException as e:
-                if e.status != 404:
-                    logger.warning(f"Error listing MCPServer CRDs: {e}")
+            )
 
-        return ToolListResponse(items=tools)
+        return ToolListResponse.model_construct(items=tools)
 
     except ApiException as e:
         if e.status == 403:
@@ -744,38 +927,42 @@ async def get_tool(
 ) -> Any:
     """Get detailed information about a specific tool.
 
-    Tries to find the tool as a Deployment first, then as a StatefulSet.
-    Returns the workload details along with associated Service information.
+    Looks the tool up as a Deployment and as a StatefulSet concurrently (the
+    Deployment wins if both exist), together with its associated Service.
+    Returns the workload details along with the Service information.
     """
-    workload = None
-    workload_type = None
+    service_name = _get_tool_service_name(name)
+    deployment, statefulset, service = await asyncio.gather(
+        asyncio.to_thread(kube.get_deployment, namespace, name),
+        asyncio.to_thread(kube.get_statefulset, namespace, name),
+        asyncio.to_thread(kube.get_service, namespace, service_name),
+        return_exceptions=True,
+    )
+    for result in (deployment, statefulset, service):
+        if isinstance(result, BaseException) and not isinstance(result, ApiException):
+            raise result
 
-    # Try Deployment first
-    try:
-        workload = kube.get_deployment(namespace, name)
+    if not isinstance(deployment, ApiException):
+        workload = deployment
         workload_type = WORKLOAD_TYPE_DEPLOYMENT
-    except ApiException as e:
-        if e.status != 404:
-            raise HTTPException(status_code=e.status, detail=str(e.reason))
-
-    # Try StatefulSet if Deployment not found
-    if workload is None:
-        try:
-            workload = kube.get_statefulset(namespace, name)
-            workload_type = WORKLOAD_TYPE_STATEFULSET
-        except ApiException as e:
-            if e.status == 404:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Tool '{name}' not found in namespace '{namespace}'",
-                )
-            raise HTTPException(status_code=e.status, detail=str(e.reason))
+    elif deployment.status != 404:
+        raise HTTPException(status_code=deployment.status, detail=str(deployment.reason))
+    elif not isinstance(statefulset, ApiException):
+        workload = statefulset
+        workload_type = WORKLOAD_TYPE_STATEFULSET
+    elif statefulset.status == 404:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Tool '{name}' not found in namespace '{namespace}'",
+        )
+    else:
+        raise HTTPException(status_code=statefulset.status, detail=str(statefulset.reason))
 
-    # Get associated Service
     service_info = None
-    service_name = _get_tool_service_name(name)
-    try:
-        service = kube.get_service(namespace, service_name)
+    if isinstance(service, ApiException):
+        if service.status != 404:
+            logger.warning(f"Error getting Service '{service_name}': {service}")
+    else:
         # Transform raw K8s Service to ServiceInfo format expected by frontend
         service_info = {
             "name": service.get("metadata", {}).get("name"),
@@ -783,9 +970,6 @@ async def get_tool(
             "clusterIP": service.get("spec", {}).get("cluster_ip"),
             "ports": service.get("spec", {}).get("ports", []),
         }
-    except ApiException as e:
-        if e.status != 404:
-            logger.warning(f"Error getting Service '{service_name}': {e}")
 
     # Build response with workload and service details
     # Return both raw status (for conditions display) and computed readyStatus string
@@ -810,6 +994,25 @@ async def get_tool_route_status(
     return {"hasRoute": exists}
 
 
+async def _delete_tool_resource(resource: str, delete_fn: Callable[[], Any]) -> Optional[str]:
+    """Run a blocking delete call in a worker thread, tolerating API errors.
+
+    Args:
+        resource: Resource identifier in Kind/name form, used in logs and results
+        delete_fn: Zero-argument callable performing the delete request
+
+    Returns:
+        The resource identifier if it was deleted, None if it was absent or failed
+    """
+    try:
+        await asyncio.to_thread(delete_fn)
+        return resource
+    except ApiException as e:
+        if e.status != 404:
+            logger.warning(f"Failed to delete {resource}: {e}")
+        return None
+
+
 @router.delete(
     "/{namespace}/{name}",
     response_model=DeleteResponse,
@@ -822,78 +1025,68 @@ async def delete_tool(
 ) -> DeleteResponse:
     """Delete a tool and associated resources from the cluster.
 
-    Deletes in order:
-    1. Shipwright BuildRuns (if any)
-    2. Shipwright Build (if any)
-    3. Deployment or StatefulSet
-    4. Service
+    Deletes in two concurrent phases:
+    1. Shipwright BuildRuns (if any), which reference the Build
+    2. Shipwright Build, Deployment, StatefulSet and Service
     """
-    deleted_resources = []
-
     # Delete BuildRuns first (they reference the Build)
     try:
-        buildruns = kube.list_custom_resources(
+        buildruns = await asyncio.to_thread(
+            kube.list_custom_resources,
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
             plural=SHIPWRIGHT_BUILDRUNS_PLURAL,
-            label_selector=f"kagenti.io/build-name={name}",
+            label_selector=_buildrun_selector(name),
+            resource_version=KUBE_LIST_CACHED_RESOURCE_VERSION,
         )
-        for buildrun in buildruns:
-            br_name = buildrun.get("metadata", {}).get("name")
-            if br_name:
-                try:
-                    kube.delete_custom_resource(
-                        group=SHIPWRIGHT_CRD_GROUP,
-                        version=SHIPWRIGHT_CRD_VERSION,
-                        namespace=namespace,
-                        plural=SHIPWRIGHT_BUILDRUNS_PLURAL,
-                        name=br_name,
-                    )
-                    deleted_resources.append(f"BuildRun/{br_name}")
-                except ApiException:
-                    pass  # Ignore individual BuildRun deletion errors
     except ApiException:
-        pass  # Ignore if BuildRuns not found
-
-    # Delete Shipwright Build
-    try:
-        kube.delete_custom_resource(
-            group=SHIPWRIGHT_CRD_GROUP,
-            version=SHIPWRIGHT_CRD_VERSION,
-            namespace=namespace,
-            plural=SHIPWRIGHT_BUILDS_PLURAL,
-            name=name,
+        buildruns = []  # Ignore if BuildRuns not found
+
+    br_names = [br_name for br in buildruns if (br_name := br.get("metadata", {}).get("name"))]
+    deleted_buildruns = await asyncio.gather(
+        *(
+            _delete_tool_resource(
+                f"BuildRun/{br_name}",
+                partial(
+                    kube.delete_custom_resource,
+                    group=SHIPWRIGHT_CRD_GROUP,
+                    version=SHIPWRIGHT_CRD_VERSION,
+                    namespace=namespace,
+                    plural=SHIPWRIGHT_BUILDRUNS_PLURAL,
+                    name=br_name,
+                ),
+            )
+            for br_name in br_names
         )
-        deleted_resources.append(f"Build/{name}")
-    except ApiException as e:
-        if e.status != 404:
-            logger.warning(f"Failed to delete Shipwright Build '{name}': {e}")
-
-    # Delete Deployment (if exists)
-    try:
-        kube.delete_deployment(namespace, name)
-        deleted_resources.append(f"Deployment/{name}")
-    except ApiException as e:
-        if e.status != 404:
-            logger.warning(f"Failed to delete Deployment '{name}': {e}")
-
-    # Delete StatefulSet (if exists)
-    try:
-        kube.delete_statefulset(namespace, name)
-        deleted_resources.append(f"StatefulSet/{name}")
-    except ApiException as e:
-        if e.status != 404:
-            logger.warning(f"Failed to delete StatefulSet '{name}': {e}")
+    )
 
-    # Delete Service
     service_name = _get_tool_service_name(name)
-    try:
-        kube.delete_service(namespace, service_name)
-        deleted_resources.append(f"Service/{service_name}")
-    except ApiException as e:
-        if e.status != 404:
-            logger.warning(f"Failed to delete Service '{service_name}': {e}")
+    deleted_workloads = await asyncio.gather(
+        _delete_tool_resource(
+            f"Build/{name}",
+            partial(
+                kube.delete_custom_resource,
+                group=SHIPWRIGHT_CRD_GROUP,
+                version=SHIPWRIGHT_CRD_VERSION,
+                namespace=namespace,
+                plural=SHIPWRIGHT_BUILDS_PLURAL,
+                name=name,
+            ),
+        ),
+        _delete_tool_resource(
+            f"Deployment/{name}", partial(kube.delete_deployment, namespace, name)
+        ),
+        _delete_tool_resource(
+            f"StatefulSet/{name}", partial(kube.delete_statefulset, namespace, name)
+        ),
+        _delete_tool_resource(
+            f"Service/{service_name}", partial(kube.delete_service, namespace, service_name)
+        ),
+    )
+
+    deleted_resources = sorted(r for r in (*deleted_buildruns, *deleted_workloads) if r)
+    _tools_cache.pop((namespace, name), None)
 
     if deleted_resources:
         return DeleteResponse(
@@ -910,11 +1103,8 @@ def _build_mcpserver_manifest(request: CreateToolRequest) -> dict:
 
     Tools are deployed using the ToolHive MCPServer CRD.
     """
-    # Build environment variables
-    env_vars = list(DEFAULT_ENV_VARS)
-    if request.envVars:
-        for ev in request.envVars:
-            env_vars.append({"name": ev.name, "value": ev.value})
+    # Build environment variables (including Secret/ConfigMap references)
+    env_vars = _build_tool_env_vars(request.envVars)
 
     # Build service ports
     if request.servicePorts:
@@ -946,10 +1136,7 @@ def _build_mcpserver_manifest(request: CreateToolRequest) -> dict:
             "proxyPort": DEFAULT_IN_CLUSTER_PORT,
             "podTemplateSpec": {
                 "spec": {
-                    "securityContext": {
-                        "runAsNonRoot": True,
-                        "seccompProfile": {"type": "RuntimeDefault"},
-                    },
+                    "securityContext": _TOOL_POD_SECURITY_CONTEXT,
                     "volumes": [
                         {"name": "cache", "emptyDir": {}},
                         {"name": "tmp-dir", "emptyDir": {}},
@@ -957,15 +1144,8 @@ def _build_mcpserver_manifest(request: CreateToolRequest) -> dict:
                     "containers": [
                         {
                             "name": "mcp",
-                            "securityContext": {
-                                "allowPrivilegeEscalation": False,
-                                "capabilities": {"drop": ["ALL"]},
-                                "runAsUser": 1000,
-                            },
-                            "resources": {
-                                "limits": DEFAULT_RESOURCE_LIMITS,
-                                "requests": DEFAULT_RESOURCE_REQUESTS,
-                            },
+                            "securityContext": _TOOL_CONTAINER_SECURITY_CONTEXT,
+                            "resources": _TOOL_CONTAINER_RESOURCES,
                             "env": env_vars,
                             "volumeMounts": [
                                 {"name": "cache", "mountPath": "/app/.cache", "readOnly": False},
@@ -1053,6 +1233,119 @@ def _build_service_ports(
     return ports
 
 
+def _build_tool_pod_template(
+    name: str,
+    image: str,
+    framework: str,
+    env_vars: Optional[List[Dict[str, str]]],
+    service_ports: Optional[List[Dict[str, Any]]],
+    image_pull_secret: Optional[str],
+    auth_bridge_enabled: bool,
+    spire_enabled: bool,
+    extra_volume_mounts: Tuple[Dict[str, Any], ...] = (),
+) -> dict:
+    """
+    Build the pod template shared by tool Deployments and StatefulSets.
+
+    Args:
+        name: Tool name
+        image: Container image URL (may include digest)
+        framework: Tool framework
+        env_vars: Container environment variables (DEFAULT_ENV_VARS if empty)
+        service_ports: Service port configuration
+        image_pull_secret: Image pull secret name
+        auth_bridge_enabled: Whether AuthBridge sidecar injection is enabled
+        spire_enabled: Whether the SPIRE identity label is set
+        extra_volume_mounts: Volume mounts placed before the default ones
+
+    Returns:
+        Pod template dict (metadata + spec)
+    """
+    # Callers are expected to provide DEFAULT_ENV_VARS via _build_tool_env_vars().
+    # The fallback references the shared tuple; the manifest is only serialized.
+    all_env_vars = env_vars if env_vars else DEFAULT_ENV_VARS
+
+    pod_labels = {
+        KAGENTI_TYPE_LABEL: RESOURCE_TYPE_TOOL,
+        APP_KUBERNETES_IO_NAME: name,
+        _MCP_PROTOCOL_LABEL: "",
+        KAGENTI_TRANSPORT_LABEL: VALUE_TRANSPORT_STREAMABLE_HTTP,
+        KAGENTI_FRAMEWORK_LABEL: framework,
+        KAGENTI_INJECT_LABEL: "enabled" if auth_bridge_enabled else "disabled",
+        # SPIRE identity label (triggers spiffe-helper sidecar injection by kagenti-webhook)
+        **({KAGENTI_SPIRE_LABEL: KAGENTI_SPIRE_ENABLED_VALUE} if spire_enabled else {}),
+    }
+
+    pod_spec = {
+        "securityContext": _TOOL_POD_SECURITY_CONTEXT,
+        "containers": [
+            {
+                "name": "mcp",
+                "image": image,
+                "imagePullPolicy": "Always",
+                "securityContext": _TOOL_CONTAINER_SECURITY_CONTEXT,
+                "env": all_env_vars,
+                "ports": _build_container_ports(service_ports),
+                "resources": _TOOL_CONTAINER_RESOURCES,
+                "volumeMounts": [*extra_volume_mounts, *_TOOL_VOLUME_MOUNTS],
+            }
+        ],
+        "volumes": list(_TOOL_VOLUMES),
+    }
+    if image_pull_secret:
+        pod_spec["imagePullSecrets"] = [{"name": image_pull_secret}]
+
+    return {"metadata": {"labels": pod_labels}, "spec": pod_spec}
+
+
+def _build_tool_workload_metadata(
+    name: str,
+    namespace: str,
+    workload_type: str,
+    pod_labels: Dict[str, str],
+    description: str,
+    shipwright_build_name: Optional[str],
+) -> dict:
+    """
+    Build the metadata of a tool Deployment or StatefulSet.
+
+    Args:
+        name: Tool name
+        namespace: Kubernetes namespace
+        workload_type: WORKLOAD_TYPE_DEPLOYMENT or WORKLOAD_TYPE_STATEFULSET
+        pod_labels: Labels of the pod template, which the workload also carries
+        description: Tool description
+        shipwright_build_name: Name of Shipwright build (if built from source)
+
+    Returns:
+        Workload metadata dict
+    """
+    # Required labels per migration plan (pod labels plus workload metadata)
+    metadata = {
+        "name": name,
+        "namespace": namespace,
+        "labels": {
+            **pod_labels,
+            KAGENTI_WORKLOAD_TYPE_LABEL: workload_type,
+            APP_KUBERNETES_IO_MANAGED_BY: KAGENTI_UI_CREATOR_LABEL,
+        },
+    }
+
+    # Add annotations, keeping only those with a value
+    annotations = {
+        key: value
+        for key, value in (
+            (KAGENTI_DESCRIPTION_ANNOTATION, description),
+            ("kagenti.io/shipwright-build", shipwright_build_name),
+        )
+        if value
+    }
+    if annotations:
+        metadata["annotations"] = annotations
+
+    return metadata
+
+
 def _build_tool_deployment_manifest(
     name: str,
     namespace: str,
@@ -1087,56 +1380,28 @@ def _build_tool_deployment_manifest(
     Returns:
         Deployment manifest dict
     """
-    # Build environment variables
-    # Callers are expected to provide DEFAULT_ENV_VARS via _build_tool_env_vars()
-    all_env_vars = env_vars if env_vars else list(DEFAULT_ENV_VARS)
-
-    # Build container ports from service_ports
-    container_ports = _build_container_ports(service_ports)
-
-    # Build labels - required labels per migration plan
-    labels = {
-        KAGENTI_TYPE_LABEL: RESOURCE_TYPE_TOOL,
-        APP_KUBERNETES_IO_NAME: name,
-        f"{PROTOCOL_LABEL_PREFIX}{VALUE_PROTOCOL_MCP}": "",
-        KAGENTI_TRANSPORT_LABEL: VALUE_TRANSPORT_STREAMABLE_HTTP,
-        KAGENTI_FRAMEWORK_LABEL: framework,
-        KAGENTI_WORKLOAD_TYPE_LABEL: WORKLOAD_TYPE_DEPLOYMENT,
-        APP_KUBERNETES_IO_MANAGED_BY: KAGENTI_UI_CREATOR_LABEL,
-        KAGENTI_INJECT_LABEL: "enabled" if auth_bridge_enabled else "disabled",
-    }
-
-    # Pod template labels (subset used on pod template metadata)
-    pod_labels = {
-        KAGENTI_TYPE_LABEL: RESOURCE_TYPE_TOOL,
-        APP_KUBERNETES_IO_NAME: name,
-        f"{PROTOCOL_LABEL_PREFIX}{VALUE_PROTOCOL_MCP}": "",
-        KAGENTI_TRANSPORT_LABEL: VALUE_TRANSPORT_STREAMABLE_HTTP,
-        KAGENTI_FRAMEWORK_LABEL: framework,
-        KAGENTI_INJECT_LABEL: "enabled" if auth_bridge_enabled else "disabled",
-    }
-
-    # SPIRE identity label (triggers spiffe-helper sidecar injection by kagenti-webhook)
-    if spire_enabled:
-        labels[KAGENTI_SPIRE_LABEL] = KAGENTI_SPIRE_ENABLED_VALUE
-        pod_labels[KAGENTI_SPIRE_LABEL] = KAGENTI_SPIRE_ENABLED_VALUE
-
-    # Build annotations
-    annotations = {}
-    if description:
-        annotations[KAGENTI_DESCRIPTION_ANNOTATION] = description
-    if shipwright_build_name:
-        annotations["kagenti.io/shipwright-build"] = shipwright_build_name
+    template = _build_tool_pod_template(
+        name=name,
+        image=image,
+        framework=framework,
+        env_vars=env_vars,
+        service_ports=service_ports,
+        image_pull_secret=image_pull_secret,
+        auth_bridge_enabled=auth_bridge_enabled,
+        spire_enabled=spire_enabled,
+    )
 
-    manifest = {
+    return {
         "apiVersion": "apps/v1",
         "kind": "Deployment",
-        "metadata": {
-            "name": name,
-            "namespace": namespace,
-            "labels": labels,
-            "annotations": annotations if annotations else None,
-        },
+        "metadata": _build_tool_workload_metadata(
+            name=name,
+            namespace=namespace,
+            workload_type=WORKLOAD_TYPE_DEPLOYMENT,
+            pod_labels=template["metadata"]["labels"],
+            description=description,
+            shipwright_build_name=shipwright_build_name,
+        ),
         "spec": {
             "replicas": 1,
             "selector": {
@@ -1145,56 +1410,10 @@ def _build_tool_deployment_manifest(
                     APP_KUBERNETES_IO_NAME: name,
                 }
             },
-            "template": {
-                "metadata": {
-                    "labels": pod_labels,
-                },
-                "spec": {
-                    "securityContext": {
-                        "runAsNonRoot": True,
-                        "seccompProfile": {"type": "RuntimeDefault"},
-                    },
-                    "containers": [
-                        {
-                            "name": "mcp",
-                            "image": image,
-                            "imagePullPolicy": "Always",
-                            "securityContext": {
-                                "allowPrivilegeEscalation": False,
-                                "capabilities": {"drop": ["ALL"]},
-                                "runAsUser": 1000,
-                            },
-                            "env": all_env_vars,
-                            "ports": container_ports,
-                            "resources": {
-                                "limits": DEFAULT_RESOURCE_LIMITS,
-                                "requests": DEFAULT_RESOURCE_REQUESTS,
-                            },
-                            "volumeMounts": [
-                                {"name": "cache", "mountPath": "/app/.cache"},
-                                {"name": "tmp", "mountPath": "/tmp"},
-                            ],
-                        }
-                    ],
-                    "volumes": [
-                        {"name": "cache", "emptyDir": {}},
-                        {"name": "tmp", "emptyDir": {}},
-                    ],
-                },
-            },
+            "template": template,
         },
     }
 
-    # Remove None annotations
-    if manifest["metadata"]["annotations"] is None:
-        del manifest["metadata"]["annotations"]
-
-    # Add image pull secrets if specified
-    if image_pull_secret:
-        manifest["spec"]["template"]["spec"]["imagePullSecrets"] = [{"name": image_pull_secret}]
-
-    return manifest
-
 
 def _build_tool_statefulset_manifest(
     name: str,
@@ -1232,61 +1451,32 @@ def _build_tool_statefulset_manifest(
     Returns:
         StatefulSet manifest dict
     """
-    # Build environment variables
-    # Callers are expected to provide DEFAULT_ENV_VARS via _build_tool_env_vars()
-    all_env_vars = env_vars if env_vars else list(DEFAULT_ENV_VARS)
-
-    # Build container ports from service_ports
-    container_ports = _build_container_ports(service_ports)
-
-    # Service name for StatefulSet (must match the headless service)
-    service_name = f"{name}{TOOL_SERVICE_SUFFIX}"
-
-    # Build labels - required labels per migration plan
-    labels = {
-        KAGENTI_TYPE_LABEL: RESOURCE_TYPE_TOOL,
-        APP_KUBERNETES_IO_NAME: name,
-        f"{PROTOCOL_LABEL_PREFIX}{VALUE_PROTOCOL_MCP}": "",
-        KAGENTI_TRANSPORT_LABEL: VALUE_TRANSPORT_STREAMABLE_HTTP,
-        KAGENTI_FRAMEWORK_LABEL: framework,
-        KAGENTI_WORKLOAD_TYPE_LABEL: WORKLOAD_TYPE_STATEFULSET,
-        APP_KUBERNETES_IO_MANAGED_BY: KAGENTI_UI_CREATOR_LABEL,
-        KAGENTI_INJECT_LABEL: "enabled" if auth_bridge_enabled else "disabled",
-    }
-
-    # Pod template labels (subset used on pod template metadata)
-    pod_labels = {
-        KAGENTI_TYPE_LABEL: RESOURCE_TYPE_TOOL,
-        APP_KUBERNETES_IO_NAME: name,
-        f"{PROTOCOL_LABEL_PREFIX}{VALUE_PROTOCOL_MCP}": "",
-        KAGENTI_TRANSPORT_LABEL: VALUE_TRANSPORT_STREAMABLE_HTTP,
-        KAGENTI_FRAMEWORK_LABEL: framework,
-        KAGENTI_INJECT_LABEL: "enabled" if auth_bridge_enabled else "disabled",
-    }
-
-    # SPIRE identity label (triggers spiffe-helper sidecar injection by kagenti-webhook)
-    if spire_enabled:
-        labels[KAGENTI_SPIRE_LABEL] = KAGENTI_SPIRE_ENABLED_VALUE
-        pod_labels[KAGENTI_SPIRE_LABEL] = KAGENTI_SPIRE_ENABLED_VALUE
-
-    # Build annotations
-    annotations = {}
-    if description:
-        annotations[KAGENTI_DESCRIPTION_ANNOTATION] = description
-    if shipwright_build_name:
-        annotations["kagenti.io/shipwright-build"] = shipwright_build_name
+    template = _build_tool_pod_template(
+        name=name,
+        image=image,
+        framework=framework,
+        env_vars=env_vars,
+        service_ports=service_ports,
+        image_pull_secret=image_pull_secret,
+        auth_bridge_enabled=auth_bridge_enabled,
+        spire_enabled=spire_enabled,
+        extra_volume_mounts=({"name": "data", "mountPath": "/data"},),
+    )
 
-    manifest = {
+    return {
         "apiVersion": "apps/v1",
         "kind": "StatefulSet",
-        "metadata": {
-            "name": name,
-            "namespace": namespace,
-            "labels": labels,
-            "annotations": annotations if annotations else None,
-        },
+        "metadata": _build_tool_workload_metadata(
+            name=name,
+            namespace=namespace,
+            workload_type=WORKLOAD_TYPE_STATEFULSET,
+            pod_labels=template["metadata"]["labels"],
+            description=description,
+            shipwright_build_name=shipwright_build_name,
+        ),
         "spec": {
-            "serviceName": service_name,
+            # Service name for StatefulSet (must match the headless service)
+            "serviceName": _get_tool_service_name(name),
             "replicas": 1,
             "selector": {
                 "matchLabels": {
@@ -1294,44 +1484,7 @@ def _build_tool_statefulset_manifest(
                     APP_KUBERNETES_IO_NAME: name,
                 }
             },
-            "template": {
-                "metadata": {
-                    "labels": pod_labels,
-                },
-                "spec": {
-                    "securityContext": {
-                        "runAsNonRoot": True,
-                        "seccompProfile": {"type": "RuntimeDefault"},
-                    },
-                    "containers": [
-                        {
-                            "name": "mcp",
-                            "image": image,
-                            "imagePullPolicy": "Always",
-                            "securityContext": {
-                                "allowPrivilegeEscalation": False,
-                                "capabilities": {"drop": ["ALL"]},
-                                "runAsUser": 1000,
-                            },
-                            "env": all_env_vars,
-                            "ports": container_ports,
-                            "resources": {
-                                "limits": DEFAULT_RESOURCE_LIMITS,
-                                "requests": DEFAULT_RESOURCE_REQUESTS,
-                            },
-                            "volumeMounts": [
-                                {"name": "data", "mountPath": "/data"},
-                                {"name": "cache", "mountPath": "/app/.cache"},
-                                {"name": "tmp", "mountPath": "/tmp"},
-                            ],
-                        }
-                    ],
-                    "volumes": [
-                        {"name": "cache", "emptyDir": {}},
-                        {"name": "tmp", "emptyDir": {}},
-                    ],
-                },
-            },
+            "template": template,
             "volumeClaimTemplates": [
                 {
                     "metadata": {"name": "data"},
@@ -1344,16 +1497,6 @@ def _build_tool_statefulset_manifest(
         },
     }
 
-    # Remove None annotations
-    if manifest["metadata"]["annotations"] is None:
-        del manifest["metadata"]["annotations"]
-
-    # Add image pull secrets if specified
-    if image_pull_secret:
-        manifest["spec"]["template"]["spec"]["imagePullSecrets"] = [{"name": image_pull_secret}]
-
-    return manifest
-
 
 def _build_tool_service_manifest(
     name: str,
@@ -1388,7 +1531,7 @@ def _build_tool_service_manifest(
             "namespace": namespace,
             "labels": {
                 KAGENTI_TYPE_LABEL: RESOURCE_TYPE_TOOL,
-                f"{PROTOCOL_LABEL_PREFIX}{VALUE_PROTOCOL_MCP}": "",
+                _MCP_PROTOCOL_LABEL: "",
                 APP_KUBERNETES_IO_NAME: name,
                 APP_KUBERNETES_IO_MANAGED_BY: KAGENTI_UI_CREATOR_LABEL,
             },
@@ -1406,6 +1549,7 @@ def _build_tool_service_manifest(
     return manifest
 
 
+@lru_cache(maxsize=4096)
 def _get_tool_service_name(name: str) -> str:
     """Get the service name for a tool.
 
@@ -1413,9 +1557,24 @@ def _get_tool_service_name(name: str) -> str:
         name: Tool name
 
     Returns:
-        Service name following convention: {name}-mcp
+        Service name following convention: {name}-mcp (interned, since it is reused
+        as a dict key and selector value across manifests)
     """
-    return f"{name}{TOOL_SERVICE_SUFFIX}"
+    return sys.intern(f"{name}{TOOL_SERVICE_SUFFIX}")
+
+
+@lru_cache(maxsize=4096)
+def _buildrun_selector(build_name: str) -> str:
+    """Get the label selector matching the BuildRuns of a Shipwright Build.
+
+    Args:
+        build_name: Shipwright Build name
+
+    Returns:
+        Label selector string. It is not URL-encoded here; the Kubernetes client
+        encodes query parameters itself.
+    """
+    return f"kagenti.io/build-name={build_name}"
 
 
 @router.post(
@@ -1457,11 +1616,14 @@ async def create_tool(
                 )
 
             # Step 1: Create Shipwright Build CR
-            clone_secret = resolve_clone_secret(kube.core_api, request.namespace)
+            clone_secret = await asyncio.to_thread(
+                resolve_clone_secret, kube.core_api, request.namespace
+            )
             build_manifest = _build_tool_shipwright_build_manifest(
                 request, clone_secret_name=clone_secret
             )
-            kube.create_custom_resource(
+            await asyncio.to_thread(
+                kube.create_custom_resource,
                 group=SHIPWRIGHT_CRD_GROUP,
                 version=SHIPWRIGHT_CRD_VERSION,
                 namespace=request.namespace,
@@ -1479,7 +1641,8 @@ async def create_tool(
                 namespace=request.namespace,
                 labels=build_labels,
             )
-            created_buildrun = kube.create_custom_resource(
+            created_buildrun = await asyncio.to_thread(
+                kube.create_custom_resource,
                 group=SHIPWRIGHT_CRD_GROUP,
                 version=SHIPWRIGHT_CRD_VERSION,
                 namespace=request.namespace,
@@ -1518,7 +1681,7 @@ async def create_tool(
             # Prepare service ports
             service_ports = None
             if request.servicePorts:
-                service_ports = [sp.model_dump() for sp in request.servicePorts]
+                service_ports = [_service_port_to_dict(sp) for sp in request.servicePorts]
 
             # Set description if not provided
             description = request.description
@@ -1527,7 +1690,7 @@ async def create_tool(
                     f"Tool '{request.name}' deployed from existing image '{request.containerImage}'"
                 )
 
-            # Create workload (Deployment or StatefulSet)
+            # Build workload (Deployment or StatefulSet)
             if request.workloadType == WORKLOAD_TYPE_STATEFULSET:
                 # Determine storage size
                 storage_size = "1Gi"
@@ -1548,9 +1711,10 @@ async def create_tool(
                     auth_bridge_enabled=request.authBridgeEnabled,
                     spire_enabled=request.spireEnabled,
                 )
-                kube.create_statefulset(request.namespace, workload_manifest)
-                logger.info(
-                    f"Created StatefulSet '{request.name}' for tool in namespace '{request.namespace}'"
+                kind, create_workload, delete_workload = (
+                    "StatefulSet",
+                    kube.create_statefulset,
+                    kube.delete_statefulset,
                 )
             else:
                 # Default: Deployment
@@ -1567,33 +1731,52 @@ async def create_tool(
                     auth_bridge_enabled=request.authBridgeEnabled,
                     spire_enabled=request.spireEnabled,
                 )
-                kube.create_deployment(request.namespace, workload_manifest)
-                logger.info(
-                    f"Created Deployment '{request.name}' for tool in namespace '{request.namespace}'"
+                kind, create_workload, delete_workload = (
+                    "Deployment",
+                    kube.create_deployment,
+                    kube.delete_deployment,
                 )
 
-            # Create Service for the tool
+            # Build Service for the tool
             service_manifest = _build_tool_service_manifest(
                 name=request.name,
                 namespace=request.namespace,
                 service_ports=service_ports,
             )
-            kube.create_service(request.namespace, service_manifest)
             service_name = _get_tool_service_name(request.name)
-            logger.info(
-                f"Created Service '{service_name}' for tool in namespace '{request.namespace}'"
-            )
+
+            # Create workload + Service. Neither depends on the other already existing,
+            # so they are created concurrently and rolled back together if either
+            # creation fails for a reason other than 409.
+            creations: List[Tuple[str, Callable[[], Any], Optional[Callable[[], Any]]]] = [
+                (
+                    f"{kind} '{request.name}'",
+                    partial(create_workload, request.namespace, workload_manifest),
+                    partial(delete_workload, request.namespace, request.name),
+                ),
+                (
+                    f"Service '{service_name}'",
+                    partial(kube.create_service, request.namespace, service_manifest),
+                    partial(kube.delete_service, request.namespace, service_name),
+                ),
+            ]
+
+            await create_resources_concurrently(creations)
+            for description, _, _ in creations:
+                logger.info(f"Created {description} for tool in namespace '{request.namespace}'")
 
             message = f"Tool '{request.name}' deployment started ({request.workloadType})."
 
-            # Create HTTPRoute/Route if requested
+            # Create HTTPRoute/Route if requested, only once the workload and Service
+            # exist so that a failed or conflicting create does not expose a route
             # Service is now {name}-mcp on port 8000
             if request.createHttpRoute:
                 service_port = DEFAULT_IN_CLUSTER_PORT
                 if service_ports and len(service_ports) > 0:
                     service_port = service_ports[0].get("port", DEFAULT_IN_CLUSTER_PORT)
 
-                create_route_for_agent_or_tool(
+                await asyncio.to_thread(
+                    create_route_for_agent_or_tool,
                     kube=kube,
                     name=request.name,
                     namespace=request.namespace,
@@ -1645,27 +1828,41 @@ async def get_tool_shipwright_build_info(
     - Tool configuration stored in annotations
     """
     try:
-        # Get the Build resource
-        build = kube.get_custom_resource(
-            group=SHIPWRIGHT_CRD_GROUP,
-            version=SHIPWRIGHT_CRD_VERSION,
-            namespace=namespace,
-            plural=SHIPWRIGHT_BUILDS_PLURAL,
-            name=name,
+        # Get the Build resource and its BuildRuns concurrently
+        build, buildruns = await asyncio.gather(
+            asyncio.to_thread(
+                kube.get_custom_resource,
+                group=SHIPWRIGHT_CRD_GROUP,
+                version=SHIPWRIGHT_CRD_VERSION,
+                namespace=namespace,
+                plural=SHIPWRIGHT_BUILDS_PLURAL,
+                name=name,
+            ),
+            asyncio.to_thread(
+                kube.list_custom_resources,
+                group=SHIPWRIGHT_CRD_GROUP,
+                version=SHIPWRIGHT_CRD_VERSION,
+                namespace=namespace,
+                plural=SHIPWRIGHT_BUILDRUNS_PLURAL,
+                label_selector=_buildrun_selector(name),
+            ),
+            return_exceptions=True,
         )
+        if isinstance(build, BaseException):
+            raise build
 
-        metadata = build.get("metadata", {})
-        spec = build.get("spec", {})
-        status = build.get("status", {})
+        metadata = build.get("metadata") or _EMPTY
+        spec = build.get("spec") or _EMPTY
+        status = build.get("status") or _EMPTY
 
         # Extract build info
-        source = spec.get("source", {})
-        git_info = source.get("git", {})
-        strategy = spec.get("strategy", {})
-        output = spec.get("output", {})
+        source = spec.get("source") or _EMPTY
+        git_info = source.get("git") or _EMPTY
+        strategy = spec.get("strategy") or _EMPTY
+        output = spec.get("output") or _EMPTY
 
         # Parse tool config from annotations using shared utility
-        tool_config = extract_resource_config_from_build(build, ResourceType.TOOL)
+        tool_config = _get_tool_config(build)
 
         # Build response with basic build info
         response = ToolShipwrightBuildInfoResponse(
@@ -1682,34 +1879,26 @@ async def get_tool_shipwright_build_info(
             toolConfig=tool_config,
         )
 
-        # Try to get the latest BuildRun
-        try:
-            items = kube.list_custom_resources(
-                group=SHIPWRIGHT_CRD_GROUP,
-                version=SHIPWRIGHT_CRD_VERSION,
-                namespace=namespace,
-                plural=SHIPWRIGHT_BUILDRUNS_PLURAL,
-                label_selector=f"kagenti.io/build-name={name}",
-            )
-
-            if items:
-                latest_buildrun = get_latest_buildrun(items)
-                if latest_buildrun:
-                    buildrun_info = extract_buildrun_info(latest_buildrun)
-
-                    response.hasBuildRun = True
-                    response.buildRunName = buildrun_info["name"]
-                    response.buildRunPhase = buildrun_info["phase"]
-                    response.buildRunStartTime = buildrun_info["startTime"]
-                    response.buildRunCompletionTime = buildrun_info["completionTime"]
-                    response.buildRunOutputImage = buildrun_info["outputImage"]
-                    response.buildRunOutputDigest = buildrun_info["outputDigest"]
-                    response.buildRunFailureMessage = buildrun_info["failureMessage"]
-
-        except ApiException as e:
+        # Add the latest BuildRun, if any
+        if isinstance(buildruns, ApiException):
             # BuildRun not found is OK, just means no build has been triggered
-            if e.status != 404:
-                logger.warning(f"Failed to get BuildRun for build '{name}': {e}")
+            if buildruns.status != 404:
+                logger.warning(f"Failed to get BuildRun for build '{name}': {buildruns}")
+        elif isinstance(buildruns, BaseException):
+            raise buildruns
+        elif buildruns:
+            latest_buildrun = get_latest_buildrun(buildruns)
+            if latest_buildrun:
+                buildrun_info = extract_buildrun_info(latest_buildrun)
+
+                response.hasBuildRun = True
+                response.buildRunName = buildrun_info["name"]
+                response.buildRunPhase = buildrun_info["phase"]
+                response.buildRunStartTime = buildrun_info["startTime"]
+                response.buildRunCompletionTime = buildrun_info["completionTime"]
+                response.buildRunOutputImage = buildrun_info["outputImage"]
+                response.buildRunOutputDigest = buildrun_info["outputDigest"]
+                response.buildRunFailureMessage = buildrun_info["failureMessage"]
 
         return response
 
@@ -1737,7 +1926,8 @@ async def create_tool_buildrun(
     """
     try:
         # Verify the Build exists
-        build = kube.get_custom_resource(
+        build = await asyncio.to_thread(
+            kube.get_custom_resource,
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1761,7 +1951,8 @@ async def create_tool_buildrun(
         )
 
         # Create the BuildRun
-        created_buildrun = kube.create_custom_resource(
+        created_buildrun = await asyncio.to_thread(
+            kube.create_custom_resource,
             group=SHIPWRIGHT_CRD_GROUP,
             version=SHIPWRIGHT_CRD_VERSION,
             namespace=namespace,
@@ -1809,23 +2000,30 @@ async def finalize_tool_shipwright_build(
     7. Adds kagenti.io/shipwright-build annotation to workload
     """
     try:
-        # Get the Build resource
-        build = kube.get_custom_resource(
-            group=SHIPWRIGHT_CRD_GROUP,
-            version=SHIPWRIGHT_CRD_VERSION,
-            namespace=namespace,
-            plural=SHIPWRIGHT_BUILDS_PLURAL,
-            name=name,
-        )
-
-        # Get the latest BuildRun
-        buildruns = kube.list_custom_resources(
-            group=SHIPWRIGHT_CRD_GROUP,
-            version=SHIPWRIGHT_CRD_VERSION,
-            namespace=namespace,
-            plural=SHIPWRIGHT_BUILDRUNS_PLURAL,
-            label_selector=f"kagenti.io/build-name={name}",
+        # Get the Build resource and its BuildRuns concurrently; neither depends on the other
+        build, buildruns = await asyncio.gather(
+            asyncio.to_thread(
+                kube.get_custom_resource,
+                group=SHIPWRIGHT_CRD_GROUP,
+                version=SHIPWRIGHT_CRD_VERSION,
+                namespace=namespace,
+                plural=SHIPWRIGHT_BUILDS_PLURAL,
+                name=name,
+            ),
+            asyncio.to_thread(
+                kube.list_custom_resources,
+                group=SHIPWRIGHT_CRD_GROUP,
+                version=SHIPWRIGHT_CRD_VERSION,
+                namespace=namespace,
+                plural=SHIPWRIGHT_BUILDRUNS_PLURAL,
+                label_selector=_buildrun_selector(name),
+            ),
+            return_exceptions=True,
         )
+        # A Build error takes precedence, so a missing Build is still reported as such
+        for result in (build, buildruns):
+            if isinstance(result, BaseException):
+                raise result
 
         if not buildruns:
             raise HTTPException(
@@ -1865,8 +2063,9 @@ async def finalize_tool_shipwright_build(
         else:
             image_with_digest = output_image
 
-        # Extract tool config from Build annotations
-        tool_config = extract_resource_config_from_build(build, ResourceType.TOOL)
+        # Extract tool config from Build annotations. It is always read: settings such
+        # as spireEnabled and persistentStorage come only from the stored config.
+        tool_config = _get_tool_config(build)
         if tool_config:
             tool_config_dict = tool_config.model_dump()
         else:
@@ -1902,7 +2101,7 @@ async def finalize_tool_shipwright_build(
         # Build service ports
         service_ports = None
         if request.servicePorts:
-            service_ports = [sp.model_dump() for sp in request.servicePorts]
+            service_ports = [_service_port_to_dict(sp) for sp in request.servicePorts]
         elif tool_config_dict.get("servicePorts"):
             service_ports = tool_config_dict["servicePorts"]
 
@@ -1936,9 +2135,10 @@ async def finalize_tool_shipwright_build(
                 auth_bridge_enabled=auth_bridge_enabled,
                 spire_enabled=spire_enabled,
             )
-            kube.create_statefulset(namespace, workload_manifest)
-            logger.info(
-                f"Created StatefulSet '{name}' in namespace '{namespace}' from Shipwright build"
+            kind, create_workload, delete_workload = (
+                "StatefulSet",
+                kube.create_statefulset,
+                kube.delete_statefulset,
             )
         else:
             # Default: Deployment
@@ -1956,32 +2156,49 @@ async def finalize_tool_shipwright_build(
                 auth_bridge_enabled=auth_bridge_enabled,
                 spire_enabled=spire_enabled,
             )
-            kube.create_deployment(namespace, workload_manifest)
-            logger.info(
-                f"Created Deployment '{name}' in namespace '{namespace}' from Shipwright build"
+            kind, create_workload, delete_workload = (
+                "Deployment",
+                kube.create_deployment,
+                kube.delete_deployment,
             )
 
-        # Create Service for the tool
+        # Build Service for the tool
         service_manifest = _build_tool_service_manifest(
             name=name,
             namespace=namespace,
             service_ports=service_ports,
         )
-        kube.create_service(namespace, service_manifest)
         service_name = _get_tool_service_name(name)
-        logger.info(
-            f"Created Service '{service_name}' in namespace '{namespace}' from Shipwright build"
-        )
+
+        # Create workload + Service concurrently, rolling back together if either
+        # creation fails for a reason other than 409.
+        creations: List[Tuple[str, Callable[[], Any], Optional[Callable[[], Any]]]] = [
+            (
+                f"{kind} '{name}'",
+                partial(create_workload, namespace, workload_manifest),
+                partial(delete_workload, namespace, name),
+            ),
+            (
+                f"Service '{service_name}'",
+                partial(kube.create_service, namespace, service_manifest),
+                partial(kube.delete_service, namespace, service_name),
+            ),
+        ]
+
+        await create_resources_concurrently(creations)
+        for description, _, _ in creations:
+            logger.info(f"Created {description} in namespace '{namespace}' from Shipwright build")
 
         message = f"Tool '{name}' created from Shipwright build ({workload_type})."
 
-        # Create HTTPRoute if requested
+        # Create HTTPRoute if requested, once the workload and Service exist
         if create_http_route:
             service_port = DEFAULT_IN_CLUSTER_PORT
             if service_ports and len(service_ports) > 0:
                 service_port = service_ports[0].get("port", DEFAULT_IN_CLUSTER_PORT)
 
-            create_route_for_agent_or_tool(
+            await asyncio.to_thread(
+                create_route_for_agent_or_tool,
                 kube=kube,
                 name=name,
                 namespace=namespace,
@@ -2011,9 +2228,12 @@ async def finalize_tool_shipwright_build(
         raise HTTPException(status_code=e.status, detail=str(e.reason))
 
 
+@lru_cache(maxsize=4096)
 def _get_tool_url(name: str, namespace: str) -> str:
     """Get the URL for an MCP tool server.
 
+    The URL only depends on the tool and on process-wide settings, so it is cached.
+
     Service naming convention:
     - Service name: {name}-mcp
     - Port: 8000
@@ -2032,65 +2252,110 @@ def _get_tool_url(name: str, namespace: str) -> str:
         return f"http://{name}.{domain}:8080"
 
 
-@router.post(
-    "/{namespace}/{name}/connect",
-    response_model=MCPToolsResponse,
-    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
-)
-async def connect_to_tool(
-    namespace: str,
-    name: str,
-) -> MCPToolsResponse:
+def _serialize_other_content(content_item: Any) -> Dict[str, Any]:
+    """Serialize a content item of a type without a dedicated serializer."""
+    if hasattr(content_item, "text"):
+        return {"type": "text", "text": content_item.text}
+    if hasattr(content_item, "data"):
+        return {"type": "data", "data": content_item.data}
+    return {"type": "unknown", "value": str(content_item)}
+
+
+@lru_cache
+def _content_serializers() -> Dict[type, Callable[[Any], Dict[str, Any]]]:
+    """Serializers for the MCP content types, looked up by exact type.
+
+    Built on first use, like the rest of the MCP client code, so the MCP package is
+    not imported at startup.
     """
-    Connect to an MCP server and list available tools.
+    from mcp.types import AudioContent, ImageContent, TextContent
 
-    This endpoint connects to the MCP server and retrieves the list of
-    available tools using the MCP client library.
+    return {
+        TextContent: lambda c: {"type": "text", "text": c.text},
+        ImageContent: lambda c: {"type": "data", "data": c.data},
+        AudioContent: lambda c: {"type": "data", "data": c.data},
+    }
+
+
+def _keeps_session(error: Exception) -> bool:
+    """Check whether a pooled session is still usable after an error.
+
+    Errors the MCP server reports for a request leave the session usable, except
+    those that mean the session itself is gone, e.g. a stale session after the
+    server restarted. Transport errors may leave it broken.
+    """
+    from mcp.shared.exceptions import McpError
+
+    return isinstance(error, McpError) and error.error.code not in _SESSION_ERROR_CODES
+
+
+def _serialize_tool_result(result: Any) -> Dict[str, Any]:
+    """Convert an MCP CallToolResult to a JSON-serializable dict."""
+    result_data = {}
+    if result:
+        if hasattr(result, "content"):
+            # Extract content from the result
+            serializers = _content_serializers()
+            result_data["content"] = [
+                serializers.get(type(content_item), _serialize_other_content)(content_item)
+                for content_item in result.content
+            ]
+        if hasattr(result, "isError"):
+            result_data["isError"] = result.isError
+    return result_data
+
+
+async def _list_tools_from_server(
+    namespace: str, name: str, pool: MCPSessionPool
+) -> MCPToolsResponse:
+    """List the tools advertised by a tool's MCP server and cache the result.
+
+    Raises:
+        HTTPException: 503 if the server cannot be reached, 500 on other errors.
     """
     tool_url = _get_tool_url(name, namespace)
     mcp_endpoint = f"{tool_url}/mcp"
 
     logger.info(f"Connecting to MCP server at {mcp_endpoint}")
 
-    exit_stack = AsyncExitStack()
     try:
-        async with exit_stack:
-            # Connect using MCP streamable-http transport
-            streams_context = streamablehttp_client(url=mcp_endpoint, headers={})
-            read_stream, write_stream, _ = await streams_context.__aenter__()
-
-            # Create and initialize MCP session
-            session_context = ClientSession(read_stream, write_stream)
-            session: ClientSession = await session_context.__aenter__()
-            await session.initialize()
-
-            logger.info(f"MCP session initialized for tool '{name}'")
-
+        session = await pool.acquire(mcp_endpoint)
+        try:
             # List available tools
             response = await session.list_tools()
-            tools = []
-            if response and hasattr(response, "tools"):
-                for tool in response.tools:
-                    tools.append(
-                        MCPToolSchema(
-                            name=tool.name,
-                            description=tool.description,
-                            input_schema=(
-                                tool.inputSchema if hasattr(tool, "inputSchema") else None
-                            ),
-                        )
-                    )
-                logger.info(f"Listed {len(tools)} tools from MCP server '{name}'")
+        finally:
+            pool.release(mcp_endpoint, session)
+        tools = []
+        if response and hasattr(response, "tools"):
+            # The MCP client has already validated these, so skip re-validating
+            # (and copying) every tool's input schema
+            tools = [
+                MCPToolSchema.model_construct(
+                    name=tool.name,
+                    description=tool.description,
+                    input_schema=getattr(tool, "inputSchema", None),
+                )
+                for tool in response.tools
+            ]
+            logger.info(f"Listed {len(tools)} tools from MCP server '{name}'")
 
-            return MCPToolsResponse(tools=tools)
+        tools_response = MCPToolsResponse.model_construct(tools=tools)
+        _tools_cache[(namespace, name)] = (
+            time.monotonic() + _TOOLS_CACHE_TTL_SECONDS,
+            tools_response,
+        )
+        return tools_response
 
     except ConnectionError as e:
+        await pool.discard(mcp_endpoint)
         logger.error(f"Connection error to MCP server: {e}")
         raise HTTPException(
             status_code=503,
             detail=f"Failed to connect to MCP server at {tool_url}",
         )
     except Exception as e:
+        if not _keeps_session(e):
+            await pool.discard(mcp_endpoint)
         logger.error(f"Unexpected error connecting to MCP server: {e}")
         raise HTTPException(
             status_code=500,
@@ -2098,6 +2363,45 @@ async def connect_to_tool(
         )
 
 
+@router.post(
+    "/{namespace}/{name}/connect",
+    response_model=MCPToolsResponse,
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def connect_to_tool(
+    namespace: str,
+    name: str,
+    pool: MCPSessionPool = Depends(get_mcp_session_pool),
+) -> MCPToolsResponse:
+    """
+    Connect to an MCP server and list available tools.
+
+    This endpoint connects to the MCP server and retrieves the list of
+    available tools using the MCP client library. The initialized session is
+    pooled and reused by later connect/invoke calls for the same tool, and the
+    tool list is cached for a short time since servers rarely change it.
+    Concurrent requests for the same tool share a single upstream call.
+    """
+    key = (namespace, name)
+    cached = _tools_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    task = _tools_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_list_tools_from_server(namespace, name, pool))
+        _tools_inflight[key] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if _tools_inflight.get(key) is done:
+                del _tools_inflight[key]
+
+        task.add_done_callback(_forget)
+
+    # Shielded so one caller going away does not cancel the call for the others
+    return await asyncio.shield(task)
+
+
 @router.post(
     "/{namespace}/{name}/invoke",
     response_model=MCPInvokeResponse,
@@ -2107,55 +2411,33 @@ async def invoke_tool(
     namespace: str,
     name: str,
     request: MCPInvokeRequest,
+    pool: MCPSessionPool = Depends(get_mcp_session_pool),
 ) -> MCPInvokeResponse:
     """
     Invoke an MCP tool with the given arguments.
 
     This endpoint calls a specific tool on the MCP server with
-    the provided arguments and returns the result.
+    the provided arguments and returns the result, reusing the pooled
+    session for the tool when one is open.
     """
     tool_url = _get_tool_url(name, namespace)
     mcp_endpoint = f"{tool_url}/mcp"
 
-    exit_stack = AsyncExitStack()
     try:
-        async with exit_stack:
-            # Connect using MCP streamable-http transport
-            streams_context = streamablehttp_client(url=mcp_endpoint, headers={})
-            read_stream, write_stream, _ = await streams_context.__aenter__()
-
-            # Create and initialize MCP session
-            session_context = ClientSession(read_stream, write_stream)
-            session: ClientSession = await session_context.__aenter__()
-            await session.initialize()
-
-            logger.info(f"MCP session initialized for tool invocation on '{name}'")
-
+        session = await pool.acquire(mcp_endpoint)
+        try:
             # Call the tool using the MCP client library
             result = await session.call_tool(request.tool_name, request.arguments)
+        finally:
+            pool.release(mcp_endpoint, session)
+
+        logger.info(f"Tool '{request.tool_name}' invoked successfully on '{name}'")
 
-            logger.info(f"Tool '{request.tool_name}' invoked successfully on '{name}'")
-
-            # Convert the result to a serializable format
-            result_data = {}
-            if result:
-                if hasattr(result, "content"):
-                    # Extract content from the result
-                    content_list = []
-                    for content_item in result.content:
-                        if hasattr(content_item, "text"):
-                            content_list.append({"type": "text", "text": content_item.text})
-                        elif hasattr(content_item, "data"):
-                            content_list.append({"type": "data", "data": content_item.data})
-                        else:
-                            content_list.append({"type": "unknown", "value": str(content_item)})
-                    result_data["content"] = content_list
-                if hasattr(result, "isError"):
-                    result_data["isError"] = result.isError
-
-            return MCPInvokeResponse(result=result_data)
+        # The result dict is built here from validated MCP types; skip re-validating it
+        return MCPInvokeResponse.model_construct(result=_serialize_tool_result(result))
 
     except ConnectionError as e:
+        await pool.discard(mcp_endpoint)
         logger.error(f"Connection error to MCP server: {e}")
         raise HTTPException(
             status_code=503,
@@ -2164,6 +2446,8 @@ async def invoke_tool(
     except HTTPException:
         raise
     except Exception as e:
+        if not _keeps_session(e):
+            await pool.discard(mcp_endpoint)
         logger.error(f"Unexpected error invoking MCP tool: {e}")
         raise HTTPException(
             status_code=500,
@@ -2171,18 +2455,107 @@ async def invoke_tool(
         )
 
 
+@router.post(
+    "/{namespace}/{name}/batch-invoke",
+    response_model=MCPBatchInvokeResponse,
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def batch_invoke_tools(
+    namespace: str,
+    name: str,
+    request: MCPBatchInvokeRequest,
+    pool: MCPSessionPool = Depends(get_mcp_session_pool),
+) -> MCPBatchInvokeResponse:
+    """
+    Invoke several tools on one MCP server concurrently.
+
+    All invocations share the tool's pooled session and run at most
+    max_concurrent at a time. Each invocation reports its own outcome; with
+    stop_on_error, invocations that have not started when one fails are skipped.
+    """
+    if request.max_concurrent < 1:
+        raise HTTPException(status_code=400, detail="max_concurrent must be at least 1")
+
+    tool_url = _get_tool_url(name, namespace)
+    mcp_endpoint = f"{tool_url}/mcp"
+
+    try:
+        session = await pool.acquire(mcp_endpoint)
+    except ConnectionError as e:
+        logger.error(f"Connection error to MCP server: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to connect to MCP server at {tool_url}",
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error connecting to MCP server: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error connecting to MCP server: {str(e)}",
+        )
+
+    semaphore = asyncio.Semaphore(request.max_concurrent)
+    failed = asyncio.Event()
+    session_broken = False
+
+    async def invoke(index: int, invocation: MCPInvokeRequest) -> MCPBatchInvokeResult:
+        nonlocal session_broken
+        async with semaphore:
+            if request.stop_on_error and failed.is_set():
+                return MCPBatchInvokeResult.model_construct(
+                    index=index,
+                    tool_name=invocation.tool_name,
+                    success=False,
+                    error="Skipped after an earlier invocation failed",
+                )
+            try:
+                result = await session.call_tool(invocation.tool_name, invocation.arguments)
+            except Exception as e:
+                failed.set()
+                if not _keeps_session(e):
+                    session_broken = True
+                logger.error(f"Error invoking MCP tool '{invocation.tool_name}': {e}")
+                return MCPBatchInvokeResult.model_construct(
+                    index=index, tool_name=invocation.tool_name, success=False, error=str(e)
+                )
+            return MCPBatchInvokeResult.model_construct(
+                index=index,
+                tool_name=invocation.tool_name,
+                success=True,
+                result=_serialize_tool_result(result),
+            )
+
+    try:
+        results = await asyncio.gather(
+            *(invoke(index, invocation) for index, invocation in enumerate(request.invocations))
+        )
+    finally:
+        pool.release(mcp_endpoint, session)
+    if session_broken:
+        await pool.discard(mcp_endpoint)
+
+    logger.info(
+        f"Batch invoked {len(results)} tools on '{name}' "
+        f"({sum(r.success for r in results)} succeeded)"
+    )
+    return MCPBatchInvokeResponse.model_construct(results=results)
+
+
 # =============================================================================
 # MIGRATION ENDPOINTS (Phase 5: MCPServer CRD to Deployment migration)
 # =============================================================================
 
 
-def _build_deployment_from_mcpserver(mcpserver: Dict, namespace: str) -> Dict:
+def _build_deployment_from_mcpserver(
+    mcpserver: Dict, namespace: str, migration_timestamp: Optional[str] = None
+) -> Dict:
     """
     Build a Kubernetes Deployment manifest from an MCPServer CRD.
 
     Args:
         mcpserver: The MCPServer CRD resource dictionary.
         namespace: Kubernetes namespace.
+        migration_timestamp: ISO timestamp recorded as the migration time (default: now).
 
     Returns:
         Deployment manifest dictionary.
@@ -2191,25 +2564,20 @@ def _build_deployment_from_mcpserver(mcpserver: Dict, namespace: str) -> Dict:
     spec = mcpserver.get("spec", {})
     name = metadata.get("name", "")
 
-    # Get labels from MCPServer CRD and update for Deployment
-    labels = metadata.get("labels", {}).copy()
-
-    # Ensure required labels are set
-    labels[KAGENTI_TYPE_LABEL] = RESOURCE_TYPE_TOOL
-    labels[APP_KUBERNETES_IO_NAME] = name
-    labels[f"{PROTOCOL_LABEL_PREFIX}{VALUE_PROTOCOL_MCP}"] = ""
-    labels[KAGENTI_TRANSPORT_LABEL] = VALUE_TRANSPORT_STREAMABLE_HTTP
-    labels[KAGENTI_WORKLOAD_TYPE_LABEL] = WORKLOAD_TYPE_DEPLOYMENT
-    labels[APP_KUBERNETES_IO_MANAGED_BY] = KAGENTI_UI_CREATOR_LABEL
-
-    # Preserve framework label if present
-    if KAGENTI_FRAMEWORK_LABEL not in labels:
-        labels[KAGENTI_FRAMEWORK_LABEL] = "Python"
+    # Labels from the MCPServer CRD, defaulting the framework and enforcing the required labels
+    labels = {
+        KAGENTI_FRAMEWORK_LABEL: "Python",
+        **metadata.get("labels", _EMPTY),
+        **_MIGRATED_DEPLOYMENT_LABELS,
+        APP_KUBERNETES_IO_NAME: name,
+    }
 
     # Build annotations with migration tracking
     annotations = metadata.get("annotations", {}).copy()
     annotations[MIGRATION_SOURCE_ANNOTATION] = MIGRATION_SOURCE_MCPSERVER_CRD
-    annotations[MIGRATION_TIMESTAMP_ANNOTATION] = datetime.now(timezone.utc).isoformat()
+    annotations[MIGRATION_TIMESTAMP_ANNOTATION] = (
+        migration_timestamp or datetime.now(timezone.utc).isoformat()
+    )
     annotations[ORIGINAL_SERVICE_ANNOTATION] = _get_toolhive_service_name(name)
 
     # Get image from spec
@@ -2229,67 +2597,34 @@ def _build_deployment_from_mcpserver(mcpserver: Dict, namespace: str) -> Dict:
     if containers:
         # Use existing container configuration
         container = containers[0].copy()
-        # Ensure image is set (override if different in spec.image)
-        if image:
-            container["image"] = image
-        # Ensure imagePullPolicy is set
-        if "imagePullPolicy" not in container:
-            container["imagePullPolicy"] = "Always"
-        # Ensure ports are set
+        # spec.image (checked above) overrides the pod template's image
+        container["image"] = image
+        # Fill in what the container does not set; the shared defaults are referenced as-is
+        container.setdefault("imagePullPolicy", "Always")
+        container.setdefault("resources", _TOOL_CONTAINER_RESOURCES)
         if "ports" not in container:
             container["ports"] = [{"name": "http", "containerPort": target_port, "protocol": "TCP"}]
-        # Ensure resources are set
-        if "resources" not in container:
-            container["resources"] = {
-                "limits": DEFAULT_RESOURCE_LIMITS,
-                "requests": DEFAULT_RESOURCE_REQUESTS,
-            }
-        # Ensure volumeMounts are set
         if "volumeMounts" not in container:
-            container["volumeMounts"] = [
-                {"name": "cache", "mountPath": "/app/.cache"},
-                {"name": "tmp", "mountPath": "/tmp"},
-            ]
+            container["volumeMounts"] = list(_TOOL_VOLUME_MOUNTS)
     else:
         # Build default container spec
-        env_vars = list(DEFAULT_ENV_VARS)
         container = {
             "name": "mcp",
             "image": image,
             "imagePullPolicy": "Always",
-            "env": env_vars,
+            "env": DEFAULT_ENV_VARS,
             "ports": [{"name": "http", "containerPort": target_port, "protocol": "TCP"}],
-            "resources": {
-                "limits": DEFAULT_RESOURCE_LIMITS,
-                "requests": DEFAULT_RESOURCE_REQUESTS,
-            },
-            "volumeMounts": [
-                {"name": "cache", "mountPath": "/app/.cache"},
-                {"name": "tmp", "mountPath": "/tmp"},
-            ],
-            "securityContext": {
-                "allowPrivilegeEscalation": False,
-                "capabilities": {"drop": ["ALL"]},
-                "runAsUser": 1000,
-            },
+            "resources": _TOOL_CONTAINER_RESOURCES,
+            "volumeMounts": list(_TOOL_VOLUME_MOUNTS),
+            "securityContext": _TOOL_CONTAINER_SECURITY_CONTEXT,
         }
 
     # Get volumes from pod template or use defaults
-    volumes = pod_spec.get(
-        "volumes",
-        [
-            {"name": "cache", "emptyDir": {}},
-            {"name": "tmp", "emptyDir": {}},
-        ],
-    )
+    volumes = pod_spec["volumes"] if "volumes" in pod_spec else list(_TOOL_VOLUMES)
 
     # Get security context from pod template or use defaults
-    security_context = pod_spec.get(
-        "securityContext",
-        {
-            "runAsNonRoot": True,
-            "seccompProfile": {"type": "RuntimeDefault"},
-        },
+    security_context = (
+        pod_spec["securityContext"] if "securityContext" in pod_spec else _TOOL_POD_SECURITY_CONTEXT
     )
 
     # Get image pull secrets
@@ -2304,16 +2639,13 @@ def _build_deployment_from_mcpserver(mcpserver: Dict, namespace: str) -> Dict:
         APP_KUBERNETES_IO_NAME: name,
     }
 
-    # Build pod template labels
+    # Build pod template labels on top of the selector labels (labels always has a framework)
     pod_labels = {
-        KAGENTI_TYPE_LABEL: RESOURCE_TYPE_TOOL,
-        APP_KUBERNETES_IO_NAME: name,
-        f"{PROTOCOL_LABEL_PREFIX}{VALUE_PROTOCOL_MCP}": "",
+        **selector_labels,
+        _MCP_PROTOCOL_LABEL: "",
         KAGENTI_TRANSPORT_LABEL: VALUE_TRANSPORT_STREAMABLE_HTTP,
+        KAGENTI_FRAMEWORK_LABEL: labels[KAGENTI_FRAMEWORK_LABEL],
     }
-    # Add framework if present
-    if KAGENTI_FRAMEWORK_LABEL in labels:
-        pod_labels[KAGENTI_FRAMEWORK_LABEL] = labels[KAGENTI_FRAMEWORK_LABEL]
 
     # Propagate inject label to pod template so the webhook can read it
     if KAGENTI_INJECT_LABEL in labels:
@@ -2379,7 +2711,7 @@ def _build_service_from_mcpserver(mcpserver: Dict, namespace: str) -> Dict:
     # Get labels
     labels = {
         KAGENTI_TYPE_LABEL: RESOURCE_TYPE_TOOL,
-        f"{PROTOCOL_LABEL_PREFIX}{VALUE_PROTOCOL_MCP}": "",
+        _MCP_PROTOCOL_LABEL: "",
         APP_KUBERNETES_IO_NAME: name,
         APP_KUBERNETES_IO_MANAGED_BY: KAGENTI_UI_CREATOR_LABEL,
     }
@@ -2417,6 +2749,35 @@ def _build_service_from_mcpserver(mcpserver: Dict, namespace: str) -> Dict:
     }
 
 
+async def _list_workload_names(
+    kube: KubernetesService, namespace: str
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    List the names of all Deployments and StatefulSets in a namespace.
+
+    Answers whether MCPServer CRDs already have a workload with one list call per
+    kind rather than a get per CRD. Like those gets, the lists are not filtered by
+    label, so a workload that is not labelled as a tool still blocks a migration.
+
+    Returns:
+        Tuple of (Deployment names, StatefulSet names).
+
+    Raises:
+        HTTPException: If a list fails, as existing workloads cannot be ruled out.
+    """
+    try:
+        deployments, statefulsets = await asyncio.gather(
+            asyncio.to_thread(kube.list_deployments, namespace=namespace),
+            asyncio.to_thread(kube.list_statefulsets, namespace=namespace),
+        )
+    except ApiException as e:
+        raise HTTPException(status_code=e.status, detail=str(e.reason))
+    return (
+        frozenset(d.get("metadata", {}).get("name") for d in deployments),
+        frozenset(s.get("metadata", {}).get("name") for s in statefulsets),
+    )
+
+
 @router.get(
     "/migration/migratable",
     response_model=ListMigratableToolsResponse,
@@ -2435,69 +2796,61 @@ async def list_migratable_tools(
     already exists (indicating migration is complete).
     """
     try:
-        # List MCPServer CRDs with kagenti.io/type=tool label
-        mcpserver_crds = kube.list_custom_resources(
-            group=TOOLHIVE_CRD_GROUP,
-            version=TOOLHIVE_CRD_VERSION,
-            namespace=namespace,
-            plural=TOOLHIVE_MCP_PLURAL,
-            label_selector=f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_TOOL}",
+        # List MCPServer CRDs with kagenti.io/type=tool label, and the existing Deployments
+        # and StatefulSets to check for already-migrated tools
+        mcpserver_crds, existing_deployments, existing_statefulsets = await asyncio.gather(
+            asyncio.to_thread(
+                kube.list_custom_resources,
+                group=TOOLHIVE_CRD_GROUP,
+                version=TOOLHIVE_CRD_VERSION,
+                namespace=namespace,
+                plural=TOOLHIVE_MCP_PLURAL,
+                label_selector=_TOOL_LABEL_SELECTOR,
+            ),
+            _list_tool_resources(
+                "Deployments",
+                partial(
+                    kube.list_deployments, namespace=namespace, label_selector=_TOOL_LABEL_SELECTOR
+                ),
+            ),
+            _list_tool_resources(
+                "StatefulSets",
+                partial(
+                    kube.list_statefulsets,
+                    namespace=namespace,
+                    label_selector=_TOOL_LABEL_SELECTOR,
+                ),
+            ),
         )
     except ApiException as e:
         if e.status == 404:
             # CRD not installed
-            return ListMigratableToolsResponse(tools=[], total=0, already_migrated=0)
+            return ListMigratableToolsResponse.model_construct(
+                tools=[], total=0, already_migrated=0
+            )
         raise HTTPException(status_code=e.status, detail=str(e.reason))
-
-    # Get list of existing Deployments and StatefulSets to check for already-migrated tools
-    existing_deployment_names = set()
-    existing_statefulset_names = set()
-
-    try:
-        existing_deployments = kube.list_deployments(
-            namespace=namespace,
-            label_selector=f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_TOOL}",
-        )
-        existing_deployment_names = {
-            d.get("metadata", {}).get("name") for d in existing_deployments
-        }
-    except ApiException:
-        # If listing deployments fails, continue with empty set - not critical for operation
-        pass
-
-    try:
-        existing_statefulsets = kube.list_statefulsets(
-            namespace=namespace,
-            label_selector=f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_TOOL}",
-        )
-        existing_statefulset_names = {
-            s.get("metadata", {}).get("name") for s in existing_statefulsets
-        }
-    except ApiException:
-        # If listing statefulsets fails, continue with empty set - not critical for operation
-        pass
+    existing_deployment_names = {d.get("metadata", {}).get("name") for d in existing_deployments}
+    existing_statefulset_names = {s.get("metadata", {}).get("name") for s in existing_statefulsets}
 
     tools = []
-    already_migrated = 0
 
     for mcpserver in mcpserver_crds:
-        metadata = mcpserver.get("metadata", {})
+        # Bind each nested field once; missing or null fields share the read-only _EMPTY
+        metadata = mcpserver.get("metadata") or _EMPTY
+        annotations = metadata.get("annotations") or _EMPTY
         name = metadata.get("name", "")
-        labels = metadata.get("labels", {})
+        labels = metadata.get("labels") or {}
         has_deployment = name in existing_deployment_names
         has_statefulset = name in existing_statefulset_names
 
-        if has_deployment or has_statefulset:
-            already_migrated += 1
-
         # Get description from annotations
-        description = metadata.get("annotations", {}).get(KAGENTI_DESCRIPTION_ANNOTATION, "")
+        description = annotations.get(KAGENTI_DESCRIPTION_ANNOTATION, "")
 
         # Determine status
         status = _is_mcpserver_ready(mcpserver)
 
         tools.append(
-            MigratableToolInfo(
+            MigratableToolInfo.model_construct(
                 name=name,
                 namespace=namespace,
                 status=status,
@@ -2510,38 +2863,50 @@ async def list_migratable_tools(
             )
         )
 
-    return ListMigratableToolsResponse(
+    # Tools with a Deployment or StatefulSet have already been migrated
+    already_migrated = len(
+        {tool.name for tool in tools} & (existing_deployment_names | existing_statefulset_names)
+    )
+
+    return ListMigratableToolsResponse.model_construct(
         tools=tools,
         total=len(tools),
         already_migrated=already_migrated,
     )
 
 
-@router.post(
-    "/{namespace}/{name}/migrate",
-    response_model=MigrateToolResponse,
-    summary="Migrate an MCPServer CRD to a Deployment",
-    tags=["migration"],
-    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
-)
-async def migrate_tool(
+async def _tool_workload_exists(get_fn: Callable[[], Any]) -> bool:
+    """Run a workload get in a worker thread and report whether the workload exists."""
+    try:
+        await asyncio.to_thread(get_fn)
+        return True
+    except ApiException as e:
+        if e.status != 404:
+            raise HTTPException(status_code=e.status, detail=str(e.reason))
+        return False
+
+
+async def _migrate_tool(
     namespace: str,
     name: str,
-    request: MigrateToolRequest = MigrateToolRequest(),
-    kube: KubernetesService = Depends(get_kubernetes_service),
+    request: MigrateToolRequest,
+    kube: KubernetesService,
+    migration_timestamp: Optional[str] = None,
+    existing_workload_names: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = None,
 ) -> MigrateToolResponse:
     """
-    Migrate an MCPServer CRD to a Deployment.
+    Migrate one MCPServer CRD to a Deployment (see migrate_tool).
 
-    This endpoint:
-    1. Reads the existing MCPServer CRD specification
-    2. Creates a Deployment with the same pod template
-    3. Creates a Service with new naming convention ({name}-mcp)
-    4. Optionally deletes the MCPServer CRD (if delete_old=True)
-
-    Note: After migration, MCP connection URLs need to be updated:
-    - Old: http://mcp-{name}-proxy.{namespace}.svc.cluster.local:8000/mcp
-    - New: http://{name}-mcp.{namespace}.svc.cluster.local:8000/mcp
+    Args:
+        namespace: Kubernetes namespace
+        name: Name of the MCPServer CRD
+        request: Migration options
+        kube: Kubernetes service
+        migration_timestamp: Migration timestamp to record on the Deployment, so a batch
+            migration records one time for all tools (default: now)
+        existing_workload_names: Names of the tool Deployments and StatefulSets in the
+            namespace, as from _list_workload_names. Used instead of getting the
+            tool's Deployment and StatefulSet when given.
     """
     logger.info(f"Starting migration of MCPServer CRD '{name}' in namespace '{namespace}'")
 
@@ -2561,7 +2926,8 @@ async def migrate_tool(
 
     # Step 1: Get the MCPServer CRD
     try:
-        mcpserver = kube.get_custom_resource(
+        mcpserver = await asyncio.to_thread(
+            kube.get_custom_resource,
             group=TOOLHIVE_CRD_GROUP,
             version=TOOLHIVE_CRD_VERSION,
             namespace=namespace,
@@ -2576,48 +2942,38 @@ async def migrate_tool(
             )
         raise HTTPException(status_code=e.status, detail=str(e.reason))
 
-    # Step 2: Check if Deployment already exists
-    try:
-        kube.get_deployment(namespace=namespace, name=name)
-        # Deployment already exists - skip migration
-        return MigrateToolResponse(
-            success=True,
-            name=name,
-            namespace=namespace,
-            message=f"Tool '{name}' already has a Deployment. Migration skipped.",
-            deployment_created=False,
-            service_created=False,
-            mcpserver_deleted=False,
-            old_service_name=old_service_name,
-            new_service_name=new_service_name,
+    # Steps 2 and 3: Skip tools that already have a Deployment or StatefulSet
+    if existing_workload_names is not None:
+        existing_deployments, existing_statefulsets = existing_workload_names
+        has_deployment = name in existing_deployments
+        has_statefulset = not has_deployment and name in existing_statefulsets
+    else:
+        has_deployment = await _tool_workload_exists(
+            partial(kube.get_deployment, namespace=namespace, name=name)
         )
-    except ApiException as e:
-        if e.status != 404:
-            raise HTTPException(status_code=e.status, detail=str(e.reason))
-
-    # Step 3: Check if StatefulSet already exists
-    try:
-        kube.get_statefulset(namespace=namespace, name=name)
-        # StatefulSet already exists - skip migration
-        return MigrateToolResponse(
+        has_statefulset = not has_deployment and await _tool_workload_exists(
+            partial(kube.get_statefulset, namespace=namespace, name=name)
+        )
+    if has_deployment or has_statefulset:
+        existing_kind = "Deployment" if has_deployment else "StatefulSet"
+        return MigrateToolResponse.model_construct(
             success=True,
             name=name,
             namespace=namespace,
-            message=f"Tool '{name}' already has a StatefulSet. Migration skipped.",
+            message=f"Tool '{name}' already has a {existing_kind}. Migration skipped.",
             deployment_created=False,
             service_created=False,
             mcpserver_deleted=False,
             old_service_name=old_service_name,
             new_service_name=new_service_name,
         )
-    except ApiException as e:
-        if e.status != 404:
-            raise HTTPException(status_code=e.status, detail=str(e.reason))
 
     # Step 4: Build and create Deployment
     try:
-        deployment_manifest = _build_deployment_from_mcpserver(mcpserver, namespace)
-        kube.create_deployment(namespace, deployment_manifest)
+        deployment_manifest = _build_deployment_from_mcpserver(
+            mcpserver, namespace, migration_timestamp
+        )
+        await asyncio.to_thread(kube.create_deployment, namespace, deployment_manifest)
         deployment_created = True
         logger.info(f"Created Deployment '{name}'")
     except ValueError as e:
@@ -2630,14 +2986,14 @@ async def migrate_tool(
 
     # Step 5: Check if new Service already exists, create if not
     try:
-        kube.get_service(namespace=namespace, name=new_service_name)
+        await asyncio.to_thread(kube.get_service, namespace=namespace, name=new_service_name)
         logger.info(f"Service '{new_service_name}' already exists")
     except ApiException as e:
         if e.status == 404:
             # Create new Service
             try:
                 service_manifest = _build_service_from_mcpserver(mcpserver, namespace)
-                kube.create_service(namespace, service_manifest)
+                await asyncio.to_thread(kube.create_service, namespace, service_manifest)
                 service_created = True
                 logger.info(f"Created Service '{new_service_name}'")
             except ApiException as e2:
@@ -2649,7 +3005,8 @@ async def migrate_tool(
     # Step 6: Delete MCPServer CRD (if requested)
     if request.delete_old:
         try:
-            kube.delete_custom_resource(
+            await asyncio.to_thread(
+                kube.delete_custom_resource,
                 group=TOOLHIVE_CRD_GROUP,
                 version=TOOLHIVE_CRD_VERSION,
                 namespace=namespace,
@@ -2662,7 +3019,7 @@ async def migrate_tool(
             logger.error(f"Failed to delete MCPServer CRD '{name}': {e}")
             # Continue - this is not fatal
 
-    return MigrateToolResponse(
+    return MigrateToolResponse.model_construct(
         success=True,
         name=name,
         namespace=namespace,
@@ -2676,6 +3033,35 @@ async def migrate_tool(
     )
 
 
+@router.post(
+    "/{namespace}/{name}/migrate",
+    response_model=MigrateToolResponse,
+    summary="Migrate an MCPServer CRD to a Deployment",
+    tags=["migration"],
+    dependencies=[Depends(require_roles(ROLE_OPERATOR))],
+)
+async def migrate_tool(
+    namespace: str,
+    name: str,
+    request: MigrateToolRequest = MigrateToolRequest(),
+    kube: KubernetesService = Depends(get_kubernetes_service),
+) -> MigrateToolResponse:
+    """
+    Migrate an MCPServer CRD to a Deployment.
+
+    This endpoint:
+    1. Reads the existing MCPServer CRD specification
+    2. Creates a Deployment with the same pod template
+    3. Creates a Service with new naming convention ({name}-mcp)
+    4. Optionally deletes the MCPServer CRD (if delete_old=True)
+
+    Note: After migration, MCP connection URLs need to be updated:
+    - Old: http://mcp-{name}-proxy.{namespace}.svc.cluster.local:8000/mcp
+    - New: http://{name}-mcp.{namespace}.svc.cluster.local:8000/mcp
+    """
+    return await _migrate_tool(namespace, name, request, kube)
+
+
 @router.post(
     "/migration/migrate-all",
     response_model=BatchMigrateToolsResponse,
@@ -2700,16 +3086,17 @@ async def batch_migrate_tools(
 
     # List all MCPServer CRDs with kagenti.io/type=tool label
     try:
-        mcpserver_crds = kube.list_custom_resources(
+        mcpserver_crds = await asyncio.to_thread(
+            kube.list_custom_resources,
             group=TOOLHIVE_CRD_GROUP,
             version=TOOLHIVE_CRD_VERSION,
             namespace=namespace,
             plural=TOOLHIVE_MCP_PLURAL,
-            label_selector=f"{KAGENTI_TYPE_LABEL}={RESOURCE_TYPE_TOOL}",
+            label_selector=_TOOL_LABEL_SELECTOR,
         )
     except ApiException as e:
         if e.status == 404:
-            return BatchMigrateToolsResponse(
+            return BatchMigrateToolsResponse.model_construct(
                 total=0,
                 migrated=0,
                 skipped=0,
@@ -2724,100 +3111,108 @@ async def batch_migrate_tools(
     skipped = 0
     failed = 0
 
-    for mcpserver in mcpserver_crds:
-        mcpserver_name = mcpserver.get("metadata", {}).get("name", "")
-        old_service_name = _get_toolhive_service_name(mcpserver_name)
-        new_service_name = _get_tool_service_name(mcpserver_name)
-
-        if request.dry_run:
-            # Dry run - check if would be migrated or skipped
-            would_skip = False
-            try:
-                kube.get_deployment(namespace=namespace, name=mcpserver_name)
-                would_skip = True
-            except ApiException:
-                logging.debug(
-                    "Deployment %s not found in namespace %s during dry-run migration",
-                    mcpserver_name,
-                    namespace,
-                )
+    if not request.dry_run:
+        # Actual migration, running several tools' API calls concurrently
+        semaphore = asyncio.Semaphore(_MIGRATION_CONCURRENCY)
+        migration_timestamp = datetime.now(timezone.utc).isoformat()
+        # One list per workload kind instead of two gets per tool
+        existing_workload_names = await _list_workload_names(kube, namespace)
+        migrate_request = MigrateToolRequest(
+            workload_type=request.workload_type,
+            delete_old=request.delete_old,
+        )
 
-            if not would_skip:
+        async def migrate_one(mcpserver_name: str) -> MigrateToolResponse:
+            async with semaphore:
                 try:
-                    kube.get_statefulset(namespace=namespace, name=mcpserver_name)
-                    would_skip = True
-                except ApiException:
-                    logging.debug(
-                        "StatefulSet %s not found in namespace %s during dry-run migration",
-                        mcpserver_name,
+                    return await _migrate_tool(
                         namespace,
+                        mcpserver_name,
+                        migrate_request,
+                        kube,
+                        migration_timestamp=migration_timestamp,
+                        existing_workload_names=existing_workload_names,
                     )
-
-            if would_skip:
-                skipped += 1
-                results.append(
-                    MigrateToolResponse(
-                        success=True,
+                except HTTPException as e:
+                    return MigrateToolResponse.model_construct(
+                        success=False,
                         name=mcpserver_name,
                         namespace=namespace,
-                        message="Would be skipped (Deployment/StatefulSet already exists)",
+                        message=f"Migration failed: {e.detail}",
                         deployment_created=False,
                         service_created=False,
                         mcpserver_deleted=False,
-                        old_service_name=old_service_name,
-                        new_service_name=new_service_name,
+                        old_service_name=_get_toolhive_service_name(mcpserver_name),
+                        new_service_name=_get_tool_service_name(mcpserver_name),
                     )
-                )
-            else:
+
+        results = await asyncio.gather(
+            *(
+                migrate_one(mcpserver.get("metadata", {}).get("name", ""))
+                for mcpserver in mcpserver_crds
+            )
+        )
+        for result in results:
+            if not result.success:
+                failed += 1
+            elif result.deployment_created:
                 migrated += 1
-                results.append(
-                    MigrateToolResponse(
-                        success=True,
-                        name=mcpserver_name,
-                        namespace=namespace,
-                        message="Would be migrated",
-                        deployment_created=True,
-                        service_created=True,
-                        mcpserver_deleted=request.delete_old,
-                        old_service_name=old_service_name,
-                        new_service_name=new_service_name,
-                    )
+            else:
+                skipped += 1
+
+        return BatchMigrateToolsResponse.model_construct(
+            total=len(results),
+            migrated=migrated,
+            skipped=skipped,
+            failed=failed,
+            results=results,
+            dry_run=request.dry_run,
+        )
+
+    # Dry run - check which tools would be migrated or skipped
+    existing_deployment_names, existing_statefulset_names = await _list_workload_names(
+        kube, namespace
+    )
+    for mcpserver in mcpserver_crds:
+        mcpserver_name = mcpserver.get("metadata", {}).get("name", "")
+        old_service_name = _get_toolhive_service_name(mcpserver_name)
+        new_service_name = _get_tool_service_name(mcpserver_name)
+
+        if (
+            mcpserver_name in existing_deployment_names
+            or mcpserver_name in existing_statefulset_names
+        ):
+            skipped += 1
+            results.append(
+                MigrateToolResponse.model_construct(
+                    success=True,
+                    name=mcpserver_name,
+                    namespace=namespace,
+                    message="Would be skipped (Deployment/StatefulSet already exists)",
+                    deployment_created=False,
+                    service_created=False,
+                    mcpserver_deleted=False,
+                    old_service_name=old_service_name,
+                    new_service_name=new_service_name,
                 )
+            )
         else:
-            # Actual migration
-            try:
-                result = await migrate_tool(
-                    namespace=namespace,
+            migrated += 1
+            results.append(
+                MigrateToolResponse.model_construct(
+                    success=True,
                     name=mcpserver_name,
-                    request=MigrateToolRequest(
-                        workload_type=request.workload_type,
-                        delete_old=request.delete_old,
-                    ),
-                    kube=kube,
-                )
-                results.append(result)
-
-                if result.deployment_created:
-                    migrated += 1
-                else:
-                    skipped += 1
-            except HTTPException as e:
-                failed += 1
-                results.append(
-                    MigrateToolResponse(
-                        success=False,
-                        name=mcpserver_name,
-                        namespace=namespace,
-                        message=f"Migration failed: {e.detail}",
-                        deployment_created=False,
-                        service_created=False,
-                        mcpserver_deleted=False,
-                        old_service_name=old_service_name,
-                        new_service_name=new_service_name,
-                    )
+                    namespace=namespace,
+                    message="Would be migrated",
+                    deployment_created=True,
+                    service_created=True,
+                    mcpserver_deleted=request.delete_old,
+                    old_service_name=old_service_name,
+                    new_service_name=new_service_name,
                 )
+            )
 
-    return BatchMigrateToolsResponse(
+    return BatchMigrateToolsResponse.model_construct(
         total=len(results),
         migrated=migrated,
         skipped=skipped,
@@ -8,18 +8,71 @@ Kubernetes service for API client management and common operations.
 import logging
 import os
 from functools import lru_cache
-from typing import List, Optional
+from typing import Any, Callable, Iterator, List, Optional
 
 import kubernetes.client
 import kubernetes.config
 from kubernetes.client import ApiException
 from kubernetes.config import ConfigException
 
+from app.core.config import settings
 from app.core.constants import ENABLED_NAMESPACE_LABEL_KEY, ENABLED_NAMESPACE_LABEL_VALUE
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_list_pages(
+    list_fn: Callable[..., Any],
+    continue_token: Callable[[Any], Optional[str]],
+    resource_version: Optional[str] = None,
+    limit: Optional[int] = None,
+    **kwargs,
+) -> Iterator[Any]:
+    """Call a Kubernetes list API, following continue tokens when paginating.
+
+    Args:
+        list_fn: Kubernetes client list method
+        continue_token: Extracts the continue token from a list response
+        resource_version: Resource version to list at; "0" serves the list from the
+            API server watch cache instead of a quorum read from etcd
+        limit: Page size; when set, every page is fetched. Not sent with
+            resource_version "0", as the API server answers those lists from its watch
+            cache in one response regardless of limit.
+        **kwargs: Arguments forwarded to list_fn
+
+    Yields:
+        Raw list responses, one per page
+    """
+    if resource_version is not None:
+        kwargs["resource_version"] = resource_version
+        kwargs["resource_version_match"] = "NotOlderThan"
+    if limit is None or resource_version == "0":
+        yield list_fn(**kwargs)
+        return
+
+    kwargs["limit"] = limit
+    while True:
+        page = list_fn(**kwargs)
+        yield page
+        token = continue_token(page)
+        if not token:
+            return
+        # The API server rejects resourceVersion combined with a continue token
+        kwargs.pop("resource_version", None)
+        kwargs.pop("resource_version_match", None)
+        kwargs["_continue"] = token
+
+
+def _typed_continue_token(page: Any) -> Optional[str]:
+    """Return the continue token of a typed list response."""
+    return page.metadata._continue if page.metadata else None
+
+
+def _dict_continue_token(page: dict) -> Optional[str]:
+    """Return the continue token of a custom object list response."""
+    return (page.get("metadata") or {}).get("continue")
+
+
 class KubernetesService:
     """Service class for Kubernetes API interactions."""
 
@@ -40,7 +93,9 @@ class KubernetesService:
                 logger.info("Loading kubeconfig from default location")
                 kubernetes.config.load_kube_config()
 
-            return kubernetes.client.ApiClient()
+            configuration = kubernetes.client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = settings.kubernetes_connection_pool_maxsize
+            return kubernetes.client.ApiClient(configuration)
 
         except ConfigException as e:
             logger.error(f"Failed to load Kubernetes config: {e}")
@@ -102,17 +157,29 @@ class KubernetesService:
         namespace: str,
         plural: str,
         label_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[dict]:
-        """List custom resources in a namespace."""
+        """List custom resources in a namespace.
+
+        Pass resource_version="0" to read from the API server watch cache, or
+        limit to fetch the list from etcd in pages.
+        """
         try:
-            response = self.custom_api.list_namespaced_custom_object(
+            items = []
+            for page in _iter_list_pages(
+                self.custom_api.list_namespaced_custom_object,
+                _dict_continue_token,
+                resource_version=resource_version,
+                limit=limit,
                 group=group,
                 version=version,
                 namespace=namespace,
                 plural=plural,
                 label_selector=label_selector,
-            )
-            return response.get("items", [])
+            ):
+                items.extend(page.get("items", []))
+            return items
         except ApiException as e:
             logger.error(f"Error listing {plural} in {namespace}: {e}")
             raise
@@ -227,14 +294,30 @@ class KubernetesService:
             logger.error(f"Error getting Deployment {name} in {namespace}: {e}")
             raise
 
-    def list_deployments(self, namespace: str, label_selector: Optional[str] = None) -> List[dict]:
-        """List Deployments in a namespace with optional label selector."""
+    def list_deployments(
+        self,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """List Deployments in a namespace with optional label selector.
+
+        Pass resource_version="0" to read from the API server watch cache, or
+        limit to fetch the list from etcd in pages.
+        """
         try:
-            result = self.apps_api.list_namespaced_deployment(
+            items = []
+            for page in _iter_list_pages(
+                self.apps_api.list_namespaced_deployment,
+                _typed_continue_token,
+                resource_version=resource_version,
+                limit=limit,
                 namespace=namespace,
                 label_selector=label_selector,
-            )
-            return [item.to_dict() for item in result.items]
+            ):
+                items.extend(item.to_dict() for item in page.items)
+            return items
         except ApiException as e:
             logger.error(f"Error listing Deployments in {namespace}: {e}")
             raise
@@ -342,14 +425,30 @@ class KubernetesService:
             logger.error(f"Error getting StatefulSet {name} in {namespace}: {e}")
             raise
 
-    def list_statefulsets(self, namespace: str, label_selector: Optional[str] = None) -> List[dict]:
-        """List StatefulSets in a namespace with optional label selector."""
+    def list_statefulsets(
+        self,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        resource_version: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """List StatefulSets in a namespace with optional label selector.
+
+        Pass resource_version="0" to read from the API server watch cache, or
+        limit to fetch the list from etcd in pages.
+        """
         try:
-            result = self.apps_api.list_namespaced_stateful_set(
+            items = []
+            for page in _iter_list_pages(
+                self.apps_api.list_namespaced_stateful_set,
+                _typed_continue_token,
+                resource_version=resource_version,
+                limit=limit,
                 namespace=namespace,
                 label_selector=label_selector,
-            )
-            return [item.to_dict() for item in result.items]
+            ):
+                items.extend(item.to_dict() for item in page.items)
+            return items
         except ApiException as e:
             logger.error(f"Error listing StatefulSets in {namespace}: {e}")
             raise
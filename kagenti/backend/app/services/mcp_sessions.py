@@ -0,0 +1,268 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Pooled MCP client sessions.
+
+Opening an MCP session costs a new HTTP connection plus the initialize
+handshake, so sessions to tool servers are kept open and reused across
+requests. Each session is owned by a background task that enters and exits
+its transport and session contexts, because the anyio scopes inside the MCP
+client must be closed by the task that opened them.
+
+The MCP client package is imported when the first session is opened rather
+than at module import, so it does not add to backend startup time.
+"""
+
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from mcp import ClientSession
+
+logger = logging.getLogger(__name__)
+
+# Sessions idle for longer than this are pinged before being handed out again
+SESSION_HEALTH_CHECK_AFTER_SECONDS = 30
+# How often the sweeper looks for idle sessions
+SESSION_SWEEP_INTERVAL_SECONDS = 30
+# Upper bound of the cooldown after failed connects, during which new connects fail fast
+CONNECT_BACKOFF_MAX_SECONDS = 60
+# Connection limits of the HTTP pool shared by all MCP sessions
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Transport view onto a shared connection pool that closing a client leaves open.
+
+    The MCP client closes the httpx client of a session when the session ends, and
+    a client closes its transport; this wrapper keeps that from closing the pool.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _PooledSession:
+    """An initialized ClientSession kept open by its own background task."""
+
+    def __init__(self, endpoint: str, http_client_factory: Callable[..., httpx.AsyncClient]):
+        self.endpoint = endpoint
+        self._http_client_factory = http_client_factory
+        self.session: Optional[ClientSession] = None
+        self.last_used = time.monotonic()
+        # Callers that acquired the session and have not released it yet
+        self.in_use = 0
+        self._close_requested = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def open(self) -> None:
+        """Connect and initialize the session, raising if that fails."""
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        await ready
+
+    async def _run(self, ready: asyncio.Future) -> None:
+        from mcp import ClientSession
+        from mcp.client.streamable_http import streamablehttp_client
+
+        try:
+            async with streamablehttp_client(
+                url=self.endpoint, headers={}, httpx_client_factory=self._http_client_factory
+            ) as (
+                read_stream,
+                write_stream,
+                _,
+            ):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    self.session = session
+                    ready.set_result(None)
+                    await self._close_requested.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP session to {self.endpoint} closed with error: {e}")
+        finally:
+            self.session = None
+            if not ready.done():
+                ready.cancel()
+
+    @property
+    def is_open(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def is_healthy(self) -> bool:
+        """Check the session is open, pinging it if it has been idle for a while."""
+        if not self.is_open:
+            return False
+        if time.monotonic() - self.last_used < SESSION_HEALTH_CHECK_AFTER_SECONDS:
+            return True
+        try:
+            await self.session.send_ping()
+            return True
+        except Exception as e:
+            logger.info(f"MCP session to {self.endpoint} failed health check: {e}")
+            return False
+
+    async def close(self) -> None:
+        """Close the session and wait for its task to finish."""
+        self._close_requested.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception as e:
+                logger.warning(f"Error closing MCP session to {self.endpoint}: {e}")
+
+
+class MCPSessionPool:
+    """Initialized MCP client sessions, one per tool server endpoint."""
+
+    def __init__(self):
+        self._sessions: Dict[str, _PooledSession] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Per endpoint: consecutive failed connects and when the next attempt is allowed
+        self._connect_failures: Dict[str, Tuple[int, float]] = {}
+        # One keep-alive connection pool for all sessions, so reconnects and
+        # sessions to the same server reuse open TCP connections
+        self._http_transport = httpx.AsyncHTTPTransport(limits=HTTP_POOL_LIMITS)
+
+    def _create_http_client(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        auth: Optional[httpx.Auth] = None,
+    ) -> httpx.AsyncClient:
+        """httpx client factory for the MCP transport, backed by the shared pool."""
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout if timeout is not None else httpx.Timeout(30.0, read=300.0),
+            auth=auth,
+            follow_redirects=True,
+            transport=_SharedTransport(self._http_transport),
+        )
+
+    async def acquire(self, endpoint: str) -> "ClientSession":
+        """
+        Get an initialized session for an MCP endpoint, connecting if needed.
+
+        Args:
+            endpoint: MCP endpoint URL (e.g. http://weather-mcp.team1.svc.cluster.local:8000/mcp)
+
+        Returns:
+            An initialized ClientSession. It stays owned by the pool and must not be
+            closed by the caller; call release() when done with it, and discard() if
+            it turns out to be broken.
+
+        Raises:
+            ConnectionError: If connecting fails, or if earlier connects failed and the
+                endpoint is still cooling down (2, 4, 8, ... up to 60 seconds), so calls
+                to a server that is down fail fast instead of each waiting on a connect.
+        """
+        lock = self._locks.setdefault(endpoint, asyncio.Lock())
+        async with lock:
+            pooled = self._sessions.get(endpoint)
+            if pooled is not None and not await pooled.is_healthy():
+                del self._sessions[endpoint]
+                await pooled.close()
+                pooled = None
+
+            if pooled is None:
+                failures, retry_at = self._connect_failures.get(endpoint, (0, 0.0))
+                if time.monotonic() < retry_at:
+                    raise ConnectionError(
+                        f"MCP server at {endpoint} is unavailable after {failures} failed "
+                        f"connection attempt(s); retrying in {retry_at - time.monotonic():.0f}s"
+                    )
+                pooled = _PooledSession(endpoint, self._create_http_client)
+                try:
+                    await pooled.open()
+                except Exception as e:
+                    failures += 1
+                    cooldown = min(2**failures, CONNECT_BACKOFF_MAX_SECONDS)
+                    self._connect_failures[endpoint] = (failures, time.monotonic() + cooldown)
+                    logger.warning(
+                        f"Failed to connect to MCP server at {endpoint} "
+                        f"({failures} consecutive failure(s)): {e}"
+                    )
+                    raise ConnectionError(f"Failed to connect to MCP server at {endpoint}") from e
+                self._connect_failures.pop(endpoint, None)
+                self._sessions[endpoint] = pooled
+                logger.info(f"Opened pooled MCP session to {endpoint}")
+
+            pooled.last_used = time.monotonic()
+            pooled.in_use += 1
+            return pooled.session
+
+    def release(self, endpoint: str, session: "ClientSession") -> None:
+        """Mark a session returned by acquire() as no longer in use by the caller."""
+        pooled = self._sessions.get(endpoint)
+        # A discarded or replaced session is not tracked any more
+        if pooled is not None and pooled.session is session:
+            pooled.in_use = max(pooled.in_use - 1, 0)
+            pooled.last_used = time.monotonic()
+
+    async def discard(self, endpoint: str) -> None:
+        """Close and forget the session for an endpoint, e.g. after a transport error."""
+        pooled = self._sessions.pop(endpoint, None)
+        if pooled is not None:
+            await pooled.close()
+            logger.info(f"Discarded pooled MCP session to {endpoint}")
+
+    async def close_idle(self, max_idle_seconds: Optional[float] = None) -> None:
+        """Close sessions that are broken or have been idle for too long.
+
+        Sessions that are in use, e.g. by a long-running tool call, are not idle.
+
+        Args:
+            max_idle_seconds: Idle time after which a session is closed
+                (default: settings.mcp_session_idle_timeout)
+        """
+        if max_idle_seconds is None:
+            max_idle_seconds = settings.mcp_session_idle_timeout
+        now = time.monotonic()
+        for endpoint, pooled in list(self._sessions.items()):
+            idle = pooled.in_use == 0 and now - pooled.last_used > max_idle_seconds
+            if not pooled.is_open or idle:
+                if self._sessions.get(endpoint) is pooled:
+                    del self._sessions[endpoint]
+                await pooled.close()
+                logger.info(f"Closed idle MCP session to {endpoint}")
+
+    async def close_all(self) -> None:
+        """Close every pooled session and the shared connection pool (at shutdown)."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(pooled.close() for pooled in sessions))
+        await self._http_transport.aclose()
+
+    async def run_sweeper(self) -> None:
+        """Background loop that periodically closes idle sessions."""
+        while True:
+            await asyncio.sleep(SESSION_SWEEP_INTERVAL_SECONDS)
+            try:
+                await self.close_idle()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("MCP session sweep error")
+
+
+@lru_cache
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Get the shared MCPSessionPool instance."""
+    return MCPSessionPool()
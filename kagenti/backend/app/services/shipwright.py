@@ -15,7 +15,11 @@ by both agent and tool routers. It handles:
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from app.core.constants import (
     APP_KUBERNETES_IO_CREATED_BY,
@@ -48,19 +52,61 @@ from app.models.shipwright import (
 
 logger = logging.getLogger(__name__)
 
+# Manifest parts that are the same for every Build/BuildRun. Like the other shared
+# manifest constants, the dict is referenced rather than copied and must not be mutated.
+_SHIPWRIGHT_API_VERSION = f"{SHIPWRIGHT_CRD_GROUP}/{SHIPWRIGHT_CRD_VERSION}"
+_BUILD_RETENTION = {
+    "succeededLimit": SHIPWRIGHT_DEFAULT_RETENTION_SUCCEEDED,
+    "failedLimit": SHIPWRIGHT_DEFAULT_RETENTION_FAILED,
+}
+# Build annotation holding the resource configuration, by resource type
+_CONFIG_ANNOTATION_KEYS = MappingProxyType(
+    {
+        ResourceType.AGENT: "kagenti.io/agent-config",
+        ResourceType.TOOL: "kagenti.io/tool-config",
+    }
+)
+# Shared read-only fallback for Build/BuildRun fields that are missing or null
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# How long a clone secret that was found is remembered for a namespace
+CLONE_SECRET_CACHE_TTL_SECONDS = 30
+# Per namespace: when the clone secret was last seen to exist
+_clone_secret_cache: Dict[str, float] = {}
+_clone_secret_cache_lock = threading.Lock()
+
 
 def resolve_clone_secret(core_api: Any, namespace: str) -> Optional[str]:
     """Check if the GitHub Shipwright clone secret exists in the namespace.
 
     Returns the secret name if it exists, None otherwise. This allows builds
     for public repos to proceed without git credentials.
+
+    A secret that exists is cached per namespace for CLONE_SECRET_CACHE_TTL_SECONDS,
+    as builds tend to be created in bursts. A missing secret is not cached, so a
+    secret created for a private repo is picked up by the next build.
     """
+    now = time.monotonic()
+    with _clone_secret_cache_lock:
+        found_at = _clone_secret_cache.get(namespace)
+    if found_at is not None and now - found_at < CLONE_SECRET_CACHE_TTL_SECONDS:
+        return SHIPWRIGHT_GIT_SECRET_NAME
+
     try:
         core_api.read_namespaced_secret(name=SHIPWRIGHT_GIT_SECRET_NAME, namespace=namespace)
-        return SHIPWRIGHT_GIT_SECRET_NAME
     except Exception:
         return None
 
+    with _clone_secret_cache_lock:
+        _clone_secret_cache[namespace] = now
+    return SHIPWRIGHT_GIT_SECRET_NAME
+
+
+@lru_cache(maxsize=256)
+def _is_internal_registry(registry_url: str) -> bool:
+    """Check whether a registry runs in the cluster (cached per registry URL)."""
+    return registry_url == DEFAULT_INTERNAL_REGISTRY or "svc.cluster.local" in registry_url
+
 
 def select_build_strategy(registry_url: str, requested_strategy: Optional[str] = None) -> str:
     """
@@ -76,9 +122,7 @@ def select_build_strategy(registry_url: str, requested_strategy: Optional[str] =
     Returns:
         The build strategy name to use
     """
-    is_internal_registry = (
-        registry_url == DEFAULT_INTERNAL_REGISTRY or "svc.cluster.local" in registry_url
-    )
+    is_internal_registry = _is_internal_registry(registry_url)
 
     # If a strategy was explicitly requested, use it unless it's secure for internal registry
     if requested_strategy:
@@ -137,11 +181,7 @@ def build_shipwright_build_manifest(
 
     # Determine the annotation key based on resource type
     type_value = resource_type.value
-    config_annotation_key = (
-        "kagenti.io/agent-config"
-        if resource_type == ResourceType.AGENT
-        else "kagenti.io/tool-config"
-    )
+    config_annotation_key = _CONFIG_ANNOTATION_KEYS[resource_type]
 
     # Build resource configuration to store in annotation
     # This will be used when finalizing the build to create the Agent/MCPServer CRD
@@ -153,7 +193,7 @@ def build_shipwright_build_manifest(
     resource_config.setdefault("framework", framework)
 
     manifest: Dict[str, Any] = {
-        "apiVersion": f"{SHIPWRIGHT_CRD_GROUP}/{SHIPWRIGHT_CRD_VERSION}",
+        "apiVersion": _SHIPWRIGHT_API_VERSION,
         "kind": "Build",
         "metadata": {
             "name": name,
@@ -192,10 +232,7 @@ def build_shipwright_build_manifest(
                 "image": output_image,
             },
             "timeout": build_config.buildTimeout,
-            "retention": {
-                "succeededLimit": SHIPWRIGHT_DEFAULT_RETENTION_SUCCEEDED,
-                "failedLimit": SHIPWRIGHT_DEFAULT_RETENTION_FAILED,
-            },
+            "retention": _BUILD_RETENTION,
         },
     }
 
@@ -248,7 +285,7 @@ def build_shipwright_buildrun_manifest(
         base_labels.update(labels)
 
     return {
-        "apiVersion": f"{SHIPWRIGHT_CRD_GROUP}/{SHIPWRIGHT_CRD_VERSION}",
+        "apiVersion": _SHIPWRIGHT_API_VERSION,
         "kind": "BuildRun",
         "metadata": {
             "generateName": f"{build_name}-run-",
@@ -314,11 +351,7 @@ def extract_resource_config_from_build(
     annotations = build.get("metadata", {}).get("annotations", {})
 
     # Determine the annotation key based on resource type
-    config_key = (
-        "kagenti.io/agent-config"
-        if resource_type == ResourceType.AGENT
-        else "kagenti.io/tool-config"
-    )
+    config_key = _CONFIG_ANNOTATION_KEYS[resource_type]
 
     config_json = annotations.get(config_key)
     if not config_json:
@@ -342,17 +375,13 @@ def get_latest_buildrun(
         buildruns: List of BuildRun resources
 
     Returns:
-        The most recent BuildRun, or None if list is empty
+        The most recent BuildRun, or None if list is empty. The list is not reordered.
     """
     if not buildruns:
         return None
 
-    # Sort by creation timestamp and get the most recent
-    buildruns.sort(
-        key=lambda x: x.get("metadata", {}).get("creationTimestamp", ""),
-        reverse=True,
-    )
-    return buildruns[0]
+    # Single pass for the latest creation timestamp (RFC 3339 strings sort chronologically)
+    return max(buildruns, key=lambda x: x.get("metadata", {}).get("creationTimestamp", ""))
 
 
 def extract_buildrun_info(
@@ -370,15 +399,14 @@ def extract_buildrun_info(
         - outputImage, outputDigest
         - failureMessage (if failed)
     """
-    metadata = buildrun.get("metadata", {})
-    status = buildrun.get("status", {})
-    conditions = status.get("conditions", [])
+    metadata = buildrun.get("metadata") or _EMPTY
+    status = buildrun.get("status") or _EMPTY
 
     # Parse phase
-    phase, failure_message = parse_buildrun_phase(conditions)
+    phase, failure_message = parse_buildrun_phase(status.get("conditions") or [])
 
     # Get output info
-    output = status.get("output", {})
+    output = status.get("output") or _EMPTY
 
     return {
         "name": metadata.get("name"),
@@ -401,9 +429,10 @@ def is_build_succeeded(buildrun: Dict[str, Any]) -> bool:
     Returns:
         True if the build succeeded, False otherwise
     """
-    conditions = buildrun.get("status", {}).get("conditions", [])
-    phase, _ = parse_buildrun_phase(conditions)
-    return phase == "Succeeded"
+    for cond in (buildrun.get("status") or _EMPTY).get("conditions") or ():
+        if cond.get("type") == "Succeeded":
+            return cond.get("status") == "True"
+    return False
 
 
 def get_output_image_from_buildrun(
@@ -422,7 +451,7 @@ def get_output_image_from_buildrun(
     Returns:
         Tuple of (output_image, output_digest)
     """
-    output = buildrun.get("status", {}).get("output", {})
+    output = (buildrun.get("status") or _EMPTY).get("output") or _EMPTY
     output_image = output.get("image")
     output_digest = output.get("digest")
 
@@ -0,0 +1,59 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Utility functions for creating the Kubernetes resources of an agent or tool.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, List, Optional, Tuple
+
+from kubernetes.client import ApiException
+
+logger = logging.getLogger(__name__)
+
+
+async def create_resources_concurrently(
+    creations: List[Tuple[str, Callable[[], Any], Optional[Callable[[], Any]]]],
+) -> None:
+    """
+    Run independent resource creations concurrently, rolling back on failure.
+
+    Each entry is a (description, create, rollback) tuple of blocking Kubernetes
+    calls; they run in worker threads so the event loop is not blocked. A 409
+    Conflict means the resource is already present (left over from an earlier
+    attempt or created by a concurrent request), so it never triggers a rollback.
+    If any creation fails for another reason, the ones that succeeded are rolled
+    back (best effort) and that error is re-raised; otherwise the first 409 is
+    re-raised so callers keep reporting "already exists".
+
+    Args:
+        creations: (description, create, rollback) tuples. rollback may be None
+            for resources that should be left in place.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(create) for _, create, _ in creations),
+        return_exceptions=True,
+    )
+    conflicts: List[BaseException] = []
+    errors: List[BaseException] = []
+    for result in results:
+        if isinstance(result, ApiException) and result.status == 409:
+            conflicts.append(result)
+        elif isinstance(result, BaseException):
+            errors.append(result)
+    if not errors:
+        if conflicts:
+            raise conflicts[0]
+        return
+
+    for (description, _, rollback), result in zip(creations, results, strict=True):
+        if rollback is None or isinstance(result, BaseException):
+            continue
+        try:
+            await asyncio.to_thread(rollback)
+            logger.info(f"Rolled back {description} after a failed creation")
+        except Exception as e:
+            logger.warning(f"Failed to roll back {description}: {e}")
+    raise errors[0]
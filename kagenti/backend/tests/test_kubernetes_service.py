@@ -146,6 +146,45 @@ class TestDeploymentOperations:
 
         assert exc_info.value.status == 403
 
+    def test_list_deployments_paginates(self, kubernetes_service):
+        """Test Deployment listing follows continue tokens when a limit is given."""
+        item1 = MagicMock()
+        item1.to_dict.return_value = {"metadata": {"name": "deploy-1"}}
+        item2 = MagicMock()
+        item2.to_dict.return_value = {"metadata": {"name": "deploy-2"}}
+        page1 = MagicMock(items=[item1])
+        page1.metadata._continue = "token-1"
+        page2 = MagicMock(items=[item2])
+        page2.metadata._continue = None
+        kubernetes_service._apps_api.list_namespaced_deployment.side_effect = [page1, page2]
+
+        result = kubernetes_service.list_deployments("test-ns", label_selector="app=test", limit=1)
+
+        assert [r["metadata"]["name"] for r in result] == ["deploy-1", "deploy-2"]
+        calls = kubernetes_service._apps_api.list_namespaced_deployment.call_args_list
+        assert calls[0].kwargs == {"namespace": "test-ns", "label_selector": "app=test", "limit": 1}
+        assert calls[1].kwargs == {
+            "namespace": "test-ns",
+            "label_selector": "app=test",
+            "limit": 1,
+            "_continue": "token-1",
+        }
+
+    def test_list_deployments_from_watch_cache_is_not_paged(self, kubernetes_service):
+        """Test the watch cache list is one request, as the API server ignores limit there."""
+        page = MagicMock(items=[])
+        page.metadata._continue = None
+        kubernetes_service._apps_api.list_namespaced_deployment.return_value = page
+
+        kubernetes_service.list_deployments("test-ns", resource_version="0", limit=1)
+
+        kubernetes_service._apps_api.list_namespaced_deployment.assert_called_once_with(
+            namespace="test-ns",
+            label_selector=None,
+            resource_version="0",
+            resource_version_match="NotOlderThan",
+        )
+
     def test_delete_deployment_success(self, kubernetes_service):
         """Test successful Deployment deletion."""
         kubernetes_service._apps_api.delete_namespaced_deployment.return_value = None
@@ -635,6 +674,24 @@ class TestServiceOperations:
 class TestApiClientInitialization:
     """Test cases for API client lazy initialization."""
 
+    def test_api_client_uses_configured_connection_pool(self):
+        """Test that the ApiClient connection pool is sized from settings."""
+        with (
+            patch("app.services.kubernetes.kubernetes.config.load_kube_config"),
+            patch("app.services.kubernetes.kubernetes.client.ApiClient") as mock_api_client,
+            patch("app.services.kubernetes.settings.kubernetes_connection_pool_maxsize", 64),
+            patch.dict("os.environ", {}, clear=False),
+        ):
+            import os
+
+            os.environ.pop("KUBERNETES_SERVICE_HOST", None)
+            from app.services.kubernetes import KubernetesService
+
+            KubernetesService()
+
+        configuration = mock_api_client.call_args.args[0]
+        assert configuration.connection_pool_maxsize == 64
+
     def test_apps_api_lazy_init(self, kubernetes_service):
         """Test that apps_api is lazily initialized."""
         # Reset to test lazy init
@@ -760,6 +817,26 @@ class TestCustomResourceOperations:
         assert len(result) == 2
         assert result[0]["metadata"]["name"] == "agent-1"
 
+    def test_list_custom_resources_paginates(self, kubernetes_service):
+        """Test custom resource listing follows continue tokens when a limit is given."""
+        kubernetes_service._custom_api = MagicMock()
+        kubernetes_service._custom_api.list_namespaced_custom_object.side_effect = [
+            {"items": [{"metadata": {"name": "br-1"}}], "metadata": {"continue": "next"}},
+            {"items": [{"metadata": {"name": "br-2"}}], "metadata": {}},
+        ]
+
+        result = kubernetes_service.list_custom_resources(
+            group="shipwright.io",
+            version="v1beta1",
+            namespace="test-ns",
+            plural="buildruns",
+            limit=1,
+        )
+
+        assert [r["metadata"]["name"] for r in result] == ["br-1", "br-2"]
+        last_call = kubernetes_service._custom_api.list_namespaced_custom_object.call_args
+        assert last_call.kwargs["_continue"] == "next"
+
     def test_get_custom_resource_success(self, kubernetes_service):
         """Test successful custom resource retrieval."""
         kubernetes_service._custom_api = MagicMock()
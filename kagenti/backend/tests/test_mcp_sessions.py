@@ -0,0 +1,237 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Tests for the pooled MCP client sessions.
+
+Tests cover:
+- Session reuse per endpoint and reconnecting after discard/failure
+- Failing fast with backoff after failed connects
+- Health checks on idle sessions
+- Idle eviction and shutdown
+- The HTTP connection pool shared by all sessions
+"""
+
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.services import mcp_sessions
+from app.services.mcp_sessions import MCPSessionPool
+
+
+@pytest.fixture
+def transport():
+    """Patch streamablehttp_client/ClientSession with mocks that record opened/closed URLs.
+
+    Set transport.fail_connect to make connecting fail, and make
+    transport.send_ping raise to fail health checks.
+    """
+    transport = MagicMock(fail_connect=False, opened=[], closed=[])
+    transport.send_ping = AsyncMock()
+
+    @asynccontextmanager
+    async def client(url, headers=None, httpx_client_factory=None):
+        if transport.fail_connect:
+            raise ConnectionError(f"cannot reach {url}")
+        transport.opened.append(url)
+        try:
+            yield url, url, None
+        finally:
+            transport.closed.append(url)
+
+    def client_session(read_stream, write_stream):
+        session = AsyncMock()
+        session.__aenter__.return_value = session
+        session.__aexit__.return_value = False
+        session.send_ping = transport.send_ping
+        return session
+
+    with (
+        patch("mcp.client.streamable_http.streamablehttp_client", side_effect=client),
+        patch("mcp.ClientSession", side_effect=client_session),
+    ):
+        yield transport
+
+
+class TestMCPSessionPool:
+    """Test cases for MCPSessionPool."""
+
+    async def test_reuses_session_per_endpoint(self, transport):
+        pool = MCPSessionPool()
+
+        first = await pool.acquire("http://a/mcp")
+        second = await pool.acquire("http://a/mcp")
+        other = await pool.acquire("http://b/mcp")
+
+        assert first is second
+        assert other is not first
+        assert transport.opened == ["http://a/mcp", "http://b/mcp"]
+        await pool.close_all()
+
+    async def test_connect_failure_is_raised_and_not_pooled(self, transport):
+        pool = MCPSessionPool()
+        transport.fail_connect = True
+
+        with pytest.raises(ConnectionError):
+            await pool.acquire("http://a/mcp")
+
+        transport.fail_connect = False
+        pool._connect_failures["http://a/mcp"] = (1, 0.0)
+        await pool.acquire("http://a/mcp")
+        assert transport.opened == ["http://a/mcp"]
+        assert pool._connect_failures == {}
+        await pool.close_all()
+
+    async def test_failed_connect_fails_fast_during_cooldown(self, transport):
+        pool = MCPSessionPool()
+        transport.fail_connect = True
+        with pytest.raises(ConnectionError):
+            await pool.acquire("http://a/mcp")
+
+        transport.fail_connect = False
+        with pytest.raises(ConnectionError, match="unavailable"):
+            await pool.acquire("http://a/mcp")
+
+        assert transport.opened == []
+        # Other endpoints are unaffected
+        await pool.acquire("http://b/mcp")
+        await pool.close_all()
+
+    async def test_connect_cooldown_backs_off_and_is_capped(self, transport):
+        pool = MCPSessionPool()
+        transport.fail_connect = True
+        cooldowns = []
+
+        for _ in range(7):
+            # End the cooldown early so the next attempt reaches the transport
+            failures, _ = pool._connect_failures.get("http://a/mcp", (0, 0.0))
+            pool._connect_failures["http://a/mcp"] = (failures, 0.0)
+            before = time.monotonic()
+            with pytest.raises(ConnectionError):
+                await pool.acquire("http://a/mcp")
+            cooldowns.append(round(pool._connect_failures["http://a/mcp"][1] - before))
+
+        assert cooldowns == [2, 4, 8, 16, 32, 60, 60]
+
+    async def test_discard_reconnects_on_next_acquire(self, transport):
+        pool = MCPSessionPool()
+
+        first = await pool.acquire("http://a/mcp")
+        await pool.discard("http://a/mcp")
+        second = await pool.acquire("http://a/mcp")
+
+        assert second is not first
+        assert transport.closed == ["http://a/mcp"]
+        await pool.close_all()
+
+    async def test_idle_session_failing_ping_is_replaced(self, transport):
+        pool = MCPSessionPool()
+        first = await pool.acquire("http://a/mcp")
+        pool._sessions["http://a/mcp"].last_used -= 60
+        transport.send_ping.side_effect = RuntimeError("no pong")
+
+        second = await pool.acquire("http://a/mcp")
+
+        assert second is not first
+        assert transport.closed == ["http://a/mcp"]
+        await pool.close_all()
+
+    async def test_close_idle_only_closes_idle_sessions(self, transport):
+        pool = MCPSessionPool()
+        for endpoint in ("http://a/mcp", "http://b/mcp"):
+            pool.release(endpoint, await pool.acquire(endpoint))
+        pool._sessions["http://a/mcp"].last_used -= 600
+
+        await pool.close_idle(max_idle_seconds=300)
+
+        assert transport.closed == ["http://a/mcp"]
+        assert list(pool._sessions) == ["http://b/mcp"]
+        await pool.close_all()
+
+    async def test_close_idle_skips_sessions_in_use(self, transport):
+        pool = MCPSessionPool()
+        session = await pool.acquire("http://a/mcp")
+        pooled = pool._sessions["http://a/mcp"]
+        # A tool call that has been running for longer than the idle timeout
+        pooled.last_used -= 600
+
+        await pool.close_idle(max_idle_seconds=300)
+        assert transport.closed == []
+
+        pool.release("http://a/mcp", session)
+        await pool.close_idle(max_idle_seconds=300)
+        assert transport.closed == []
+        assert pooled.in_use == 0
+
+        pooled.last_used -= 600
+        await pool.close_idle(max_idle_seconds=300)
+        assert transport.closed == ["http://a/mcp"]
+
+    async def test_release_ignores_discarded_session(self, transport):
+        pool = MCPSessionPool()
+        stale = await pool.acquire("http://a/mcp")
+        await pool.discard("http://a/mcp")
+        await pool.acquire("http://a/mcp")
+
+        pool.release("http://a/mcp", stale)
+
+        assert pool._sessions["http://a/mcp"].in_use == 1
+        await pool.close_all()
+
+    async def test_close_idle_defaults_to_configured_timeout(self, transport):
+        pool = MCPSessionPool()
+        pool.release("http://a/mcp", await pool.acquire("http://a/mcp"))
+        pool._sessions["http://a/mcp"].last_used -= 90
+
+        with patch.object(mcp_sessions.settings, "mcp_session_idle_timeout", 120):
+            await pool.close_idle()
+        assert transport.closed == []
+
+        with patch.object(mcp_sessions.settings, "mcp_session_idle_timeout", 60):
+            await pool.close_idle()
+        assert transport.closed == ["http://a/mcp"]
+
+    async def test_close_all(self, transport):
+        pool = MCPSessionPool()
+        await pool.acquire("http://a/mcp")
+        await pool.acquire("http://b/mcp")
+
+        await pool.close_all()
+
+        assert sorted(transport.closed) == ["http://a/mcp", "http://b/mcp"]
+
+
+class TestSharedHttpPool:
+    """Test cases for the HTTP connection pool shared by pooled sessions."""
+
+    async def test_session_clients_share_one_pool(self):
+        pool = MCPSessionPool()
+        requests = []
+
+        async def handler(request):
+            requests.append(request.url.host)
+            return httpx.Response(200)
+
+        pool._http_transport = httpx.MockTransport(handler)
+
+        async with pool._create_http_client() as first:
+            await first.get("http://a/mcp")
+        # Closing the first session's client must leave the shared pool usable
+        async with pool._create_http_client(headers={"X-Test": "1"}) as second:
+            await second.get("http://b/mcp")
+
+        assert requests == ["a", "b"]
+
+    async def test_factory_keeps_mcp_timeouts(self):
+        pool = MCPSessionPool()
+        timeout = httpx.Timeout(30.0, read=300.0)
+
+        client = pool._create_http_client(timeout=timeout)
+
+        assert client.timeout == timeout
+        assert client.follow_redirects
+        await client.aclose()
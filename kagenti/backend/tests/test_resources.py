@@ -0,0 +1,96 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the shared resource creation helper.
+
+Tests cover:
+- Concurrent creation with rollback of the resources that were created
+- Leaving 409 Conflict siblings in place
+- Which error is re-raised
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client import ApiException
+
+from app.utils.resources import create_resources_concurrently
+
+
+def _creations(kube, route=False):
+    steps = [
+        ("Deployment", kube.create_deployment, kube.delete_deployment),
+        ("Service", kube.create_service, kube.delete_service),
+    ]
+    if route:
+        steps.append(("Route", kube.create_route, None))
+    return steps
+
+
+class TestCreateResourcesConcurrently:
+    """Tests for create_resources_concurrently rollback behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_all_succeed(self):
+        """Verify every creation runs and nothing is rolled back."""
+        kube = MagicMock()
+        await create_resources_concurrently(_creations(kube, route=True))
+        kube.create_deployment.assert_called_once()
+        kube.create_service.assert_called_once()
+        kube.create_route.assert_called_once()
+        kube.delete_deployment.assert_not_called()
+        kube.delete_service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failure_rolls_back_successful_creations(self):
+        """Verify a real failure deletes the resources that were created."""
+        kube = MagicMock()
+        kube.create_service.side_effect = ApiException(status=500)
+        with pytest.raises(ApiException) as exc_info:
+            await create_resources_concurrently(_creations(kube))
+        assert exc_info.value.status == 500
+        kube.delete_deployment.assert_called_once()
+        kube.delete_service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_entry_without_rollback_is_left_in_place(self):
+        """Verify entries with rollback=None are not undone."""
+        kube = MagicMock()
+        kube.create_deployment.side_effect = ApiException(status=500)
+        with pytest.raises(ApiException):
+            await create_resources_concurrently(_creations(kube, route=True))
+        kube.delete_service.assert_called_once()
+        kube.create_route.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_conflict_does_not_roll_back_siblings(self):
+        """Verify a leftover resource (409) keeps the newly created workload."""
+        kube = MagicMock()
+        kube.create_service.side_effect = ApiException(status=409)
+        with pytest.raises(ApiException) as exc_info:
+            await create_resources_concurrently(_creations(kube))
+        assert exc_info.value.status == 409
+        kube.delete_deployment.assert_not_called()
+        kube.delete_service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_real_error_is_reraised(self):
+        """Verify the first non-409 error wins over conflicts and later errors."""
+        kube = MagicMock()
+        kube.create_deployment.side_effect = ApiException(status=409)
+        kube.create_service.side_effect = ApiException(status=500)
+        kube.create_route.side_effect = ApiException(status=403)
+        with pytest.raises(ApiException) as exc_info:
+            await create_resources_concurrently(_creations(kube, route=True))
+        assert exc_info.value.status == 500
+
+    @pytest.mark.asyncio
+    async def test_rollback_error_does_not_mask_creation_error(self):
+        """Verify a non-ApiException raised during rollback is logged, not raised."""
+        kube = MagicMock()
+        kube.create_service.side_effect = ApiException(status=500)
+        kube.delete_deployment.side_effect = TimeoutError("timeout")
+        with pytest.raises(ApiException) as exc_info:
+            await create_resources_concurrently(_creations(kube))
+        assert exc_info.value.status == 500
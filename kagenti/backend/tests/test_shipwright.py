@@ -12,41 +12,50 @@ Tests cover:
 """
 
 import json
+from unittest.mock import MagicMock, patch
+
 import pytest
+from fastapi import HTTPException
+from kubernetes.client import ApiException
 
+from app.core.constants import (
+    DEFAULT_INTERNAL_REGISTRY,
+    KAGENTI_FRAMEWORK_LABEL,
+    KAGENTI_SPIRE_ENABLED_VALUE,
+    KAGENTI_SPIRE_LABEL,
+    KAGENTI_TYPE_LABEL,
+    PROTOCOL_LABEL_PREFIX,
+    RESOURCE_TYPE_AGENT,
+    SHIPWRIGHT_CRD_GROUP,
+    SHIPWRIGHT_CRD_VERSION,
+    SHIPWRIGHT_DEFAULT_DOCKERFILE,
+    SHIPWRIGHT_DEFAULT_RETENTION_FAILED,
+    SHIPWRIGHT_DEFAULT_RETENTION_SUCCEEDED,
+    SHIPWRIGHT_DEFAULT_TIMEOUT,
+    SHIPWRIGHT_GIT_SECRET_NAME,
+    SHIPWRIGHT_STRATEGY_INSECURE,
+    SHIPWRIGHT_STRATEGY_SECURE,
+)
 from app.routers.agents import (
     CreateAgentRequest,
-    ShipwrightBuildConfig,
     EnvVar,
+    FinalizeShipwrightBuildRequest,
     ServicePort,
+    ShipwrightBuildConfig,
     _build_agent_shipwright_build_manifest,
     _build_agent_shipwright_buildrun_manifest,
     _build_common_labels,
     _build_deployment_manifest,
+    _build_job_manifest,
+    _build_service_manifest,
+    _filter_labels_by_prefix,
+    finalize_shipwright_build,
 )
 from app.routers.tools import (
     CreateToolRequest,
     _build_tool_deployment_manifest,
     _build_tool_statefulset_manifest,
 )
-from app.core.constants import (
-    SHIPWRIGHT_CRD_GROUP,
-    SHIPWRIGHT_CRD_VERSION,
-    SHIPWRIGHT_STRATEGY_INSECURE,
-    SHIPWRIGHT_STRATEGY_SECURE,
-    DEFAULT_INTERNAL_REGISTRY,
-    SHIPWRIGHT_GIT_SECRET_NAME,
-    SHIPWRIGHT_DEFAULT_DOCKERFILE,
-    SHIPWRIGHT_DEFAULT_TIMEOUT,
-    SHIPWRIGHT_DEFAULT_RETENTION_SUCCEEDED,
-    SHIPWRIGHT_DEFAULT_RETENTION_FAILED,
-    KAGENTI_TYPE_LABEL,
-    PROTOCOL_LABEL_PREFIX,
-    KAGENTI_FRAMEWORK_LABEL,
-    KAGENTI_SPIRE_LABEL,
-    KAGENTI_SPIRE_ENABLED_VALUE,
-    RESOURCE_TYPE_AGENT,
-)
 
 
 class TestBuildShipwrightBuildManifest:
@@ -811,9 +820,18 @@ class TestShipwrightBuildInfoResponse:
 class TestResolveCloneSecret:
     """Tests for resolve_clone_secret helper."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from app.services import shipwright
+
+        shipwright._clone_secret_cache.clear()
+        yield
+        shipwright._clone_secret_cache.clear()
+
     def test_returns_secret_name_when_exists(self):
         """Test that resolve_clone_secret returns the secret name when it exists."""
         from unittest.mock import MagicMock
+
         from app.services.shipwright import resolve_clone_secret
 
         mock_core_api = MagicMock()
@@ -829,6 +847,7 @@ class TestResolveCloneSecret:
     def test_returns_none_when_missing(self):
         """Test that resolve_clone_secret returns None when the secret doesn't exist."""
         from unittest.mock import MagicMock
+
         from app.services.shipwright import resolve_clone_secret
 
         mock_core_api = MagicMock()
@@ -837,6 +856,50 @@ class TestResolveCloneSecret:
         result = resolve_clone_secret(mock_core_api, "team1")
         assert result is None
 
+    def test_caches_existing_secret_per_namespace(self):
+        """Test that repeated lookups in a namespace reuse a secret that was found."""
+        from unittest.mock import MagicMock
+
+        from app.services.shipwright import resolve_clone_secret
+
+        mock_core_api = MagicMock()
+
+        assert resolve_clone_secret(mock_core_api, "team1") == SHIPWRIGHT_GIT_SECRET_NAME
+        assert resolve_clone_secret(mock_core_api, "team1") == SHIPWRIGHT_GIT_SECRET_NAME
+        assert resolve_clone_secret(mock_core_api, "team2") == SHIPWRIGHT_GIT_SECRET_NAME
+        assert mock_core_api.read_namespaced_secret.call_count == 2
+
+    @pytest.mark.parametrize("status", [404, 500])
+    def test_missing_secret_is_not_cached(self, status):
+        """Test that a secret created after a failed lookup is used by the next build."""
+        from unittest.mock import MagicMock
+
+        from app.services.shipwright import resolve_clone_secret
+
+        mock_core_api = MagicMock()
+        mock_core_api.read_namespaced_secret.side_effect = [
+            ApiException(status=status),
+            MagicMock(),
+        ]
+
+        assert resolve_clone_secret(mock_core_api, "team1") is None
+        assert resolve_clone_secret(mock_core_api, "team1") == SHIPWRIGHT_GIT_SECRET_NAME
+
+    def test_cached_lookup_expires(self):
+        """Test that a deleted secret is noticed once the cached answer expires."""
+        from unittest.mock import MagicMock
+
+        from app.services import shipwright
+        from app.services.shipwright import resolve_clone_secret
+
+        mock_core_api = MagicMock()
+        mock_core_api.read_namespaced_secret.side_effect = [MagicMock(), ApiException(status=404)]
+
+        assert resolve_clone_secret(mock_core_api, "team1") == SHIPWRIGHT_GIT_SECRET_NAME
+        shipwright._clone_secret_cache["team1"] -= shipwright.CLONE_SECRET_CACHE_TTL_SECONDS
+
+        assert resolve_clone_secret(mock_core_api, "team1") is None
+
 
 class TestSpireLabel:
     """Tests for SPIRE identity label on workload manifests."""
@@ -948,3 +1011,118 @@ class TestSpireLabel:
 
         pod_labels = manifest["spec"]["template"]["metadata"]["labels"]
         assert pod_labels.get(KAGENTI_SPIRE_LABEL) == KAGENTI_SPIRE_ENABLED_VALUE
+
+
+class TestExtraLabels:
+    """Tests for Build labels passed to agent manifest builders via extra_labels."""
+
+    def test_agent_job_applies_extra_labels_to_metadata_and_pods(self):
+        """Verify extra_labels land on both the Job and its pod template."""
+        request = CreateAgentRequest(
+            name="test-agent",
+            namespace="team1",
+            deploymentMethod="image",
+            workloadType="job",
+            containerImage="registry.example.com/test-agent:v1",
+        )
+        manifest = _build_job_manifest(
+            request,
+            image="registry.example.com/test-agent:v1",
+            extra_labels={"kagenti.io/build-name": "test-agent"},
+        )
+
+        assert manifest["metadata"]["labels"]["kagenti.io/build-name"] == "test-agent"
+        pod_labels = manifest["spec"]["template"]["metadata"]["labels"]
+        assert pod_labels["kagenti.io/build-name"] == "test-agent"
+
+    def test_agent_service_applies_extra_labels(self):
+        """Verify extra_labels are added to the Service labels but not its selector."""
+        request = CreateAgentRequest(name="test-agent", namespace="team1")
+        manifest = _build_service_manifest(
+            request, extra_labels={"kagenti.io/build-name": "test-agent"}
+        )
+
+        assert manifest["metadata"]["labels"]["kagenti.io/build-name"] == "test-agent"
+        assert "kagenti.io/build-name" not in manifest["spec"]["selector"]
+
+
+class TestFilterLabelsByPrefix:
+    """Tests for _filter_labels_by_prefix helper."""
+
+    def test_defaults_to_kagenti_prefix(self):
+        """Verify only kagenti.io/ labels are kept by default."""
+        labels = {"kagenti.io/type": "agent", "app.kubernetes.io/name": "a", "team": "x"}
+        assert _filter_labels_by_prefix(labels) == {"kagenti.io/type": "agent"}
+
+    def test_multiple_prefixes(self):
+        """Verify labels matching any of several prefixes are kept."""
+        labels = {
+            "kagenti.io/type": "agent",
+            "app.kubernetes.io/name": "a",
+            "protocol.kagenti.io/a2a": "",
+            "team": "x",
+        }
+        result = _filter_labels_by_prefix(labels, ("kagenti.io/", "app.kubernetes.io/"))
+        assert result == {"kagenti.io/type": "agent", "app.kubernetes.io/name": "a"}
+
+
+def _finalize_kube():
+    """Mock KubernetesService with a succeeded BuildRun and a Build that requests a route."""
+    kube = MagicMock()
+    kube.list_custom_resources.return_value = [
+        {
+            "metadata": {"name": "my-agent-run", "creationTimestamp": "2026-01-21T10:00:00Z"},
+            "status": {
+                "conditions": [{"type": "Succeeded", "status": "True"}],
+                "output": {"image": "registry.local/my-agent", "digest": "sha256:abc"},
+            },
+        }
+    ]
+    kube.get_custom_resource.return_value = {
+        "metadata": {
+            "name": "my-agent",
+            "labels": {},
+            "annotations": {"kagenti.io/agent-config": json.dumps({"createHttpRoute": True})},
+        },
+        "spec": {},
+    }
+    for get_workload in (kube.get_deployment, kube.get_statefulset, kube.get_job):
+        get_workload.side_effect = ApiException(status=404)
+    return kube
+
+
+class TestFinalizeShipwrightBuildRoute:
+    """Tests for when finalize_shipwright_build creates the HTTPRoute/Route."""
+
+    @pytest.mark.asyncio
+    async def test_route_created_after_workload_and_service(self):
+        """Verify the route is created once the workload and Service exist."""
+        kube = _finalize_kube()
+        with patch("app.routers.agents.create_route_for_agent_or_tool") as create_route:
+            result = await finalize_shipwright_build(
+                namespace="team1",
+                name="my-agent",
+                request=FinalizeShipwrightBuildRequest(),
+                kube=kube,
+            )
+        kube.create_deployment.assert_called_once()
+        kube.create_service.assert_called_once()
+        create_route.assert_called_once()
+        assert "HTTPRoute/Route created" in result.message
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [409, 500])
+    async def test_no_route_when_workload_creation_fails(self, status):
+        """Verify a failed or conflicting workload create does not expose a route."""
+        kube = _finalize_kube()
+        kube.create_deployment.side_effect = ApiException(status=status)
+        with patch("app.routers.agents.create_route_for_agent_or_tool") as create_route:
+            with pytest.raises(HTTPException) as exc_info:
+                await finalize_shipwright_build(
+                    namespace="team1",
+                    name="my-agent",
+                    request=FinalizeShipwrightBuildRequest(),
+                    kube=kube,
+                )
+        assert exc_info.value.status_code == status
+        create_route.assert_not_called()
@@ -13,9 +13,11 @@ Tests cover:
 """
 
 import json
+import logging
 import pytest
 
 from app.services.shipwright import (
+    _is_internal_registry,
     select_build_strategy,
     build_shipwright_build_manifest,
     build_shipwright_buildrun_manifest,
@@ -85,6 +87,25 @@ class TestSelectBuildStrategy:
         result = select_build_strategy("quay.io/myorg", requested_strategy="custom-strategy")
         assert result == "custom-strategy"
 
+    def test_registry_check_is_cached_per_registry(self):
+        """Test that repeated selections reuse the cached registry check."""
+        _is_internal_registry.cache_clear()
+
+        select_build_strategy("quay.io/myorg", "custom-strategy")
+        select_build_strategy("quay.io/myorg", "custom-strategy")
+        result = select_build_strategy("quay.io/myorg", None)
+
+        assert result == SHIPWRIGHT_STRATEGY_SECURE
+        assert _is_internal_registry.cache_info().hits == 2
+
+    def test_override_is_logged_on_every_selection(self, caplog):
+        """Test that the secure-to-insecure override is logged for each build, not once."""
+        with caplog.at_level(logging.DEBUG, logger="app.services.shipwright"):
+            for _ in range(2):
+                select_build_strategy(DEFAULT_INTERNAL_REGISTRY, SHIPWRIGHT_STRATEGY_SECURE)
+
+        assert len([r for r in caplog.records if "Overriding" in r.message]) == 2
+
 
 class TestBuildShipwrightBuildManifest:
     """Tests for build_shipwright_build_manifest function."""
@@ -120,6 +141,8 @@ class TestBuildShipwrightBuildManifest:
 
         assert manifest["metadata"]["labels"][KAGENTI_TYPE_LABEL] == RESOURCE_TYPE_AGENT
         assert "kagenti.io/agent-config" in manifest["metadata"]["annotations"]
+        assert manifest["apiVersion"] == "shipwright.io/v1beta1"
+        assert manifest["spec"]["retention"] == {"succeededLimit": 3, "failedLimit": 3}
 
     def test_tool_build_manifest(self):
         """Test build manifest generation for tools."""
@@ -200,6 +223,7 @@ class TestBuildShipwrightBuildRunManifest:
             resource_type=ResourceType.AGENT,
         )
 
+        assert manifest["apiVersion"] == "shipwright.io/v1beta1"
         assert manifest["kind"] == "BuildRun"
         assert manifest["metadata"]["generateName"] == "test-agent-run-"
         assert manifest["metadata"]["labels"][KAGENTI_TYPE_LABEL] == RESOURCE_TYPE_AGENT
@@ -382,6 +406,23 @@ class TestGetLatestBuildRun:
         latest = get_latest_buildrun(buildruns)
         assert latest["metadata"]["name"] == "build-run-3"
 
+    def test_does_not_reorder_list(self):
+        """Test that the caller's list keeps its order."""
+        buildruns = [
+            {"metadata": {"name": "build-run-1", "creationTimestamp": "2026-01-21T10:00:00Z"}},
+            {"metadata": {"name": "build-run-2", "creationTimestamp": "2026-01-21T11:00:00Z"}},
+            {"metadata": {"name": "build-run-pending"}},
+        ]
+
+        latest = get_latest_buildrun(buildruns)
+
+        assert latest["metadata"]["name"] == "build-run-2"
+        assert [b["metadata"]["name"] for b in buildruns] == [
+            "build-run-1",
+            "build-run-2",
+            "build-run-pending",
+        ]
+
     def test_empty_list(self):
         """Test with empty list."""
         latest = get_latest_buildrun([])
@@ -416,6 +457,15 @@ class TestIsBuildSucceeded:
         }
         assert is_build_succeeded(buildrun) is False
 
+    def test_pending_build(self):
+        """Test BuildRuns without a Succeeded condition."""
+        assert is_build_succeeded({}) is False
+        assert is_build_succeeded({"status": {"conditions": None}}) is False
+        assert (
+            is_build_succeeded({"status": {"conditions": [{"type": "Ready", "status": "True"}]}})
+            is False
+        )
+
 
 class TestGetOutputImageFromBuildRun:
     """Tests for get_output_image_from_buildrun function."""
@@ -506,3 +556,16 @@ class TestExtractBuildRunInfo:
 
         assert info["phase"] == "Failed"
         assert info["failureMessage"] == "Build failed: Dockerfile not found"
+
+    def test_null_fields(self):
+        """Test that null status fields are treated as missing."""
+        buildrun = {
+            "metadata": {"name": "new-build-run"},
+            "status": {"conditions": None, "output": None},
+        }
+
+        info = extract_buildrun_info(buildrun)
+
+        assert info["phase"] == "Pending"
+        assert info["outputImage"] is None
+        assert extract_buildrun_info({"metadata": None, "status": None})["name"] is None
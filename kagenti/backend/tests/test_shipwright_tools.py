@@ -13,23 +13,35 @@ Tests cover:
 """
 
 import json
-import pytest
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from app.core.constants import (
+    DEFAULT_INTERNAL_REGISTRY,
+    KAGENTI_FRAMEWORK_LABEL,
+    KAGENTI_TYPE_LABEL,
+    PROTOCOL_LABEL_PREFIX,
+    RESOURCE_TYPE_TOOL,
+    SHIPWRIGHT_CRD_GROUP,
+    SHIPWRIGHT_CRD_VERSION,
+    SHIPWRIGHT_STRATEGY_INSECURE,
+    SHIPWRIGHT_STRATEGY_SECURE,
+)
+from app.models.shipwright import (
+    BuildOutputConfig,
+    BuildSourceConfig,
+    ResourceConfigFromBuild,
+    ResourceType,
+    ShipwrightBuildConfig,
+)
 from app.routers.tools import (
     CreateToolRequest,
     FinalizeToolBuildRequest,
     ToolShipwrightBuildInfoResponse,
+    _build_mcpserver_manifest,
     _build_tool_shipwright_build_manifest,
     _build_tool_shipwright_buildrun_manifest,
-    _build_mcpserver_manifest,
-)
-from app.models.shipwright import (
-    ResourceType,
-    ShipwrightBuildConfig,
-    BuildSourceConfig,
-    BuildOutputConfig,
-    ResourceConfigFromBuild,
 )
 from app.services.shipwright import (
     build_shipwright_build_manifest,
@@ -37,17 +49,6 @@ from app.services.shipwright import (
     extract_resource_config_from_build,
     select_build_strategy,
 )
-from app.core.constants import (
-    SHIPWRIGHT_CRD_GROUP,
-    SHIPWRIGHT_CRD_VERSION,
-    SHIPWRIGHT_STRATEGY_INSECURE,
-    SHIPWRIGHT_STRATEGY_SECURE,
-    DEFAULT_INTERNAL_REGISTRY,
-    KAGENTI_TYPE_LABEL,
-    PROTOCOL_LABEL_PREFIX,
-    KAGENTI_FRAMEWORK_LABEL,
-    RESOURCE_TYPE_TOOL,
-)
 
 
 class TestToolBuildManifestGeneration:
@@ -248,6 +249,48 @@ class TestToolBuildManifestGeneration:
         assert tool_config["servicePorts"][0]["name"] == "http"
         assert tool_config["servicePorts"][0]["port"] == 8080
 
+    def test_tool_build_manifest_config_matches_model_dump(self):
+        """Test the stored tool config keeps the model_dump shape for all nested models."""
+        from app.routers.tools import (
+            ConfigMapKeyRef,
+            EnvVar,
+            EnvVarSource,
+            PersistentStorageConfig,
+            SecretKeyRef,
+            ServicePort,
+        )
+
+        env_vars = [
+            EnvVar(name="DEBUG", value="true"),
+            EnvVar(
+                name="API_KEY",
+                valueFrom=EnvVarSource(secretKeyRef=SecretKeyRef(name="creds", key="api")),
+            ),
+            EnvVar(
+                name="MODE",
+                valueFrom=EnvVarSource(configMapKeyRef=ConfigMapKeyRef(name="cfg", key="mode")),
+            ),
+        ]
+        ports = [ServicePort(name="http", port=8080, targetPort=8000)]
+        storage = PersistentStorageConfig(enabled=True, size="5Gi")
+        request = CreateToolRequest(
+            name="shape-tool",
+            namespace="team1",
+            deploymentMethod="source",
+            gitUrl="https://github.com/example/tools",
+            workloadType="statefulset",
+            envVars=env_vars,
+            servicePorts=ports,
+            persistentStorage=storage,
+        )
+
+        manifest = _build_tool_shipwright_build_manifest(request)
+
+        tool_config = json.loads(manifest["metadata"]["annotations"]["kagenti.io/tool-config"])
+        assert tool_config["envVars"] == [ev.model_dump() for ev in env_vars]
+        assert tool_config["servicePorts"] == [sp.model_dump() for sp in ports]
+        assert tool_config["persistentStorage"] == storage.model_dump()
+
 
 class TestToolBuildRunManifestGeneration:
     """Tests for tool BuildRun manifest generation."""
@@ -504,3 +547,31 @@ class TestMCPServerManifestGeneration:
         pod_spec = manifest["spec"]["podTemplateSpec"]["spec"]
         assert "imagePullSecrets" in pod_spec
         assert pod_spec["imagePullSecrets"][0]["name"] == "my-pull-secret"
+
+    def test_mcpserver_manifest_keeps_env_var_references(self):
+        """Test MCPServer manifest keeps valueFrom env vars alongside the defaults."""
+        from app.core.constants import DEFAULT_ENV_VARS
+        from app.routers.tools import EnvVar, EnvVarSource, SecretKeyRef
+
+        request = CreateToolRequest(
+            name="env-tool",
+            namespace="team1",
+            deploymentMethod="image",
+            containerImage="quay.io/myorg/my-tool:v1.0.0",
+            envVars=[
+                EnvVar(name="DEBUG", value="true"),
+                EnvVar(
+                    name="API_KEY",
+                    valueFrom=EnvVarSource(secretKeyRef=SecretKeyRef(name="creds", key="api")),
+                ),
+            ],
+        )
+
+        manifest = _build_mcpserver_manifest(request)
+
+        env = manifest["spec"]["podTemplateSpec"]["spec"]["containers"][0]["env"]
+        assert env[: len(DEFAULT_ENV_VARS)] == list(DEFAULT_ENV_VARS)
+        assert env[len(DEFAULT_ENV_VARS) :] == [
+            {"name": "DEBUG", "value": "true"},
+            {"name": "API_KEY", "valueFrom": {"secretKeyRef": {"name": "creds", "key": "api"}}},
+        ]
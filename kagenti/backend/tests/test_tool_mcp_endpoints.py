@@ -0,0 +1,374 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the tool MCP connect/invoke endpoints.
+
+Tests cover:
+- Listing and invoking tools through a pooled session
+- Discarding pooled sessions after transport errors and ended sessions, but not tool errors
+- Concurrent batch invocation with bounded concurrency and stop-on-error
+- Short-lived caching of advertised tool lists and sharing concurrent list calls
+- Tool server URL resolution
+- Tool result serialization
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from mcp.shared.exceptions import McpError
+from mcp.types import (
+    AudioContent,
+    EmbeddedResource,
+    ErrorData,
+    ImageContent,
+    TextContent,
+    TextResourceContents,
+    Tool,
+)
+
+from app.routers import tools as tools_router
+from app.routers.tools import (
+    MCPBatchInvokeRequest,
+    MCPInvokeRequest,
+    _get_tool_url,
+    _serialize_tool_result,
+    batch_invoke_tools,
+    connect_to_tool,
+    invoke_tool,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_tools_cache():
+    tools_router._tools_cache.clear()
+    yield
+    tools_router._tools_cache.clear()
+
+
+def _session(error=None):
+    """Create a mock ClientSession advertising one tool; calls raise error if given."""
+    session = MagicMock()
+    session.list_tools = AsyncMock(
+        return_value=SimpleNamespace(
+            tools=[Tool(name="forecast", description="Get a forecast", inputSchema={})]
+        ),
+        side_effect=error,
+    )
+    session.call_tool = AsyncMock(
+        return_value=SimpleNamespace(
+            content=[TextContent(type="text", text="sunny")], isError=False
+        ),
+        side_effect=error,
+    )
+    return session
+
+
+def _pool(session):
+    """Create a mock MCPSessionPool handing out the given session."""
+    pool = AsyncMock()
+    pool.acquire.return_value = session
+    pool.release = MagicMock()
+    return pool
+
+
+def _acquired(pool):
+    return [c.args[0] for c in pool.acquire.await_args_list]
+
+
+def _discarded(pool):
+    return [c.args[0] for c in pool.discard.await_args_list]
+
+
+class TestConnectToTool:
+    """Tests for connect_to_tool."""
+
+    async def test_lists_tools_from_pooled_session(self):
+        pool = _pool(_session())
+
+        result = await connect_to_tool(namespace="team1", name="weather", pool=pool)
+
+        assert result.model_dump() == {
+            "tools": [{"name": "forecast", "description": "Get a forecast", "input_schema": {}}]
+        }
+        assert _acquired(pool)[0].endswith("/mcp")
+        pool.release.assert_called_once_with(_acquired(pool)[0], pool.acquire.return_value)
+        pool.discard.assert_not_awaited()
+
+    async def test_tool_list_is_cached_per_tool(self):
+        pool = _pool(_session())
+
+        first = await connect_to_tool(namespace="team1", name="weather", pool=pool)
+        second = await connect_to_tool(namespace="team1", name="weather", pool=pool)
+        await connect_to_tool(namespace="team2", name="weather", pool=pool)
+
+        assert second is first
+        assert pool.acquire.await_count == 2
+
+    async def test_concurrent_connects_share_one_call(self):
+        release = asyncio.Event()
+        session = _session()
+        tools = session.list_tools.return_value
+
+        async def list_tools():
+            await release.wait()
+            return tools
+
+        session.list_tools.side_effect = list_tools
+        pool = _pool(session)
+        calls = [
+            asyncio.create_task(connect_to_tool(namespace="team1", name="weather", pool=pool))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+        assert pool.acquire.await_count == 1
+        assert results[0] is results[1] is results[2]
+        assert tools_router._tools_inflight == {}
+
+    async def test_concurrent_connects_share_failure(self):
+        pool = _pool(_session(error=ConnectionError("refused")))
+
+        results = await asyncio.gather(
+            connect_to_tool(namespace="team1", name="weather", pool=pool),
+            connect_to_tool(namespace="team1", name="weather", pool=pool),
+            return_exceptions=True,
+        )
+
+        assert [r.status_code for r in results] == [503, 503]
+        assert pool.acquire.await_count == 1
+
+    async def test_expired_tool_list_is_refreshed(self):
+        pool = _pool(_session())
+        await connect_to_tool(namespace="team1", name="weather", pool=pool)
+        expires_at, cached = tools_router._tools_cache[("team1", "weather")]
+        tools_router._tools_cache[("team1", "weather")] = (expires_at - 3600, cached)
+
+        await connect_to_tool(namespace="team1", name="weather", pool=pool)
+
+        assert pool.acquire.await_count == 2
+
+    async def test_connection_error_discards_session(self):
+        pool = _pool(_session(error=ConnectionError("refused")))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await connect_to_tool(namespace="team1", name="weather", pool=pool)
+
+        assert exc_info.value.status_code == 503
+        assert _discarded(pool) == _acquired(pool)
+
+
+class TestInvokeTool:
+    """Tests for invoke_tool."""
+
+    async def test_invokes_tool_on_pooled_session(self):
+        session = _session()
+        pool = _pool(session)
+
+        result = await invoke_tool(
+            namespace="team1",
+            name="weather",
+            request=MCPInvokeRequest(tool_name="forecast", arguments={"city": "Paris"}),
+            pool=pool,
+        )
+
+        session.call_tool.assert_awaited_once_with("forecast", {"city": "Paris"})
+        pool.release.assert_called_once_with(_acquired(pool)[0], session)
+        assert result.result == {"content": [{"type": "text", "text": "sunny"}], "isError": False}
+
+    @pytest.mark.parametrize(
+        ("error_data", "discarded"),
+        [
+            (ErrorData(code=-32602, message="unknown tool"), False),
+            (ErrorData(code=32600, message="Session terminated"), True),
+            (ErrorData(code=-32000, message="Connection closed"), True),
+        ],
+    )
+    async def test_mcp_error_discards_only_ended_sessions(self, error_data, discarded):
+        pool = _pool(_session(error=McpError(error_data)))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await invoke_tool(
+                namespace="team1",
+                name="weather",
+                request=MCPInvokeRequest(tool_name="missing"),
+                pool=pool,
+            )
+
+        assert exc_info.value.status_code == 500
+        assert pool.discard.await_count == int(discarded)
+        pool.release.assert_called_once()
+
+    async def test_transport_error_discards_session(self):
+        pool = _pool(_session(error=RuntimeError("stream closed")))
+
+        with pytest.raises(HTTPException):
+            await invoke_tool(
+                namespace="team1",
+                name="weather",
+                request=MCPInvokeRequest(tool_name="forecast"),
+                pool=pool,
+            )
+
+        assert _discarded(pool) == _acquired(pool)
+
+
+def _slow_session():
+    """Create a mock session whose calls overlap, failing for tool names starting with "bad".
+
+    The highest number of calls in flight at once is kept in session.max_in_flight.
+    """
+    session = MagicMock(max_in_flight=0)
+    in_flight = [0]
+
+    async def call_tool(tool_name, arguments):
+        in_flight[0] += 1
+        session.max_in_flight = max(session.max_in_flight, in_flight[0])
+        try:
+            await asyncio.sleep(0.01)
+            if tool_name.startswith("bad"):
+                raise McpError(ErrorData(code=-32602, message=f"{tool_name} failed"))
+            return SimpleNamespace(content=[TextContent(type="text", text=tool_name)])
+        finally:
+            in_flight[0] -= 1
+
+    session.call_tool = AsyncMock(side_effect=call_tool)
+    return session
+
+
+class TestBatchInvokeTools:
+    """Tests for batch_invoke_tools."""
+
+    async def test_runs_invocations_concurrently_in_order(self):
+        session = _slow_session()
+        request = MCPBatchInvokeRequest(
+            invocations=[MCPInvokeRequest(tool_name=f"tool{i}") for i in range(5)],
+            max_concurrent=2,
+        )
+
+        pool = _pool(session)
+        response = await batch_invoke_tools(
+            namespace="team1", name="weather", request=request, pool=pool
+        )
+
+        pool.release.assert_called_once_with(_acquired(pool)[0], session)
+        assert [r.index for r in response.results] == [0, 1, 2, 3, 4]
+        assert all(r.success for r in response.results)
+        assert response.results[3].result == {"content": [{"type": "text", "text": "tool3"}]}
+        assert session.max_in_flight == 2
+
+    async def test_failures_are_reported_per_invocation(self):
+        pool = _pool(_slow_session())
+        request = MCPBatchInvokeRequest(
+            invocations=[MCPInvokeRequest(tool_name=n) for n in ("ok", "bad", "ok2")]
+        )
+
+        response = await batch_invoke_tools(
+            namespace="team1", name="weather", request=request, pool=pool
+        )
+
+        assert [r.success for r in response.results] == [True, False, True]
+        assert "bad failed" in response.results[1].error
+        pool.discard.assert_not_awaited()
+
+    async def test_terminated_session_is_discarded(self):
+        session = _session(error=McpError(ErrorData(code=32600, message="Session terminated")))
+        pool = _pool(session)
+        request = MCPBatchInvokeRequest(invocations=[MCPInvokeRequest(tool_name="forecast")])
+
+        response = await batch_invoke_tools(
+            namespace="team1", name="weather", request=request, pool=pool
+        )
+
+        assert [r.success for r in response.results] == [False]
+        pool.discard.assert_awaited_once()
+
+    async def test_stop_on_error_skips_remaining(self):
+        session = _slow_session()
+        request = MCPBatchInvokeRequest(
+            invocations=[MCPInvokeRequest(tool_name=n) for n in ("bad", "later", "last")],
+            max_concurrent=1,
+            stop_on_error=True,
+        )
+
+        response = await batch_invoke_tools(
+            namespace="team1", name="weather", request=request, pool=_pool(session)
+        )
+
+        assert [c.args[0] for c in session.call_tool.await_args_list] == ["bad"]
+        assert [r.success for r in response.results] == [False, False, False]
+        assert "Skipped" in response.results[2].error
+
+    async def test_rejects_non_positive_concurrency(self):
+        request = MCPBatchInvokeRequest(invocations=[], max_concurrent=0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await batch_invoke_tools(
+                namespace="team1", name="weather", request=request, pool=_pool(None)
+            )
+
+        assert exc_info.value.status_code == 400
+
+
+class TestGetToolUrl:
+    """Tests for _get_tool_url."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_url_cache(self):
+        _get_tool_url.cache_clear()
+        yield
+        _get_tool_url.cache_clear()
+
+    def test_in_cluster_url(self):
+        with patch.dict("os.environ", {"KUBERNETES_SERVICE_HOST": "10.0.0.1"}):
+            url = _get_tool_url("weather", "team1")
+
+        assert url == "http://weather-mcp.team1.svc.cluster.local:8000"
+
+    def test_off_cluster_url(self):
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch("app.routers.tools.settings.domain_name", "example.test"),
+        ):
+            url = _get_tool_url("weather", "team1")
+
+        assert url == "http://weather.example.test:8080"
+
+
+class TestSerializeToolResult:
+    """Tests for _serialize_tool_result."""
+
+    def test_serializes_each_content_type(self):
+        resource = EmbeddedResource(
+            type="resource",
+            resource=TextResourceContents(uri="file:///notes.txt", text="notes"),
+        )
+        result = SimpleNamespace(
+            content=[
+                TextContent(type="text", text="hi"),
+                ImageContent(type="image", data="aW1n", mimeType="image/png"),
+                AudioContent(type="audio", data="YXVk", mimeType="audio/wav"),
+                SimpleNamespace(text="duck-typed"),
+                resource,
+            ],
+            isError=False,
+        )
+
+        assert _serialize_tool_result(result) == {
+            "content": [
+                {"type": "text", "text": "hi"},
+                {"type": "data", "data": "aW1n"},
+                {"type": "data", "data": "YXVk"},
+                {"type": "text", "text": "duck-typed"},
+                {"type": "unknown", "value": str(resource)},
+            ],
+            "isError": False,
+        }
+
+    def test_empty_result(self):
+        assert _serialize_tool_result(None) == {}
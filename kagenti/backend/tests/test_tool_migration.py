@@ -0,0 +1,340 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for migrating MCPServer CRDs to tool Deployments.
+
+Tests cover:
+- Deployment manifests built from MCPServer CRDs
+- Migrating a single tool, skipping tools that already have a workload
+- Concurrent batch migration with bounded concurrency
+- Checking for existing workloads with list calls in batch runs and listings
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from kubernetes.client import ApiException
+
+from app.core.constants import (
+    APP_KUBERNETES_IO_MANAGED_BY,
+    APP_KUBERNETES_IO_NAME,
+    KAGENTI_FRAMEWORK_LABEL,
+    KAGENTI_INJECT_LABEL,
+    KAGENTI_TYPE_LABEL,
+    KAGENTI_WORKLOAD_TYPE_LABEL,
+    MIGRATION_TIMESTAMP_ANNOTATION,
+    ORIGINAL_SERVICE_ANNOTATION,
+)
+from app.routers import tools as tools_router
+from app.routers.tools import (
+    BatchMigrateToolsRequest,
+    MigrateToolRequest,
+    _build_deployment_from_mcpserver,
+    batch_migrate_tools,
+    list_migratable_tools,
+    migrate_tool,
+)
+
+
+def _mcpserver(name="weather", labels=None, pod_spec=None):
+    return {
+        "metadata": {"name": name, "labels": labels or {}},
+        "spec": {
+            "image": "registry.example.com/weather:v1",
+            "targetPort": 9000,
+            "podTemplateSpec": {"spec": pod_spec or {}},
+        },
+    }
+
+
+class TestBuildDeploymentFromMCPServer:
+    """Tests for _build_deployment_from_mcpserver."""
+
+    def test_required_labels_override_crd_labels(self):
+        mcpserver = _mcpserver(
+            labels={
+                KAGENTI_TYPE_LABEL: "agent",
+                APP_KUBERNETES_IO_NAME: "other",
+                "team": "weather",
+            }
+        )
+
+        labels = _build_deployment_from_mcpserver(mcpserver, "team1")["metadata"]["labels"]
+
+        assert labels[KAGENTI_TYPE_LABEL] == "tool"
+        assert labels[APP_KUBERNETES_IO_NAME] == "weather"
+        assert labels[KAGENTI_WORKLOAD_TYPE_LABEL] == "deployment"
+        assert labels[APP_KUBERNETES_IO_MANAGED_BY] == "kagenti-ui"
+        assert labels["team"] == "weather"
+
+    def test_framework_label_defaults_but_is_preserved(self):
+        default = _build_deployment_from_mcpserver(_mcpserver(), "team1")
+        custom = _build_deployment_from_mcpserver(
+            _mcpserver(labels={KAGENTI_FRAMEWORK_LABEL: "Go"}), "team1"
+        )
+
+        assert default["metadata"]["labels"][KAGENTI_FRAMEWORK_LABEL] == "Python"
+        assert custom["metadata"]["labels"][KAGENTI_FRAMEWORK_LABEL] == "Go"
+        assert custom["spec"]["template"]["metadata"]["labels"][KAGENTI_FRAMEWORK_LABEL] == "Go"
+
+    def test_pod_labels_extend_selector(self):
+        manifest = _build_deployment_from_mcpserver(
+            _mcpserver(labels={KAGENTI_INJECT_LABEL: "enabled", "team": "weather"}), "team1"
+        )
+
+        selector = manifest["spec"]["selector"]["matchLabels"]
+        pod_labels = manifest["spec"]["template"]["metadata"]["labels"]
+        assert selector == {KAGENTI_TYPE_LABEL: "tool", APP_KUBERNETES_IO_NAME: "weather"}
+        assert pod_labels == {
+            **selector,
+            "protocol.kagenti.io/mcp": "",
+            "kagenti.io/transport": "streamable_http",
+            KAGENTI_FRAMEWORK_LABEL: "Python",
+            KAGENTI_INJECT_LABEL: "enabled",
+        }
+
+    def test_crd_labels_are_not_mutated(self):
+        crd_labels = {"team": "weather"}
+
+        _build_deployment_from_mcpserver(_mcpserver(labels=crd_labels), "team1")
+
+        assert crd_labels == {"team": "weather"}
+
+    def test_default_container(self):
+        manifest = _build_deployment_from_mcpserver(_mcpserver(), "team1")
+
+        container = manifest["spec"]["template"]["spec"]["containers"][0]
+        assert container["image"] == "registry.example.com/weather:v1"
+        assert container["ports"] == [{"name": "http", "containerPort": 9000, "protocol": "TCP"}]
+        assert manifest["metadata"]["annotations"][ORIGINAL_SERVICE_ANNOTATION] == (
+            "mcp-weather-proxy"
+        )
+
+    def test_pod_template_container_keeps_its_settings(self):
+        pod_spec = {
+            "containers": [
+                {"name": "server", "image": "old", "imagePullPolicy": "IfNotPresent"},
+            ]
+        }
+
+        manifest = _build_deployment_from_mcpserver(_mcpserver(pod_spec=pod_spec), "team1")
+
+        container = manifest["spec"]["template"]["spec"]["containers"][0]
+        assert container["name"] == "server"
+        assert container["image"] == "registry.example.com/weather:v1"
+        assert container["imagePullPolicy"] == "IfNotPresent"
+        assert container["resources"]["limits"]
+        assert [m["name"] for m in container["volumeMounts"]] == ["cache", "tmp"]
+        # The CRD's own container is copied, not modified
+        assert pod_spec["containers"][0]["image"] == "old"
+        assert "resources" not in pod_spec["containers"][0]
+
+    def test_missing_image_raises(self):
+        mcpserver = _mcpserver()
+        del mcpserver["spec"]["image"]
+
+        with pytest.raises(ValueError):
+            _build_deployment_from_mcpserver(mcpserver, "team1")
+
+
+def _api_404():
+    return ApiException(status=404, reason="Not Found")
+
+
+def _migration_kube(names, existing=(), invalid=()):
+    """Create a mock KubernetesService holding MCPServer CRDs.
+
+    The CRDs are kept in kube.crds. Deployments named in existing already exist, and
+    creating one named in invalid fails with 422. Creates take a moment so that
+    concurrent migrations overlap; the highest number of creates in flight at once is
+    kept in kube.max_in_flight.
+    """
+    crds = {name: _mcpserver(name) for name in names}
+    lock = threading.Lock()
+    in_flight = [0]
+
+    def create_deployment(namespace, body):
+        if body["metadata"]["name"] in invalid:
+            raise ApiException(status=422, reason="Invalid")
+        with lock:
+            in_flight[0] += 1
+            kube.max_in_flight = max(kube.max_in_flight, in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+
+    def get_deployment(namespace, name):
+        if name in existing:
+            return {"metadata": {"name": name}}
+        raise _api_404()
+
+    kube = MagicMock()
+    kube.crds = crds
+    kube.max_in_flight = 0
+    kube.list_custom_resources.side_effect = lambda **kwargs: list(crds.values())
+    kube.get_custom_resource.side_effect = lambda name, **kwargs: crds[name]
+    kube.list_deployments.return_value = [{"metadata": {"name": n}} for n in sorted(existing)]
+    kube.list_statefulsets.return_value = []
+    kube.get_deployment.side_effect = get_deployment
+    kube.get_statefulset.side_effect = _api_404()
+    kube.create_deployment.side_effect = create_deployment
+    kube.get_service.side_effect = _api_404()
+    return kube
+
+
+def _created(kube):
+    """Deployment manifests created on the mock, in call order."""
+    return [c.args[1] for c in kube.create_deployment.call_args_list]
+
+
+def _created_names(kube):
+    return [body["metadata"]["name"] for body in _created(kube)]
+
+
+class TestMigrateTool:
+    """Tests for migrate_tool."""
+
+    async def test_skips_tool_with_existing_deployment(self):
+        kube = _migration_kube(["done"], existing={"done"})
+
+        response = await migrate_tool(
+            namespace="team1", name="done", request=MigrateToolRequest(), kube=kube
+        )
+
+        assert response.message == "Tool 'done' already has a Deployment. Migration skipped."
+        kube.get_deployment.assert_called_once_with(namespace="team1", name="done")
+        kube.create_deployment.assert_not_called()
+
+    async def test_migrates_tool(self):
+        kube = _migration_kube(["new"])
+
+        response = await migrate_tool(
+            namespace="team1", name="new", request=MigrateToolRequest(), kube=kube
+        )
+
+        assert response.deployment_created
+        assert response.service_created
+        assert _created_names(kube) == ["new"]
+
+
+class TestBatchMigrateTools:
+    """Tests for batch_migrate_tools."""
+
+    async def test_migrates_tools_concurrently_in_order(self):
+        names = [f"tool{i}" for i in range(5)]
+        kube = _migration_kube(names)
+
+        response = await batch_migrate_tools(
+            namespace="team1", request=BatchMigrateToolsRequest(dry_run=False), kube=kube
+        )
+
+        assert [r.name for r in response.results] == names
+        assert response.migrated == 5
+        assert sorted(_created_names(kube)) == names
+        assert kube.max_in_flight > 1
+
+    async def test_tools_share_one_migration_timestamp(self):
+        kube = _migration_kube([f"tool{i}" for i in range(3)])
+
+        await batch_migrate_tools(
+            namespace="team1", request=BatchMigrateToolsRequest(dry_run=False), kube=kube
+        )
+
+        annotations = [body["metadata"]["annotations"] for body in _created(kube)]
+        timestamps = {a[MIGRATION_TIMESTAMP_ANNOTATION] for a in annotations}
+        assert len(annotations) == 3
+        assert len(timestamps) == 1
+
+    async def test_concurrency_is_bounded(self):
+        kube = _migration_kube([f"tool{i}" for i in range(5)])
+
+        with patch.object(tools_router, "_MIGRATION_CONCURRENCY", 2):
+            await batch_migrate_tools(
+                namespace="team1", request=BatchMigrateToolsRequest(dry_run=False), kube=kube
+            )
+
+        assert kube.max_in_flight == 2
+
+    async def test_counts_skipped_and_failed_tools(self):
+        kube = _migration_kube(["new", "done", "broken"], existing={"done"}, invalid={"broken"})
+
+        response = await batch_migrate_tools(
+            namespace="team1", request=BatchMigrateToolsRequest(dry_run=False), kube=kube
+        )
+
+        assert (response.migrated, response.skipped, response.failed) == (1, 1, 1)
+        assert [r.success for r in response.results] == [True, True, False]
+        assert "Invalid" in response.results[2].message
+        # Existing workloads come from the list calls, not per-tool gets
+        kube.get_deployment.assert_not_called()
+
+    @pytest.mark.parametrize("dry_run", [True, False])
+    async def test_checks_all_workloads_not_only_labelled_tools(self, dry_run):
+        kube = _migration_kube(["new"])
+
+        await batch_migrate_tools(
+            namespace="team1", request=BatchMigrateToolsRequest(dry_run=dry_run), kube=kube
+        )
+
+        kube.list_deployments.assert_called_once_with(namespace="team1")
+        kube.list_statefulsets.assert_called_once_with(namespace="team1")
+
+    @pytest.mark.parametrize("dry_run", [True, False])
+    async def test_failed_workload_list_fails_the_batch(self, dry_run):
+        kube = _migration_kube(["new", "done"], existing={"done"})
+        kube.list_statefulsets.side_effect = ApiException(status=403, reason="Forbidden")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await batch_migrate_tools(
+                namespace="team1", request=BatchMigrateToolsRequest(dry_run=dry_run), kube=kube
+            )
+
+        assert exc_info.value.status_code == 403
+        kube.create_deployment.assert_not_called()
+
+    async def test_dry_run_checks_workloads_with_list_calls(self):
+        kube = _migration_kube(["new", "done"], existing={"done"})
+
+        response = await batch_migrate_tools(
+            namespace="team1", request=BatchMigrateToolsRequest(dry_run=True), kube=kube
+        )
+
+        assert [r.message for r in response.results] == [
+            "Would be migrated",
+            "Would be skipped (Deployment/StatefulSet already exists)",
+        ]
+        assert (response.migrated, response.skipped) == (1, 1)
+        kube.get_deployment.assert_not_called()
+        kube.create_deployment.assert_not_called()
+
+
+class TestListMigratableTools:
+    """Tests for list_migratable_tools."""
+
+    async def test_marks_tools_with_existing_workloads(self):
+        kube = _migration_kube(["new", "done"], existing={"done"})
+
+        kube.list_statefulsets.side_effect = ApiException(status=403, reason="Forbidden")
+
+        response = await list_migratable_tools(namespace="team1", kube=kube)
+
+        assert [(t.name, t.has_deployment) for t in response.tools] == [
+            ("new", False),
+            ("done", True),
+        ]
+        # The failed StatefulSet list is tolerated
+        assert not any(t.has_statefulset for t in response.tools)
+        assert response.already_migrated == 1
+
+    async def test_tolerates_null_metadata_fields(self):
+        kube = _migration_kube(["weather"])
+        kube.crds["weather"]["metadata"].update(labels=None, annotations=None)
+
+        response = await list_migratable_tools(namespace="team1", kube=kube)
+
+        tool = response.tools[0]
+        assert (tool.name, tool.labels, tool.description) == ("weather", {}, "")
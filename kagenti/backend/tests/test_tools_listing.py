@@ -0,0 +1,743 @@
+# Copyright 2025 IBM Corp.
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the tool listing, lookup, creation and deletion endpoints.
+
+Tests cover:
+- Concurrent Deployment/StatefulSet/MCPServer listing
+- Tolerating API errors from individual list calls
+- Skipping legacy MCPServer CRDs that were already migrated
+- Concurrent Deployment/StatefulSet/Service lookup for a single tool
+- Concurrent creation of image-based tool resources with rollback
+- Concurrent deletion of tool resources
+- Tool workload manifest builders
+"""
+
+import copy
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from kubernetes.client import ApiException
+
+from app.core.constants import (
+    APP_KUBERNETES_IO_MANAGED_BY,
+    KAGENTI_DESCRIPTION_ANNOTATION,
+    KAGENTI_WORKLOAD_TYPE_LABEL,
+    WORKLOAD_TYPE_DEPLOYMENT,
+    WORKLOAD_TYPE_STATEFULSET,
+)
+from app.routers.tools import (
+    CreateToolRequest,
+    FinalizeToolBuildRequest,
+    _build_tool_deployment_manifest,
+    _build_tool_statefulset_manifest,
+    _extract_labels,
+    _format_timestamp,
+    _get_tool_config,
+    _get_workload_status,
+    _list_tool_resources,
+    create_tool,
+    delete_tool,
+    finalize_tool_shipwright_build,
+    get_tool,
+    get_tool_shipwright_build_info,
+    list_tools,
+)
+
+
+def _workload(name: str, ready: bool = True) -> dict:
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": "team1",
+            "labels": {"kagenti.io/framework": "Python"},
+            "annotations": {KAGENTI_DESCRIPTION_ANNOTATION: f"{name} tool"},
+            "creationTimestamp": "2025-01-01T00:00:00Z",
+        },
+        "spec": {"replicas": 1},
+        "status": {"readyReplicas": 1 if ready else 0, "replicas": 1},
+    }
+
+
+def _api_404():
+    return ApiException(status=404, reason="Not Found")
+
+
+def _list_kube(deployments=(), statefulsets=(), mcpservers=()):
+    """Create a mock KubernetesService whose list calls return the given resources."""
+    kube = MagicMock()
+    kube.list_deployments.return_value = list(deployments)
+    kube.list_statefulsets.return_value = list(statefulsets)
+    kube.list_custom_resources.return_value = list(mcpservers)
+    return kube
+
+
+class TestListToolResources:
+    """Tests for the thread-offloaded list helper."""
+
+    async def test_returns_items(self):
+        assert await _list_tool_resources("Deployments", lambda: [{"a": 1}]) == [{"a": 1}]
+
+    async def test_api_error_returns_empty_list(self):
+        def fail():
+            raise ApiException(status=500)
+
+        assert await _list_tool_resources("Deployments", fail) == []
+
+    async def test_not_found_returns_empty_list(self):
+        def fail():
+            raise ApiException(status=404)
+
+        assert await _list_tool_resources("Deployments", fail) == []
+
+
+class TestExtractLabels:
+    """Tests for the memoized label extraction."""
+
+    def test_extracts_protocols_framework_and_type(self):
+        labels = _extract_labels(
+            {
+                "protocol.kagenti.io/mcp": "",
+                "kagenti.io/framework": "Python",
+                "kagenti.io/type": "tool",
+            }
+        )
+
+        assert labels.protocol == ["mcp"]
+        assert labels.framework == "Python"
+        assert labels.type == "tool"
+
+    def test_legacy_protocol_label(self):
+        assert _extract_labels({"kagenti.io/protocol": "a2a"}).protocol == ["a2a"]
+
+    def test_identical_label_sets_share_result(self):
+        first = _extract_labels({"kagenti.io/type": "tool", "kagenti.io/framework": "Go"})
+        second = _extract_labels({"kagenti.io/framework": "Go", "kagenti.io/type": "tool"})
+        other = _extract_labels({"kagenti.io/type": "tool", "kagenti.io/framework": "Python"})
+
+        assert first is second
+        assert other is not first
+        assert other.framework == "Python"
+
+
+class TestFormatTimestamp:
+    """Tests for timestamp formatting."""
+
+    def test_datetime(self):
+        ts = datetime(2025, 1, 1, tzinfo=UTC)
+        assert _format_timestamp(ts) == "2025-01-01T00:00:00+00:00"
+
+    def test_string_passthrough(self):
+        assert _format_timestamp("2025-01-01T00:00:00Z") == "2025-01-01T00:00:00Z"
+
+    def test_none(self):
+        assert _format_timestamp(None) is None
+
+    def test_other_isoformat_objects(self):
+        assert _format_timestamp(date(2025, 1, 1)) == "2025-01-01"
+
+
+class TestGetWorkloadStatus:
+    """Tests for the condition-based workload status."""
+
+    def _workload(self, ready=0, available=0, desired=1, conditions=None):
+        return {
+            "spec": {"replicas": desired},
+            "status": {
+                "ready_replicas": ready,
+                "available_replicas": available,
+                "conditions": conditions,
+            },
+        }
+
+    def test_ready(self):
+        assert _get_workload_status(self._workload(ready=1, available=1)) == "Ready"
+
+    def test_camel_case_replica_counts(self):
+        workload = {"spec": {"replicas": 1}, "status": {"readyReplicas": 1, "availableReplicas": 1}}
+        assert _get_workload_status(workload) == "Ready"
+
+    def test_progress_deadline_exceeded_is_failed(self):
+        conditions = [
+            {"type": "Progressing", "status": "True", "reason": "ReplicaSetUpdated"},
+            {"type": "Available", "status": "False", "reason": "ProgressDeadlineExceeded"},
+        ]
+        assert _get_workload_status(self._workload(conditions=conditions)) == "Failed"
+
+    def test_progressing_condition(self):
+        conditions = [{"type": "Progressing", "status": "True", "reason": "NewReplicaSetCreated"}]
+        assert _get_workload_status(self._workload(conditions=conditions)) == "Progressing"
+
+    def test_no_conditions_not_ready(self):
+        assert _get_workload_status(self._workload()) == "Not Ready"
+
+
+class TestListTools:
+    """Tests for list_tools."""
+
+    async def test_lists_deployments_and_statefulsets(self):
+        kube = _list_kube(
+            deployments=[_workload("weather")],
+            statefulsets=[_workload("notes")],
+        )
+        with patch("app.routers.tools.settings.enable_legacy_mcpserver_crd", False):
+            result = await list_tools(namespace="team1", kube=kube)
+
+        by_name = {t.name: t for t in result.items}
+        assert by_name["weather"].workloadType == WORKLOAD_TYPE_DEPLOYMENT
+        assert by_name["notes"].workloadType == WORKLOAD_TYPE_STATEFULSET
+        assert by_name["weather"].description == "weather tool"
+        assert by_name["weather"].createdAt == "2025-01-01T00:00:00Z"
+        assert by_name["weather"].labels.framework == "Python"
+
+    async def test_client_objects_with_null_metadata_fields(self):
+        workload = _workload("weather")
+        workload["metadata"].update(
+            annotations=None, labels=None, namespace=None, creationTimestamp=None
+        )
+        workload["metadata"]["creation_timestamp"] = datetime(2025, 1, 1, tzinfo=UTC)
+        kube = _list_kube(deployments=[workload])
+        with patch("app.routers.tools.settings.enable_legacy_mcpserver_crd", False):
+            result = await list_tools(namespace="team1", kube=kube)
+
+        tool = result.items[0]
+        assert tool.namespace == "team1"
+        assert tool.description == ""
+        assert tool.labels.protocol is None
+        assert tool.createdAt == "2025-01-01T00:00:00+00:00"
+
+    async def test_failed_list_does_not_hide_other_workloads(self):
+        kube = _list_kube(statefulsets=[_workload("notes")])
+        kube.list_deployments.side_effect = ApiException(status=500)
+        with patch("app.routers.tools.settings.enable_legacy_mcpserver_crd", False):
+            result = await list_tools(namespace="team1", kube=kube)
+
+        assert [t.name for t in result.items] == ["notes"]
+
+    async def test_legacy_mcpservers_skip_migrated_tools(self):
+        kube = _list_kube(
+            deployments=[_workload("weather")],
+            mcpservers=[_workload("weather"), _workload("legacy")],
+        )
+        with patch("app.routers.tools.settings.enable_legacy_mcpserver_crd", True):
+            result = await list_tools(namespace="team1", kube=kube)
+
+        names = sorted(t.name for t in result.items)
+        assert names == ["legacy", "weather"]
+        legacy = next(t for t in result.items if t.name == "legacy")
+        assert legacy.workloadType == "mcpserver"
+
+    async def test_legacy_mcpservers_not_listed_when_disabled(self):
+        kube = _list_kube(mcpservers=[_workload("legacy")])
+        with patch("app.routers.tools.settings.enable_legacy_mcpserver_crd", False):
+            result = await list_tools(namespace="team1", kube=kube)
+
+        assert result.items == []
+
+    async def test_lists_are_served_from_watch_cache(self):
+        kube = _list_kube()
+        with patch("app.routers.tools.settings.enable_legacy_mcpserver_crd", True):
+            await list_tools(namespace="team1", kube=kube)
+
+        for list_fn in (
+            kube.list_deployments,
+            kube.list_statefulsets,
+            kube.list_custom_resources,
+        ):
+            assert list_fn.call_args.kwargs["resource_version"] == "0"
+
+
+def _get_kube(deployment=None, statefulset=None, service=None):
+    """Create a mock KubernetesService; resources that are not given are not found."""
+    kube = MagicMock()
+    for get_fn, resource in (
+        (kube.get_deployment, deployment),
+        (kube.get_statefulset, statefulset),
+        (kube.get_service, service),
+    ):
+        if resource is None:
+            get_fn.side_effect = _api_404()
+        else:
+            get_fn.return_value = resource
+    return kube
+
+
+_SERVICE = {
+    "metadata": {"name": "weather-mcp"},
+    "spec": {"type": "ClusterIP", "cluster_ip": "10.0.0.1", "ports": [{"port": 8000}]},
+}
+
+
+class TestGetTool:
+    """Tests for get_tool."""
+
+    async def test_prefers_deployment(self):
+        kube = _get_kube(
+            deployment=_workload("weather"), statefulset=_workload("weather"), service=_SERVICE
+        )
+
+        result = await get_tool(namespace="team1", name="weather", kube=kube)
+
+        assert result["workloadType"] == WORKLOAD_TYPE_DEPLOYMENT
+        assert result["service"] == {
+            "name": "weather-mcp",
+            "type": "ClusterIP",
+            "clusterIP": "10.0.0.1",
+            "ports": [{"port": 8000}],
+        }
+
+    async def test_falls_back_to_statefulset(self):
+        kube = _get_kube(statefulset=_workload("weather"))
+
+        result = await get_tool(namespace="team1", name="weather", kube=kube)
+
+        assert result["workloadType"] == WORKLOAD_TYPE_STATEFULSET
+        assert result["service"] is None
+
+    async def test_not_found(self):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_tool(namespace="team1", name="weather", kube=_get_kube())
+
+        assert exc_info.value.status_code == 404
+
+    async def test_deployment_error_is_raised(self):
+        kube = _get_kube(statefulset=_workload("weather"))
+        kube.get_deployment.side_effect = ApiException(status=403, reason="Forbidden")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_tool(namespace="team1", name="weather", kube=kube)
+
+        assert exc_info.value.status_code == 403
+
+    async def test_service_error_is_tolerated(self):
+        kube = _get_kube(deployment=_workload("weather"))
+        kube.get_service.side_effect = ApiException(status=500)
+
+        result = await get_tool(namespace="team1", name="weather", kube=kube)
+
+        assert result["service"] is None
+
+
+def _delete_kube(buildruns=(), missing=(), failing=()):
+    """Create a mock KubernetesService; resources in missing/failing raise 404/500.
+
+    Returns the mock and the list of resources it deleted, in call order.
+    """
+    deleted = []
+
+    def delete(resource):
+        if resource in missing:
+            raise _api_404()
+        if resource in failing:
+            raise ApiException(status=500)
+        deleted.append(resource)
+
+    kube = MagicMock()
+    kube.list_custom_resources.return_value = [{"metadata": {"name": br}} for br in buildruns]
+    kube.delete_custom_resource.side_effect = lambda plural, name, **kwargs: delete(
+        f"{'BuildRun' if plural == 'buildruns' else 'Build'}/{name}"
+    )
+    kube.delete_deployment.side_effect = lambda namespace, name: delete(f"Deployment/{name}")
+    kube.delete_statefulset.side_effect = lambda namespace, name: delete(f"StatefulSet/{name}")
+    kube.delete_service.side_effect = lambda namespace, name: delete(f"Service/{name}")
+    return kube, deleted
+
+
+class TestDeleteTool:
+    """Tests for delete_tool."""
+
+    async def test_deletes_buildruns_before_build(self):
+        kube, deleted = _delete_kube(buildruns=["weather-run-1", "weather-run-2"])
+
+        result = await delete_tool(namespace="team1", name="weather", kube=kube)
+
+        build_index = deleted.index("Build/weather")
+        assert deleted.index("BuildRun/weather-run-1") < build_index
+        assert deleted.index("BuildRun/weather-run-2") < build_index
+        assert result.success
+        assert result.message == (
+            "Tool 'weather' deleted. Resources: Build/weather, BuildRun/weather-run-1, "
+            "BuildRun/weather-run-2, Deployment/weather, Service/weather-mcp, "
+            "StatefulSet/weather"
+        )
+
+    async def test_missing_and_failing_resources_are_skipped(self):
+        kube, _ = _delete_kube(
+            missing={"Build/weather", "StatefulSet/weather"},
+            failing={"Service/weather-mcp"},
+        )
+
+        result = await delete_tool(namespace="team1", name="weather", kube=kube)
+
+        assert result.message == "Tool 'weather' deleted. Resources: Deployment/weather"
+
+    async def test_already_deleted(self):
+        kube, _ = _delete_kube(
+            missing={
+                "Build/weather",
+                "Deployment/weather",
+                "StatefulSet/weather",
+                "Service/weather-mcp",
+            }
+        )
+
+        result = await delete_tool(namespace="team1", name="weather", kube=kube)
+
+        assert result.message == "Tool 'weather' already deleted"
+
+
+class TestToolWorkloadManifests:
+    """Tests for the Deployment/StatefulSet manifest builders."""
+
+    def test_workload_labels_extend_pod_labels(self):
+        manifest = _build_tool_deployment_manifest("weather", "team1", "img:v1")
+
+        labels = manifest["metadata"]["labels"]
+        pod_labels = manifest["spec"]["template"]["metadata"]["labels"]
+        assert labels == {
+            **pod_labels,
+            KAGENTI_WORKLOAD_TYPE_LABEL: WORKLOAD_TYPE_DEPLOYMENT,
+            APP_KUBERNETES_IO_MANAGED_BY: "kagenti-ui",
+        }
+        assert KAGENTI_WORKLOAD_TYPE_LABEL not in pod_labels
+
+    def test_statefulset_mounts_data_volume(self):
+        manifest = _build_tool_statefulset_manifest("notes", "team1", "img:v1")
+
+        container = manifest["spec"]["template"]["spec"]["containers"][0]
+        assert [m["name"] for m in container["volumeMounts"]] == ["data", "cache", "tmp"]
+        assert [v["name"] for v in manifest["spec"]["template"]["spec"]["volumes"]] == [
+            "cache",
+            "tmp",
+        ]
+
+    def test_manifests_do_not_share_mutable_lists(self):
+        first = _build_tool_deployment_manifest("a", "team1", "img:v1")
+        second = _build_tool_deployment_manifest("b", "team1", "img:v1")
+
+        first["spec"]["template"]["spec"]["volumes"].append({"name": "extra"})
+        first["spec"]["template"]["spec"]["containers"][0]["volumeMounts"].append({"name": "extra"})
+
+        assert len(second["spec"]["template"]["spec"]["volumes"]) == 2
+        assert len(second["spec"]["template"]["spec"]["containers"][0]["volumeMounts"]) == 2
+
+    def test_spire_label_on_workload_and_pod(self):
+        manifest = _build_tool_statefulset_manifest("notes", "team1", "img:v1", spire_enabled=True)
+
+        assert manifest["metadata"]["labels"]["kagenti.io/spire"] == "enabled"
+        assert manifest["spec"]["template"]["metadata"]["labels"]["kagenti.io/spire"] == "enabled"
+
+    def test_annotations_only_when_set(self):
+        plain = _build_tool_deployment_manifest("a", "team1", "img:v1")
+        annotated = _build_tool_deployment_manifest(
+            "a", "team1", "img:v1", description="Weather", shipwright_build_name="a"
+        )
+
+        assert "annotations" not in plain["metadata"]
+        assert annotated["metadata"]["annotations"] == {
+            KAGENTI_DESCRIPTION_ANNOTATION: "Weather",
+            "kagenti.io/shipwright-build": "a",
+        }
+
+    def test_deployment_and_statefulset_share_pod_template(self):
+        options = {"image_pull_secret": "pull", "auth_bridge_enabled": True}
+        deployment = _build_tool_deployment_manifest("notes", "team1", "img:v1", **options)
+        statefulset = _build_tool_statefulset_manifest("notes", "team1", "img:v1", **options)
+
+        deployment_pod = deployment["spec"]["template"]
+        statefulset_pod = copy.deepcopy(statefulset["spec"]["template"])
+        statefulset_pod["spec"]["containers"][0]["volumeMounts"].pop(0)
+        assert statefulset_pod == deployment_pod
+        assert deployment_pod["spec"]["imagePullSecrets"] == [{"name": "pull"}]
+        assert statefulset["spec"]["serviceName"] == "notes-mcp"
+
+    def test_shared_templates_are_not_mutated(self):
+        from app.routers import tools
+
+        templates = {
+            name: copy.deepcopy(getattr(tools, name))
+            for name in (
+                "_TOOL_POD_SECURITY_CONTEXT",
+                "_TOOL_CONTAINER_SECURITY_CONTEXT",
+                "_TOOL_CONTAINER_RESOURCES",
+                "_TOOL_VOLUMES",
+                "_TOOL_VOLUME_MOUNTS",
+            )
+        }
+
+        _build_tool_deployment_manifest(
+            "a", "team1", "img:v1", image_pull_secret="pull", spire_enabled=True
+        )
+        _build_tool_statefulset_manifest("b", "team1", "img:v1", storage_size="5Gi")
+
+        for name, snapshot in templates.items():
+            assert getattr(tools, name) == snapshot, name
+
+
+def _finalize_kube():
+    """Create a mock KubernetesService serving a Build and a single BuildRun."""
+    kube = MagicMock()
+    kube.get_custom_resource.return_value = {
+        "metadata": {"name": "weather", "annotations": {}},
+        "spec": {},
+    }
+    kube.list_custom_resources.return_value = [{"metadata": {"name": "weather-run"}}]
+    return kube
+
+
+def _image_request(**overrides):
+    fields = {
+        "name": "weather",
+        "namespace": "team1",
+        "deploymentMethod": "image",
+        "containerImage": "quay.io/example/weather:v1",
+    }
+    fields.update(overrides)
+    return CreateToolRequest(**fields)
+
+
+class TestCreateToolFromImage:
+    """Tests for create_tool's image deployment path."""
+
+    async def test_creates_workload_service_and_route(self):
+        kube = MagicMock()
+        with patch("app.routers.tools.create_route_for_agent_or_tool") as create_route:
+            result = await create_tool(request=_image_request(createHttpRoute=True), kube=kube)
+
+        assert kube.create_deployment.call_args.args[1]["metadata"]["name"] == "weather"
+        assert kube.create_service.call_args.args[1]["metadata"]["name"] == "weather-mcp"
+        create_route.assert_called_once()
+        assert create_route.call_args.kwargs["service_name"] == "weather-mcp"
+        assert result.success
+        assert "HTTPRoute/Route created" in result.message
+
+    async def test_statefulset_workload(self):
+        kube = MagicMock()
+        await create_tool(request=_image_request(workloadType="statefulset"), kube=kube)
+
+        kube.create_statefulset.assert_called_once()
+        kube.create_deployment.assert_not_called()
+
+    async def test_failure_rolls_back_created_resources(self):
+        kube = MagicMock()
+        kube.create_service.side_effect = ApiException(status=500, reason="boom")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_tool(request=_image_request(), kube=kube)
+
+        assert exc_info.value.status_code == 500
+        kube.delete_deployment.assert_called_once_with("team1", "weather")
+        kube.delete_service.assert_not_called()
+
+    async def test_conflict_reports_already_exists_without_rollback(self):
+        kube = MagicMock()
+        kube.create_deployment.side_effect = ApiException(status=409)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_tool(request=_image_request(), kube=kube)
+
+        assert exc_info.value.status_code == 409
+        assert "already exists" in exc_info.value.detail
+        kube.delete_service.assert_not_called()
+        kube.delete_deployment.assert_not_called()
+
+    @pytest.mark.parametrize("status", [409, 500])
+    async def test_no_route_when_workload_creation_fails(self, status):
+        kube = MagicMock()
+        kube.create_deployment.side_effect = ApiException(status=status)
+
+        with (
+            patch("app.routers.tools.create_route_for_agent_or_tool") as create_route,
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await create_tool(request=_image_request(createHttpRoute=True), kube=kube)
+
+        assert exc_info.value.status_code == status
+        create_route.assert_not_called()
+
+
+class TestFinalizeToolShipwrightBuild:
+    """Tests for finalize_tool_shipwright_build's resource creation."""
+
+    @pytest.fixture(autouse=True)
+    def _succeeded_build(self):
+        with (
+            patch("app.routers.tools.is_build_succeeded", return_value=True),
+            patch(
+                "app.routers.tools.get_output_image_from_buildrun",
+                return_value=("registry.local/weather", "sha256:abc"),
+            ),
+            patch("app.routers.tools.extract_resource_config_from_build", return_value=None),
+        ):
+            yield
+
+    async def test_creates_workload_service_and_route(self):
+        kube = _finalize_kube()
+        with patch("app.routers.tools.create_route_for_agent_or_tool") as create_route:
+            result = await finalize_tool_shipwright_build(
+                namespace="team1",
+                name="weather",
+                request=FinalizeToolBuildRequest(createHttpRoute=True),
+                kube=kube,
+            )
+
+        assert kube.create_deployment.call_args.args[1]["metadata"]["name"] == "weather"
+        assert kube.create_service.call_args.args[1]["metadata"]["name"] == "weather-mcp"
+        create_route.assert_called_once()
+        assert "HTTPRoute/Route created" in result.message
+
+    async def test_failure_rolls_back_created_resources(self):
+        kube = _finalize_kube()
+        kube.create_service.side_effect = ApiException(status=500, reason="boom")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await finalize_tool_shipwright_build(
+                namespace="team1",
+                name="weather",
+                request=FinalizeToolBuildRequest(workloadType="statefulset"),
+                kube=kube,
+            )
+
+        assert exc_info.value.status_code == 500
+        kube.delete_statefulset.assert_called_once_with("team1", "weather")
+        kube.delete_service.assert_not_called()
+
+    @pytest.mark.parametrize("status", [409, 500])
+    async def test_no_route_when_workload_creation_fails(self, status):
+        kube = _finalize_kube()
+        kube.create_deployment.side_effect = ApiException(status=status)
+
+        with (
+            patch("app.routers.tools.create_route_for_agent_or_tool") as create_route,
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await finalize_tool_shipwright_build(
+                namespace="team1",
+                name="weather",
+                request=FinalizeToolBuildRequest(createHttpRoute=True),
+                kube=kube,
+            )
+
+        assert exc_info.value.status_code == status
+        create_route.assert_not_called()
+
+    async def test_full_override_keeps_stored_only_settings(self):
+        request = FinalizeToolBuildRequest(
+            protocol="streamable_http",
+            framework="Go",
+            workloadType="statefulset",
+            envVars=[{"name": "MODE", "value": "prod"}],
+            servicePorts=[{"port": 9000, "targetPort": 9000}],
+            createHttpRoute=False,
+            authBridgeEnabled=False,
+            imagePullSecret="pull",
+        )
+        stored_config = MagicMock()
+        stored_config.model_dump.return_value = {
+            "spireEnabled": True,
+            "persistentStorage": {"enabled": True, "size": "5Gi"},
+        }
+        kube = _finalize_kube()
+
+        with patch("app.routers.tools._get_tool_config", return_value=stored_config):
+            await finalize_tool_shipwright_build(
+                namespace="team1", name="weather", request=request, kube=kube
+            )
+
+        statefulset = kube.create_statefulset.call_args.args[1]
+        assert statefulset["metadata"]["labels"]["kagenti.io/spire"] == "enabled"
+        claim = statefulset["spec"]["volumeClaimTemplates"][0]
+        assert claim["spec"]["resources"]["requests"]["storage"] == "5Gi"
+        assert statefulset["metadata"]["labels"]["kagenti.io/framework"] == "Go"
+
+    async def test_missing_build_takes_precedence_over_buildrun_error(self):
+        kube = _finalize_kube()
+        kube.get_custom_resource.side_effect = _api_404()
+        kube.list_custom_resources.side_effect = ApiException(status=500)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await finalize_tool_shipwright_build(
+                namespace="team1", name="weather", request=FinalizeToolBuildRequest(), kube=kube
+            )
+
+        assert exc_info.value.status_code == 404
+        assert "Build 'weather' not found" in exc_info.value.detail
+        kube.create_deployment.assert_not_called()
+
+
+class TestGetToolShipwrightBuildInfo:
+    """Tests for get_tool_shipwright_build_info."""
+
+    async def test_missing_and_null_build_fields(self):
+        kube = MagicMock()
+        kube.get_custom_resource.return_value = {
+            "metadata": None,
+            "spec": {"source": {"git": None}, "output": None},
+        }
+        kube.list_custom_resources.return_value = []
+
+        info = await get_tool_shipwright_build_info(namespace="team1", name="weather", kube=kube)
+
+        assert info.name == "weather"
+        assert info.namespace == "team1"
+        assert info.gitUrl == ""
+        assert info.outputImage == ""
+        assert info.buildRegistered is False
+        assert info.hasBuildRun is False
+
+    async def test_missing_build_is_reported_over_buildrun_error(self):
+        kube = _finalize_kube()
+        kube.get_custom_resource.side_effect = _api_404()
+        kube.list_custom_resources.side_effect = ApiException(status=500)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_tool_shipwright_build_info(namespace="team1", name="weather", kube=kube)
+
+        assert exc_info.value.status_code == 404
+
+    async def test_buildrun_list_error_is_tolerated(self):
+        kube = _finalize_kube()
+        kube.list_custom_resources.side_effect = ApiException(status=403)
+
+        info = await get_tool_shipwright_build_info(namespace="team1", name="weather", kube=kube)
+
+        assert info.name == "weather"
+        assert info.hasBuildRun is False
+
+
+class TestGetToolConfig:
+    """Tests for _get_tool_config's per-Build-version parsing cache."""
+
+    @staticmethod
+    def _build(raw, resource_version="1"):
+        return {
+            "metadata": {
+                "uid": "build-uid",
+                "resourceVersion": resource_version,
+                "annotations": {"kagenti.io/tool-config": raw},
+            }
+        }
+
+    def test_parses_config(self):
+        config = _get_tool_config(self._build('{"protocol": "sse", "framework": "Go"}'))
+
+        assert config.protocol == "sse"
+        assert config.framework == "Go"
+
+    def test_missing_annotation(self):
+        assert _get_tool_config({"metadata": {"annotations": None}}) is None
+        assert _get_tool_config({}) is None
+
+    def test_same_build_version_is_parsed_once(self):
+        raw = '{"framework": "Rust"}'
+        with patch(
+            "app.routers.tools.extract_resource_config_from_build", return_value=None
+        ) as parse:
+            _get_tool_config(self._build(raw, resource_version="cache-test"))
+            _get_tool_config(self._build(raw, resource_version="cache-test"))
+            _get_tool_config(self._build(raw, resource_version="cache-test-2"))
+
+        assert parse.call_count == 2